@@ -0,0 +1,371 @@
+"""
+End-to-end benchmark of the data quality pipeline.
+
+For each corpus size, synthetic issues are generated from
+data/sample-epic.json (see jira_stub.py) and every stage of the pipeline is
+timed:
+
+    generate           build the raw issues, as a JIRA search returns them
+    process            ProcessedIssue.from_raw
+    rules              RuleEngine.run_rules on every issue
+    tmf_lookup         TMF reference scanning and get_tmf_api_info / get_tmf_rules_info
+    pipeline           check_issues.main against a local jira_stub.py server
+    markdown           convert_console_output_to_markdown on the pipeline's console output
+    enhanced_markdown  create_enhanced_markdown_report on the same output
+
+Each size runs in its own process, so the peak RSS of one size is not
+inflated by the previous one. Per stage the wall time, the process peak RSS
+and the peak memory allocated by Python (tracemalloc) are recorded.
+
+Results are written as JSON, and two result files can be compared: any
+stage that got slower (or allocates more) than the threshold is reported as
+a regression and the exit code is 1.
+
+Usage:
+    python benchmark.py                                   # 100, 1k, 10k and 100k issues
+    python benchmark.py --sizes 100 1000 --output bench_new.json
+    python benchmark.py --sizes 1000 --baseline bench_old.json --threshold 0.15
+    python benchmark.py --compare bench_old.json bench_new.json
+
+Run it from the repository directory (the TMF tables are read from there).
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+DEFAULT_OUTPUT = 'benchmark_results.json'
+DEFAULT_THRESHOLD = 0.10
+
+# Stages faster than this are too noisy to flag as regressions
+MIN_COMPARED_SECONDS = 0.05
+
+# Metrics compared between runs
+COMPARED_METRICS = ('wall_seconds', 'allocated_peak_mb')
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB (None where unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def git_commit() -> Optional[str]:
+    """Commit the benchmark runs on, if this is a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class StageTimer:
+    """Runs the stages of one benchmark size and records their measurements"""
+
+    def __init__(self, trace_allocations: bool = True):
+        """
+        Args:
+            trace_allocations: Measure Python allocations with tracemalloc
+                               (slows every stage down, but evenly)
+        """
+        self.trace_allocations = trace_allocations
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    def run(self, name: str, stage: Callable[[], Any]) -> Any:
+        """
+        Run and measure one stage.
+
+        Args:
+            name: Stage name
+            stage: Callable running the stage
+
+        Returns:
+            Whatever the stage returned
+        """
+        gc.collect()
+        if self.trace_allocations:
+            tracemalloc.start()
+        print(f"[BENCH]   {name}...", file=sys.stderr)
+        start = time.perf_counter()
+        try:
+            result = stage()
+        finally:
+            wall_seconds = time.perf_counter() - start
+            measurement = {'wall_seconds': round(wall_seconds, 4), 'peak_rss_mb': peak_rss_mb()}
+            if self.trace_allocations:
+                _, allocated_peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                measurement['allocated_peak_mb'] = round(allocated_peak / (1024 * 1024), 2)
+            self.stages[name] = measurement
+        return result
+
+
+def run_benchmark_size(size: int, trace_allocations: bool = True, workdir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Benchmark every pipeline stage over a synthetic corpus.
+
+    Args:
+        size: Number of synthetic issues
+        trace_allocations: Measure Python allocations with tracemalloc
+        workdir: Directory for the console output and session files (default: a temporary one)
+
+    Returns:
+        Measurements: {'issues', 'stages': {stage: {...}}, 'total_seconds'}
+    """
+    # Imported here so each size's process measures its own imports and caches
+    import check_issues
+    from check_issues import (find_tmf_references_in_components, find_tmf_references_in_text,
+                              get_tmf_api_info, get_tmf_rules_info)
+    from create_enhanced_report import create_enhanced_markdown_report
+    from jira_session import configure_session_manager
+    from jira_stub import JiraStub, create_stub_server, serve_in_background, stub_base_url, write_stub_cookies
+    from markdown_reporter import convert_console_output_to_markdown
+    from processed_issue import ProcessedIssue
+    from rule_config import DEFAULT_CONFIG
+    from rule_engine import RuleEngine
+    from rules.base_rule import RuleResult
+
+    timer = StageTimer(trace_allocations)
+    with contextlib.ExitStack() as cleanup:
+        if workdir is None:
+            workdir = cleanup.enter_context(tempfile.TemporaryDirectory(prefix='jira_bench_'))
+
+        stub = JiraStub(issues=size)
+        rule_engine = RuleEngine(config=DEFAULT_CONFIG, workers=0)
+        # The fields check_issues.py searches for
+        fields = rule_engine.get_required_fields(check_issues.ISSUE_DISPLAY_FIELDS)
+
+        raw_issues = timer.run('generate', lambda: list(stub.iter_issues(fields)))
+
+        raw_fields = rule_engine.get_required_raw_fields()
+        issues = timer.run('process', lambda: [
+            ProcessedIssue.from_raw(raw_issue, 'http://127.0.0.1/jira', raw_fields) for raw_issue in raw_issues
+        ])
+        del raw_issues
+
+        def run_rules():
+            now = datetime.now(timezone.utc)
+            RuleResult.start_run(now)
+            contexts = {}
+            results = 0
+            for issue in issues:
+                issue_type = issue['issue_type']
+                context = contexts.get(issue_type)
+                if context is None:
+                    context = contexts[issue_type] = {
+                        'components': [], 'thresholds': DEFAULT_CONFIG.get('thresholds', {}),
+                        'issue_type': issue_type, 'now': now
+                    }
+                results += len(rule_engine.run_rules(issue, context))
+            return results
+
+        timer.run('rules', run_rules)
+        rule_engine.close()
+
+        def lookup_tmf():
+            found = 0
+            for issue in issues:
+                codes = find_tmf_references_in_text(f"{issue['summary']} {issue['description'] or ''}")
+                codes += find_tmf_references_in_components(issue['components'])
+                for code in codes:
+                    found += get_tmf_api_info(code) is not None
+                    found += get_tmf_rules_info(code) is not None
+            return found
+
+        timer.run('tmf_lookup', lookup_tmf)
+        del issues
+
+        # The full run, against a stub serving the same corpus over HTTP
+        cookie_file = os.path.join(workdir, 'jira_stub_cookies.json')
+        write_stub_cookies(cookie_file)
+        configure_session_manager(cookie_file=cookie_file, validation_cache_file='')
+        server = create_stub_server(stub, port=0)
+        serve_in_background(server)
+        cleanup.callback(server.server_close)
+        cleanup.callback(server.shutdown)
+
+        console_path = os.path.join(workdir, 'report.txt')
+
+        def run_pipeline():
+            # The stub never throttles, so the client's rate limiter stays disengaged
+            with open(console_path, 'w', encoding='utf-8') as console, contextlib.redirect_stdout(console):
+                asyncio.run(check_issues.main(base_url=stub_base_url(server)))
+
+        timer.run('pipeline', run_pipeline)
+
+        def convert_markdown():
+            with open(console_path, 'r', encoding='utf-8') as console, \
+                    open(os.path.join(workdir, 'report.md'), 'w', encoding='utf-8') as out:
+                convert_console_output_to_markdown(console, out)
+
+        timer.run('markdown', convert_markdown)
+
+        def convert_enhanced_markdown():
+            with open(console_path, 'r', encoding='utf-8') as console:
+                return len(create_enhanced_markdown_report(console.read()))
+
+        timer.run('enhanced_markdown', convert_enhanced_markdown)
+
+    return {
+        'issues': size,
+        'stages': timer.stages,
+        'total_seconds': round(sum(stage['wall_seconds'] for stage in timer.stages.values()), 4),
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def run_benchmarks(sizes: List[int], trace_allocations: bool = True) -> Dict[str, Any]:
+    """
+    Benchmark each corpus size in a fresh process.
+
+    Args:
+        sizes: Corpus sizes (issue counts)
+        trace_allocations: Measure Python allocations with tracemalloc
+
+    Returns:
+        Benchmark results: run metadata and {'sizes': {size: measurements}}
+    """
+    results = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'trace_allocations': trace_allocations,
+        'sizes': {}
+    }
+    for size in sizes:
+        print(f"[BENCH] {size:,} issues", file=sys.stderr)
+        with tempfile.TemporaryDirectory(prefix='jira_bench_') as workdir:
+            size_output = os.path.join(workdir, 'size.json')
+            command = [sys.executable, os.path.abspath(__file__), '--single-size', str(size),
+                       '--output', size_output, '--workdir', workdir]
+            if not trace_allocations:
+                command.append('--no-allocations')
+            subprocess.run(command, check=True)
+            with open(size_output, 'r', encoding='utf-8') as f:
+                results['sizes'][str(size)] = json.load(f)
+    return results
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    """Print benchmark results as a table per corpus size"""
+    for size, measurements in results['sizes'].items():
+        print(f"\n[BENCH] {int(size):,} issues - {measurements['total_seconds']:.2f}s total, "
+              f"peak RSS {measurements.get('peak_rss_mb')} MB")
+        print(f"   {'Stage':<18} {'Wall (s)':>10} {'Peak RSS (MB)':>14} {'Allocated (MB)':>15}")
+        for stage, values in measurements['stages'].items():
+            allocated = values.get('allocated_peak_mb')
+            print(f"   {stage:<18} {values['wall_seconds']:>10.3f} {str(values.get('peak_rss_mb')):>14} "
+                  f"{'-' if allocated is None else f'{allocated:.2f}':>15}")
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    Compare two benchmark results.
+
+    Args:
+        baseline: Earlier results
+        current: New results
+        threshold: Relative increase counted as a regression (0.10 = 10%)
+
+    Returns:
+        Descriptions of the regressions (empty if there are none)
+    """
+    regressions = []
+    print(f"\n[COMPARE] {baseline.get('commit') or 'baseline'} -> {current.get('commit') or 'current'} "
+          f"(threshold {threshold:.0%})")
+    for size, measurements in current['sizes'].items():
+        old_measurements = baseline['sizes'].get(size)
+        if old_measurements is None:
+            continue
+        print(f"   {int(size):,} issues")
+        for stage, values in measurements['stages'].items():
+            old_values = old_measurements['stages'].get(stage)
+            if old_values is None:
+                continue
+            for metric in COMPARED_METRICS:
+                old_value, new_value = old_values.get(metric), values.get(metric)
+                if not old_value or new_value is None:
+                    continue
+                change = (new_value - old_value) / old_value
+                flag = ''
+                noisy = metric == 'wall_seconds' and max(old_value, new_value) < MIN_COMPARED_SECONDS
+                if change > threshold and not noisy:
+                    flag = '  REGRESSION'
+                    regressions.append(f"{size} issues, {stage} {metric}: {old_value} -> {new_value} ({change:+.0%})")
+                print(f"      {stage:<18} {metric:<18} {old_value:>10} -> {new_value:>10} ({change:+.1%}){flag}")
+    return regressions
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    """Run the benchmarks and/or compare results"""
+    parser = argparse.ArgumentParser(description="Benchmark the JIRA data quality pipeline on synthetic issues")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Corpus sizes to benchmark (default: 100 1000 10000 100000)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'Results file (default: {DEFAULT_OUTPUT})')
+    parser.add_argument('--baseline', metavar='PATH', help='Compare the new results with an earlier results file')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help='Only compare two existing results files')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Relative increase reported as a regression (default: 0.10)')
+    parser.add_argument('--no-allocations', action='store_true', help='Do not trace allocations (faster)')
+    parser.add_argument('--single-size', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--workdir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single_size is not None:
+        # Child process benchmarking one size for run_benchmarks()
+        measurements = run_benchmark_size(args.single_size, not args.no_allocations, args.workdir)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(measurements, f, indent=2)
+        return
+
+    if args.compare:
+        regressions = compare_results(load_results(args.compare[0]), load_results(args.compare[1]), args.threshold)
+    else:
+        results = run_benchmarks(args.sizes, not args.no_allocations)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print_results(results)
+        print(f"\n[BENCH] Results written to {args.output}")
+        regressions = []
+        if args.baseline:
+            regressions = compare_results(load_results(args.baseline), results, args.threshold)
+
+    if regressions:
+        print(f"\n[REGRESSION] {len(regressions)} measurements regressed by more than {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
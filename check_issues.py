@@ -6,12 +6,19 @@ using the modular rule engine. It's designed to work with Stories, Tasks, Bugs,
 and other issue types in addition to EPICs.
 """
 
+import argparse
 import asyncio
 import re
-from jira_api import JiraApiClient
+import sys
+from contextlib import nullcontext, redirect_stdout
+from functools import lru_cache
+from types import MappingProxyType
+from jira_api import JiraApiClient, configure_logging
+from jira_recorder import RequestRecorder
+from jira_session import configure_session_manager
 import json
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from exceptions import (
     JiraApiError,
     JiraAuthenticationError,
@@ -20,16 +27,31 @@ from exceptions import (
     JiraConfigurationError
 )
 from rule_engine import RuleEngine, RuleReporter
-from rule_config import DEFAULT_CONFIG
+from rule_config import DEFAULT_CONFIG, get_execution_config, get_issue_store_config
+from issue_store import IssueStore
+from processed_issue import ProcessedIssue, process_issues
+from rules.base_rule import RuleResult
+from rules.text_analysis import TextAnalysis, analyze_issue_text, find_tmf_codes
 from markdown_reporter import MarkdownReporter
+from report_events import ReportEventWriter, SpooledStream, result_event_data
+from request_metrics import write_metrics
 
 
+# JIRA fields printed for every checked issue (TMF enrichment reads the description)
+ISSUE_DISPLAY_FIELDS = ['key', 'summary', 'status', 'assignee', 'issuetype', 'labels', 'description']
+
 # Global variable to cache the TMF APIs dataframe
 _tmf_apis_df = None
 
+# Global variable to cache the TMF API lookup index (TMF code -> frozen API record)
+_tmf_api_index = None
+
 # Global variable to cache the TMF rules dataframe
 _tmf_rules_df = None
 
+# Global variable to cache the TMF rules lookup index (TMF code prefix -> frozen rules record)
+_tmf_rules_index = None
+
 # Global variable to track labels and their usage
 _label_tracker = {}
 
@@ -126,118 +148,173 @@ def load_tmf_rules():
     return _tmf_rules_df
 
 
-def get_tmf_api_info(tmf_code):
+@lru_cache(maxsize=1024)
+def normalize_tmf_code(tmf_code):
     """
-    Get the highest version number and URL for a given TMF API code.
+    Normalize a TMF API code to the 'TMF' + 3-digit form used in the lookup tables.
     
     Args:
-        tmf_code (str): TMF API code (e.g., "TMF646", "646", or just "646")
+        tmf_code (str or int): TMF API code (e.g., "TMF646", "tmf 646", "646" or 646)
     
     Returns:
-        dict: Dictionary with 'highest_version', 'url', 'long_name' or None if not found
+        str: Normalized code (e.g., "TMF646") or None if the input has no digits
     """
-    df = load_tmf_apis()
-    
-    if df.empty:
-        return None
-    
-    # Normalize the TMF code input
     if isinstance(tmf_code, str):
         # Remove any non-numeric characters and ensure it's a 3-digit number
         numeric_part = ''.join(filter(str.isdigit, tmf_code))
         if len(numeric_part) > 0:
-            normalized_code = f"TMF{numeric_part.zfill(3)}"
-        else:
-            return None
-    elif isinstance(tmf_code, int):
-        normalized_code = f"TMF{tmf_code:03d}"
-    else:
+            return f"TMF{numeric_part.zfill(3)}"
         return None
+    elif isinstance(tmf_code, int):
+        return f"TMF{tmf_code:03d}"
+    return None
+
+
+def find_highest_version(versions_str):
+    """
+    Find the highest version in a TMF API 'Versions' value.
     
-    # Find the API in the dataframe
-    api_row = df[df['Short Name (TMF Code)'] == normalized_code]
+    Args:
+        versions_str: Semicolon-separated versions (e.g., "v4; v5"), 'Unknown' or NaN
     
-    if api_row.empty:
-        return None
+    Returns:
+        str: Highest 'vN' version, the first listed version if none are numeric, or 'Unknown'
+    """
+    if pd.isna(versions_str) or versions_str == 'Unknown':
+        return 'Unknown'
     
-    # Get the first (and should be only) match
-    api_info = api_row.iloc[0]
+    # Split versions by semicolon and clean up
+    versions = [v.strip() for v in versions_str.split(';')]
+    # Extract numeric parts of versions (e.g., "v4" -> 4)
+    version_numbers = []
+    for v in versions:
+        if v.startswith('v') and v[1:].isdigit():
+            version_numbers.append(int(v[1:]))
     
-    # Parse versions to find the highest one
-    versions_str = api_info['Versions']
-    if pd.isna(versions_str) or versions_str == 'Unknown':
-        highest_version = 'Unknown'
-    else:
-        # Split versions by semicolon and clean up
-        versions = [v.strip() for v in versions_str.split(';')]
-        # Extract numeric parts of versions (e.g., "v4" -> 4)
-        version_numbers = []
-        for v in versions:
-            if v.startswith('v') and v[1:].isdigit():
-                version_numbers.append(int(v[1:]))
-        
-        if version_numbers:
-            highest_version = f"v{max(version_numbers)}"
-        else:
-            highest_version = versions[0] if versions else 'Unknown'
-    
-    return {
-        'long_name': api_info['Long Name'],
-        'tmf_code': normalized_code,
-        'highest_version': highest_version,
-        'url': api_info['URL'],
-        'all_versions': versions_str
-    }
+    if version_numbers:
+        return f"v{max(version_numbers)}"
+    return versions[0] if versions else 'Unknown'
 
 
-def get_tmf_rules_info(tmf_code):
+def load_tmf_api_index():
     """
-    Get Git rules information for a given TMF API code.
+    Build the TMF API lookup index from data/tmf_apis.csv (once).
+    
+    Returns:
+        MappingProxyType: Read-only mapping of normalized TMF code to a read-only
+        record with 'long_name', 'tmf_code', 'highest_version', 'url' and 'all_versions'
+    """
+    global _tmf_api_index
+    
+    if _tmf_api_index is None:
+        df = load_tmf_apis()
+        index = {}
+        
+        if not df.empty:
+            for long_name, tmf_code, url, versions_str in zip(
+                    df['Long Name'], df['Short Name (TMF Code)'], df['URL'], df['Versions']):
+                # Keep the first row for a code, as the DataFrame lookup did
+                if tmf_code in index:
+                    continue
+                index[tmf_code] = MappingProxyType({
+                    'long_name': long_name,
+                    'tmf_code': tmf_code,
+                    'highest_version': find_highest_version(versions_str),
+                    'url': url,
+                    'all_versions': versions_str
+                })
+        
+        _tmf_api_index = MappingProxyType(index)
+    
+    return _tmf_api_index
+
+
+def get_tmf_api_info(tmf_code):
+    """
+    Get the highest version number and URL for a given TMF API code.
     
     Args:
         tmf_code (str): TMF API code (e.g., "TMF646", "646", or just "646")
     
     Returns:
-        dict: Dictionary with Git information or None if not found
+        Mapping: Read-only record with 'highest_version', 'url', 'long_name' or None if not found
     """
-    df = load_tmf_rules()
-    
-    if df.empty:
+    normalized_code = normalize_tmf_code(tmf_code)
+    if normalized_code is None:
         return None
     
-    # Normalize the TMF code input
-    if isinstance(tmf_code, str):
-        # Remove any non-numeric characters and ensure it's a 3-digit number
-        numeric_part = ''.join(filter(str.isdigit, tmf_code))
-        if len(numeric_part) > 0:
-            normalized_code = f"TMF{numeric_part.zfill(3)}"
-        else:
-            return None
-    elif isinstance(tmf_code, int):
-        normalized_code = f"TMF{tmf_code:03d}"
-    else:
-        return None
+    return load_tmf_api_index().get(normalized_code)
+
+
+def load_tmf_rules_index():
+    """
+    Build the TMF Git rules lookup index from tmf_rules_playwright.csv (once).
+    
+    Every 'TMF' + digits prefix of a rules directory name is indexed, so a lookup
+    finds the same row as matching directory names that start with the code.
+    Commit dates are converted to timezone-aware datetimes.
+    
+    Returns:
+        MappingProxyType: Read-only mapping of TMF code prefix (e.g., "TMF620") to a
+        read-only rules record (see get_tmf_rules_info)
+    """
+    global _tmf_rules_index
+    
+    if _tmf_rules_index is None:
+        df = load_tmf_rules()
+        index = {}
+        
+        if not df.empty:
+            for row in df.itertuples(index=False):
+                directory = row.directory
+                if not isinstance(directory, str):
+                    continue
+                match = re.match(r'TMF(\d{3,})', directory)
+                if not match:
+                    continue
+                
+                commit_date = row.last_commit_date
+                commit_date = None if pd.isna(commit_date) else commit_date.to_pydatetime()
+                
+                rules_info = {
+                    'directory': directory,
+                    'filename': row.filename,
+                    'file_path': row.file_path,
+                    'last_commit_date': commit_date,
+                    'last_commit_message': row.last_commit_message,
+                    'last_author': row.last_author,
+                    'commit_sha': row.commit_sha,
+                    'extraction_method': row.extraction_method
+                }
+                
+                digits = match.group(1)
+                for length in range(3, len(digits) + 1):
+                    prefix = f"TMF{digits[:length]}"
+                    # Keep the first row for a prefix, as the DataFrame lookup did
+                    if prefix not in index:
+                        index[prefix] = MappingProxyType({'tmf_code': prefix, **rules_info})
+        
+        _tmf_rules_index = MappingProxyType(index)
     
-    # Find the rules file in the dataframe - check if directory starts with the TMF code
-    matching_rows = df[df['directory'].str.startswith(normalized_code)]
+    return _tmf_rules_index
+
+
+def get_tmf_rules_info(tmf_code):
+    """
+    Get Git rules information for a given TMF API code.
+    
+    Args:
+        tmf_code (str): TMF API code (e.g., "TMF646", "646", or just "646")
     
-    if matching_rows.empty:
+    Returns:
+        Mapping: Read-only record with the Git information ('last_commit_date' is a
+        timezone-aware datetime) or None if not found
+    """
+    normalized_code = normalize_tmf_code(tmf_code)
+    if normalized_code is None:
         return None
     
-    # Get the first match (there should typically be only one)
-    rules_info = matching_rows.iloc[0]
-    
-    return {
-        'tmf_code': normalized_code,
-        'directory': rules_info['directory'],
-        'filename': rules_info['filename'],
-        'file_path': rules_info['file_path'],
-        'last_commit_date': rules_info['last_commit_date'],
-        'last_commit_message': rules_info['last_commit_message'],
-        'last_author': rules_info['last_author'],
-        'commit_sha': rules_info['commit_sha'],
-        'extraction_method': rules_info['extraction_method']
-    }
+    return load_tmf_rules_index().get(normalized_code)
 
 
 def find_tmf_references_in_components(components):
@@ -248,26 +325,12 @@ def find_tmf_references_in_components(components):
         components (list): List of component dictionaries from JIRA
     
     Returns:
-        list: List of TMF API codes found in the components
+        list: Unique TMF API codes found in the components, in order of appearance
     """
     if not components:
         return []
     
-    tmf_refs = []
-    
-    for component in components:
-        if isinstance(component, dict):
-            component_name = component.get('name', '')
-        else:
-            component_name = str(component)
-        
-        # Pattern to match TMF followed by 3 digits
-        tmf_pattern = r'TMF\s*(\d{3})'
-        matches = re.findall(tmf_pattern, component_name, re.IGNORECASE)
-        tmf_refs.extend([f"TMF{match}" for match in matches])
-    
-    # Return unique TMF codes
-    return list(set(tmf_refs))
+    return TextAnalysis(None, None, components=components).component_tmf_codes
 
 
 def find_tmf_references_in_text(text):
@@ -278,37 +341,28 @@ def find_tmf_references_in_text(text):
         text (str): Text to search for TMF references
     
     Returns:
-        list: List of TMF API codes found in the text
+        list: Unique TMF API codes found in the text, in order of appearance
     """
-    import re
-    
-    if not text:
-        return []
-    
-    # Pattern to match TMF followed by 3 digits
-    tmf_pattern = r'TMF\s*(\d{3})'
-    matches = re.findall(tmf_pattern, text, re.IGNORECASE)
-    
-    # Return unique TMF codes
-    return list(set([f"TMF{match}" for match in matches]))
+    return find_tmf_codes(text)
 
 
 def enrich_issue_with_tmf_info(issue):
     """
     Enrich an issue with TMF API information if TMF references are found.
     
+    Reuses the text analysis already stored on the issue by the TMF rules.
+    
     Args:
         issue (dict): Issue data
     
     Returns:
         dict: Issue data enriched with TMF API information
     """
-    enriched_issue = issue.copy()
-    enriched_issue['tmf_apis'] = []
+    # TMF references in summary and description
+    tmf_refs = analyze_issue_text(issue).text_tmf_codes
     
-    # Search for TMF references in summary and description
-    search_text = f"{issue.get('summary', '')} {issue.get('description', '')}"
-    tmf_refs = find_tmf_references_in_text(search_text)
+    enriched_issue = dict(issue)
+    enriched_issue['tmf_apis'] = []
     
     for tmf_code in tmf_refs:
         api_info = get_tmf_api_info(tmf_code)
@@ -318,7 +372,7 @@ def enrich_issue_with_tmf_info(issue):
     return enriched_issue
 
 
-def track_labels(issue_key, labels, issue_url, issue_summary, issue_type):
+def track_labels(issue_key, labels, issue_url, issue_summary, issue_type, tracker=None):
     """
     Track labels and the issues that use them for final reporting.
     
@@ -328,18 +382,20 @@ def track_labels(issue_key, labels, issue_url, issue_summary, issue_type):
         issue_url (str): URL to the JIRA issue
         issue_summary (str): Issue summary/title
         issue_type (str): Type of issue (Epic, Story, etc.)
+        tracker (dict): Optional tracker to record into (default: the global label tracker)
     """
-    global _label_tracker
+    if tracker is None:
+        tracker = _label_tracker
     
     if not labels:
         return
     
     for label in labels:
-        if label not in _label_tracker:
-            _label_tracker[label] = []
+        if label not in tracker:
+            tracker[label] = []
         
         # Add issue info to this label's tracking
-        _label_tracker[label].append({
+        tracker[label].append({
             'key': issue_key,
             'url': issue_url,
             'summary': issue_summary,
@@ -347,6 +403,17 @@ def track_labels(issue_key, labels, issue_url, issue_summary, issue_type):
         })
 
 
+def merge_label_tracker(section_labels):
+    """
+    Merge labels tracked for one issue type into the global label tracker.
+    
+    Args:
+        section_labels (dict): Label tracker returned by check_issue_type
+    """
+    for label, issues in section_labels.items():
+        _label_tracker.setdefault(label, []).extend(issues)
+
+
 def generate_label_report():
     """
     Generate a comprehensive report of all labels found and their usage.
@@ -431,18 +498,430 @@ def generate_label_report():
         print(f"     {issue_type}: {len(labels)} unique labels")
 
 
-async def main():
-    """Run data quality checks on various JIRA issue types in the AP project"""
+async def load_project_components(client, project_key):
+    """
+    Load the components of a project, returning the exception instead of raising it.
+    
+    Args:
+        client: Authenticated JiraApiClient
+        project_key: The project key (e.g., 'AP')
+    
+    Returns:
+        list or Exception: Project components, or the error that prevented loading them
+    """
+    try:
+        return await client.get_project_components(project_key)
+    except Exception as e:
+        return e
+
+
+def build_issue_type_jql(project_key, jql_filter):
+    """
+    Build the JQL query used to check one issue type.
+    
+    Args:
+        project_key (str): The project key (e.g., 'AP')
+        jql_filter (str): JQL clause selecting the issue type (e.g., 'type = "Story"')
+    
+    Returns:
+        str: Full JQL query
+    """
+    # Focus on active issues (not closed/resolved) for data quality
+    base_jql = f'project = {project_key} AND {jql_filter} AND status not in ("Closed", "Resolved", "Done")'
+    
+    # Add time filter to focus on recent/active issues
+    time_filter = ' AND (updated >= "-6M" OR status = "In Progress")'  # Last 6 months or in progress
+    return base_jql + time_filter
+
+
+def report_issue(processed_issue, rule_results, position, total, issue_type_name, label_tracker=None, events=None):
+    """
+    Print a checked issue and the results of the data quality rules run against it.
+    
+    Args:
+        processed_issue (dict): Processed issue data
+        rule_results (list): RuleResult objects for the issue
+        position (int): 1-based position of the issue within its issue type
+        total (int): Total number of issues of this type
+        issue_type_name (str): Name of the issue type being checked
+        label_tracker (dict): Optional label tracker to record labels in (default: global tracker)
+        events (ReportEventWriter): Optional report event stream to record the issue and its results in
+    """
+    # Track labels for final report
+    track_labels(
+        processed_issue['key'],
+        processed_issue['labels'],
+        processed_issue['url'],
+        processed_issue['summary'],
+        issue_type_name,
+        tracker=label_tracker
+    )
+    
+    print(f"\n{position:2}. {issue_type_name}: {processed_issue['key']}")
+    print(f"    Title: {safe_encode_for_cp1252(processed_issue['summary'])}")
+    print(f"    Status: {processed_issue['status']}")
+    
+    # Display assignee with email if available
+    if processed_issue['assignee_email']:
+        print(f"    Assignee: {safe_encode_for_cp1252(processed_issue['assignee'])} ({processed_issue['assignee_email']})")
+    else:
+        print(f"    Assignee: {safe_encode_for_cp1252(processed_issue['assignee'])}")
+    
+    print(f"    URL: {processed_issue['url']}")
+    
+    # Check for TMF API references and enrich the issue
+    enriched_issue = enrich_issue_with_tmf_info(processed_issue)
+    if enriched_issue['tmf_apis']:
+        print(f"    [TMF] TMF APIs Referenced:")
+        for api_info in enriched_issue['tmf_apis']:
+            print(f"       - {api_info['tmf_code']}: {api_info['long_name']} (Latest: {api_info['highest_version']})")
+            print(f"         Documentation: {api_info['url']}")
+    
+    # Display results
+    output_config = DEFAULT_CONFIG.get('output', {})
+    RuleReporter.display_results(
+        rule_results,
+        show_passed=output_config.get('show_passed', False),
+        group_by_severity=output_config.get('group_by_severity', True)
+    )
+    
+    # Add a small separator between issues
+    if position < total:
+        print("    " + "-" * 60)
+    
+    if events is not None:
+        events.emit(
+            'issue',
+            issue_type=issue_type_name,
+            position=position,
+            total=total,
+            key=processed_issue['key'],
+            summary=processed_issue['summary'],
+            status=processed_issue['status'],
+            assignee=processed_issue['assignee'],
+            assignee_email=processed_issue['assignee_email'],
+            url=processed_issue['url'],
+            labels=processed_issue['labels'] or [],
+            tmf_apis=[
+                {key: api_info[key] for key in ('tmf_code', 'long_name', 'highest_version', 'url')}
+                for api_info in enriched_issue['tmf_apis']
+            ]
+        )
+        for result in rule_results:
+            events.emit('result', **result_event_data(result))
+
+
+def print_issue_type_summary(issue_type_name, total_issues_checked, total_violations, violations_by_severity):
+    """
+    Print the violation summary and quality assessment for one issue type.
+    
+    Args:
+        issue_type_name (str): Name of the issue type
+        total_issues_checked (int): Number of issues checked
+        total_violations (int): Number of failed rule results
+        violations_by_severity (dict): Failed rule results counted by severity
+    """
+    print(f"\n[SUMMARY] {issue_type_name} Summary:")
+    print(f"   Issues checked: {total_issues_checked}")
+    print(f"   Total violations: {total_violations}")
+    if violations_by_severity:
+        print("   Violations by severity:")
+        for severity, count in violations_by_severity.items():
+            if count > 0:
+                print(f"     {severity}: {count}")
+    
+    violation_rate = (total_violations / total_issues_checked) if total_issues_checked > 0 else 0
+    print(f"   Average violations per issue: {violation_rate:.1f}")
+    
+    # Quality assessment
+    if violation_rate == 0:
+        print("   [EXCELLENT] Data Quality: EXCELLENT - No issues found!")
+    elif violation_rate < 2:
+        print("   [GOOD] Data Quality: GOOD - Minor issues found")
+    elif violation_rate < 5:
+        print("   [WARNING] Data Quality: NEEDS ATTENTION - Multiple issues found")
+    else:
+        print("   [POOR] Data Quality: POOR - Many issues require immediate attention")
+
+
+async def check_issue_type(client, rule_engine, project_key, issue_type_config, component_names, output=None,
+                           store=None, fields=None, now=None, events=None):
+    """
+    Search one issue type page by page and check every issue against the rules.
+    
+    When an output buffer is given, everything printed for this issue type is written
+    to it instead of stdout, so several issue types can be checked concurrently and
+    their sections still be printed in a fixed order afterwards.
+    
+    When a store is given, the issues are read from the local issue store instead
+    of searching JIRA.
+    
+    Args:
+        client: Authenticated JiraApiClient
+        rule_engine: RuleEngine to run
+        project_key (str): The project key (e.g., 'AP')
+        issue_type_config (dict): Issue type entry with 'name' and 'jql_filter'
+        component_names (list): Project component names
+        output: Optional text stream (e.g., a SpooledStream) for this section's output
+        store: Optional synced IssueStore to read issues from
+        fields: JIRA fields to request (default: the client's default field list)
+        now: Time the run started, shared by every rule (default: now)
+        events: Optional ReportEventWriter to record this section's report events in
+    
+    Returns:
+        dict: Labels found in this issue type, in the same shape as the global label tracker
+    """
+    issue_type_name = issue_type_config['name']
+    label_tracker = {}
+    
+    # Only redirect around synchronous blocks - stdout is process-wide, so it must be
+    # restored before every await to keep concurrent sections from interleaving
+    def section_output():
+        return redirect_stdout(output) if output is not None else nullcontext()
+    
+    with section_output():
+        print(f"\n" + "=" * 80)
+        print(f"[CHECK] CHECKING {issue_type_name.upper()} ISSUES")
+        print("=" * 80)
+        
+        full_jql = build_issue_type_jql(project_key, issue_type_config['jql_filter'])
+        if store is not None:
+            print(f"[QUERY] Local store query (same criteria as): {full_jql}")
+            pages = store.iter_search_pages(project_key, issue_type_name, page_size=100)
+        else:
+            print(f"[QUERY] JQL Query: {full_jql}")
+    
+    if events is not None:
+        events.emit('section_start', issue_type=issue_type_name, jql=full_jql,
+                    source='store' if store is not None else 'jira')
+    
+    # Rule context shared by every issue of this type
+    context = {
+        'components': component_names,
+        'thresholds': DEFAULT_CONFIG.get('thresholds', {}),
+        'issue_type': issue_type_name,  # Pass issue type for rule filtering
+        'now': now or datetime.now(timezone.utc)
+    }
+    
+    # Raw JIRA fields the rules read; the rest of each raw payload is dropped
+    raw_fields = rule_engine.get_required_raw_fields()
+    
+    # Get issues, streaming every page of results through the rule engine
+    try:
+        total = 0
+        total_issues_checked = 0
+        total_violations = 0
+        violations_by_severity = {'WARNING': 0, 'ERROR': 0, 'CRITICAL': 0}
+        i = 0
+        
+        if store is None:
+            # The searches run in a prefetch task outside this section's output,
+            # so validate (and print the query's warnings) here and only once
+            with section_output():
+                search_jql = client.prepare_jql(full_jql)
+            pages = client.iter_search_pages(search_jql, page_size=100, fields=fields, validate_jql=False)
+        
+        async for search_results in pages:
+            issues_raw = search_results.get('issues', [])
+            
+            with section_output():
+                if i == 0:
+                    total = search_results.get('total', 0)
+                    if not issues_raw:
+                        break
+                    print(f"\n[RESULTS] Found {total} {issue_type_name} issues to check")
+                    if events is not None:
+                        events.emit('section_found', issue_type=issue_type_name, total=total)
+                
+                # Run all rules against the whole page at once (in worker processes, if configured)
+                processed_issues = process_issues(issues_raw, client.base_url, raw_fields)
+                pending_results = rule_engine.submit_rules_batch(processed_issues, context)
+            
+            page_results = await pending_results
+            
+            with section_output():
+                # Report each issue
+                for processed_issue, rule_results in zip(processed_issues, page_results):
+                    i += 1
+                    report_issue(processed_issue, rule_results, i, total, issue_type_name, label_tracker, events)
+                    
+                    # Count violations
+                    total_issues_checked += 1
+                    failed_results = [r for r in rule_results if not r.passed]
+                    if failed_results:
+                        total_violations += len(failed_results)
+                        for result in failed_results:
+                            violations_by_severity[result.severity.value] = violations_by_severity.get(result.severity.value, 0) + 1
+        
+        with section_output():
+            if total_issues_checked == 0:
+                print(f"   [OK] No {issue_type_name} issues found matching the criteria")
+            else:
+                print_issue_type_summary(issue_type_name, total_issues_checked, total_violations, violations_by_severity)
+        
+        if events is not None:
+            events.emit('section_end', issue_type=issue_type_name, checked=total_issues_checked,
+                        violations=total_violations, violations_by_severity=violations_by_severity, error=None)
+    
+    except JiraApiError as e:
+        with section_output():
+            print(f"   [ERROR] Error fetching {issue_type_name} issues: {e}")
+        if events is not None:
+            events.emit('section_end', issue_type=issue_type_name, checked=0, violations=0,
+                        violations_by_severity={}, error=str(e))
+    
+    return label_tracker
+
+
+async def check_issue_types_concurrently(client, rule_engine, project_key, selected_types, component_names,
+                                         store=None, fields=None, now=None, events=None):
+    """
+    Check several issue types at once, printing their sections in the given order.
+    
+    Every issue type's searches run concurrently (bounded by the client's request
+    cap) and rules run on whichever type's pages arrive first. The first unfinished
+    section prints straight to stdout; the sections after it are spooled (spilling
+    to a temporary file when large) and printed when their turn comes, so memory
+    does not grow with the number of issues.
+    
+    Args:
+        client: Authenticated JiraApiClient
+        rule_engine: RuleEngine to run
+        project_key (str): The project key (e.g., 'AP')
+        selected_types (list): Issue type entries with 'name' and 'jql_filter'
+        component_names (list): Project component names
+        store: Optional synced IssueStore to read issues from
+        fields: JIRA fields to request (default: the client's default field list)
+        now: Time the run started, shared by every rule (default: now)
+        events: Optional ReportEventWriter; each section's events are spooled and written in order too
+    """
+    outputs = [SpooledStream() for _ in selected_types]
+    section_events = [ReportEventWriter.buffered() if events is not None else None for _ in selected_types]
+    tasks = [
+        asyncio.ensure_future(
+            check_issue_type(client, rule_engine, project_key, issue_type_config, component_names, output, store,
+                             fields, now, section_event_writer)
+        )
+        for issue_type_config, output, section_event_writer in zip(selected_types, outputs, section_events)
+    ]
+    
+    try:
+        for task, output, section_event_writer in zip(tasks, outputs, section_events):
+            # This section is next in order: print what it has so far and stream the rest
+            output.forward_to(sys.stdout)
+            if events is not None:
+                events.extend(section_event_writer)
+            section_labels = await task
+            sys.stdout.flush()
+            merge_label_tracker(section_labels)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        # Wait for the cancelled sections and collect their errors so none go unreported
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for output in outputs:
+            output.close()
+
+
+def print_rate_limit_summary(metrics):
+    """
+    Print how the JIRA request rate limiter behaved during the run.
+    
+    Args:
+        metrics: AdaptiveRateLimiter.metrics() output
+    """
+    if not metrics.get('enabled') or not metrics.get('requests'):
+        return
+    if not metrics['engagements']:
+        print(f"\n[RATE] {metrics['requests']} JIRA requests, never throttled")
+        return
+    state = f"pacing at {metrics['rate']:.1f} req/s" if metrics['engaged'] else "unthrottled"
+    print(f"\n[RATE] {metrics['requests']} JIRA requests, {state} at the end "
+          f"(lowest {metrics['lowest_rate']:.1f} req/s, throttled {metrics['engagements']} times)")
+    if metrics['throttled_requests']:
+        print(f"   {metrics['throttled_requests']} requests waited {metrics['throttle_wait_seconds']:.1f}s in total for the limiter")
+    if metrics['throttle_responses']:
+        print(f"   {metrics['throttle_responses']} rate-limited responses, {metrics['pauses']} shared pauses")
+
+
+def print_request_summary(totals):
+    """
+    Print the JIRA request totals of the run.
+    
+    Args:
+        totals: RequestMetrics.totals() output
+    """
+    if not totals['requests']:
+        return
+    if totals['compressed_bytes'] is None:
+        wire = f"size on the wire unknown for {totals['unmeasured_responses']} responses"
+    else:
+        wire = f"{totals['compressed_bytes'] / 1024:.0f} KB on the wire"
+    print(f"\n[HTTP] {totals['requests']} responses in {totals['request_seconds']:.1f}s, "
+          f"{totals['decompressed_bytes'] / 1024:.0f} KB received ({wire})")
+    if totals['retries'] or totals['failed_requests']:
+        print(f"   {totals['retries']} retries ({totals['backoff_seconds']:.1f}s backoff), "
+              f"{totals['throttled_responses']} rate-limited, {totals['server_errors']} server errors, "
+              f"{totals['failed_requests']} failed without a response")
+
+
+async def main(use_store=None, full_sync=False, sync_only=False, workers=None, drop_passed=None, events_path=None,
+               base_url=None, record_path=None, rule_stats=None, metrics_path=None):
+    """
+    Run data quality checks on various JIRA issue types in the AP project
+    
+    Args:
+        use_store: Sync the local issue store and check issues from it
+                   (default: the issue_store 'enabled' setting)
+        full_sync: Re-fetch all active issues into the store instead of only changed ones
+        sync_only: Sync the local issue store and stop without running any checks
+        workers: Number of worker processes for rule evaluation
+                 (default: the execution 'rule_workers' setting)
+        drop_passed: Only keep failed rule results
+                     (default: the execution 'drop_passed_results' setting)
+        events_path: Also write the structured report event stream (JSON lines) to this
+                     file, for report_events.py to render the reports from
+        base_url: JIRA instance to check (default: JIRA_BASE_URL or the TM Forum JIRA),
+                  e.g. a jira_stub.py server
+        record_path: Record every JIRA request and response to this file for
+                     replay by jira_stub.py
+        rule_stats: Print per-rule timings and counts at the end of the run, as
+                    'table' or 'json' (default: a table if the execution
+                    'instrument_rules' setting is on)
+        metrics_path: Write the JIRA request metrics to this file at the end of the
+                      run (Prometheus text for .prom/.txt files, JSON otherwise)
+    """
     print("Checking for JIRA Issue data quality issues in AP project")
     print("=" * 70)
     
+    store_config = get_issue_store_config()
+    if use_store is None:
+        use_store = store_config.get('enabled', False)
+    use_store = use_store or full_sync or sync_only
+    
+    client = None
+    store = None
+    rule_engine = None
+    events = None
+    recorder = None
+    completed = False
     try:
+        if events_path:
+            events = ReportEventWriter.open(events_path)
+            events.emit('run_start', project='AP', generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        
         # Create the API client
-        client = JiraApiClient()
+        execution_config = get_execution_config()
+        if record_path:
+            recorder = RequestRecorder.open(record_path)
+        client = JiraApiClient(base_url=base_url, max_concurrent_requests=execution_config.get('max_concurrent_requests'),
+                               recorder=recorder)
         
         # Initialize rule engine
         print("[DEBUG] Creating rule engine...")
-        rule_engine = RuleEngine(config=DEFAULT_CONFIG)
+        rule_engine = RuleEngine(config=DEFAULT_CONFIG, workers=workers, drop_passed=drop_passed,
+                                 instrument=True if rule_stats else None)
         print("[DEBUG] Getting rule summary...")
         summary = rule_engine.get_rule_summary()
         print(f"[DEBUG] Summary keys: {list(summary.keys())}")
@@ -451,36 +930,64 @@ async def main():
         print(f"   {summary['enabled_rules']}/{summary['total_rules']} rules enabled")
         for category, rules in summary['rules_by_category'].items():
             print(f"   - {category}: {len(rules)} rules")
+        if rule_engine.workers > 1:
+            print(f"   Running rules in {rule_engine.workers} worker processes")
+        if rule_engine.drop_passed:
+            print(f"   Reporting failed checks only")
+        if events is not None:
+            events.emit('rules', enabled_rules=summary['enabled_rules'], total_rules=summary['total_rules'],
+                        rules_by_category=summary['rules_by_category'])
+        
+        # Only download the fields the enabled rules (and the issue display) read
+        search_fields = rule_engine.get_required_fields(ISSUE_DISPLAY_FIELDS)
+        if search_fields is not None:
+            print(f"   Requesting {len(search_fields)} fields: {', '.join(search_fields)}")
         
         # Authenticate
         print("\n[AUTH] Step 1: Authenticating with JIRA...")
         if not await client.authenticate():
             print("JIRA Authentication failed. Check your credentials in .env file.")
             return
+        
+        # Use the AP project as intended
+        project_key = "AP"
+        
+        # User info and project components are independent, so fetch them concurrently
+        user_info, components = await asyncio.gather(
+            client.get_user_info(),
+            load_project_components(client, project_key)
+        )
+        
+        if user_info:
+            print(f"   Logged in as: {user_info.get('displayName', 'Unknown')}")
+            print(f"   Email: {user_info.get('emailAddress', 'Not provided')}")
+            if events is not None:
+                events.emit('auth', user=user_info.get('displayName', 'Unknown'),
+                            email=user_info.get('emailAddress', 'Not provided'))
         else:
-            user_info = await client.get_user_info()
-            if user_info:
-                print(f"   Logged in as: {user_info.get('displayName', 'Unknown')}")
-                print(f"   Email: {user_info.get('emailAddress', 'Not provided')}")
-            else:
-                print("   [ERROR] Could not retrieve user info after authentication")
-                return
+            print("   [ERROR] Could not retrieve user info after authentication")
+            return
         
         # Get project components for context
         print("\n[SETUP] Step 2: Loading project components...")
-        
-        # Use the AP project as intended
-        project_key = "AP"
         print(f"\n[SETUP] Loading components for project '{project_key}'...")
         
-        try:
-            components = await client.get_project_components(project_key)
+        if isinstance(components, Exception):
+            print(f"   [WARNING] Could not load components for {project_key}: {components}")
+            component_names = []
+        else:
             component_names = [comp.get('name') for comp in components if comp.get('name')]
             print(f"   Found {len(component_names)} Components in {project_key} project")
-        except Exception as e:
-            print(f"   [WARNING] Could not load components for {project_key}: {e}")
-            components = []
-            component_names = []
+        
+        if use_store:
+            print(f"\n[STORE] Syncing local issue store {store_config.get('path', 'jira_issues.db')}...")
+            store = IssueStore(
+                store_config.get('path', 'jira_issues.db'),
+                sync_overlap_minutes=store_config.get('sync_overlap_minutes', 5)
+            )
+            await store.sync(client, project_key, full=full_sync)
+            if sync_only:
+                return
         
         # Define issue types to check
         issue_types_to_check = [
@@ -500,171 +1007,27 @@ async def main():
         # For automation, check all types. In interactive mode, you could ask for input
         selected_types = issue_types_to_check  # Check all types
         
+        # Every rule measures ages from the same instant
+        run_started = datetime.now(timezone.utc)
+        RuleResult.start_run(run_started)
+        
         print(f"   Checking {len(selected_types)} issue types: {', '.join([t['name'] for t in selected_types])}")
         
-        # Process each issue type
-        for issue_type_config in selected_types:
-            issue_type_name = issue_type_config['name']
-            jql_filter = issue_type_config['jql_filter']
-            
-            print(f"\n" + "=" * 80)
-            print(f"[CHECK] CHECKING {issue_type_name.upper()} ISSUES")
-            print("=" * 80)
-            
-            # Build JQL query for this issue type
-            # Focus on active issues (not closed/resolved) for data quality
-            base_jql = f'project = {project_key} AND {jql_filter} AND status not in ("Closed", "Resolved", "Done")'
-            
-            # Add time filter to focus on recent/active issues
-            time_filter = ' AND (updated >= "-6M" OR status = "In Progress")'  # Last 6 months or in progress
-            full_jql = base_jql + time_filter
-            
-            print(f"[QUERY] JQL Query: {full_jql}")
-            
-            # Get issues
-            try:
-                search_results = await client.search_issues(full_jql, max_results=100)
-                
-                if search_results and search_results.get('issues'):
-                    issues_raw = search_results.get('issues', [])
-                    total = search_results.get('total', 0)
-                    
-                    print(f"\n[RESULTS] Found {len(issues_raw)} {issue_type_name} issues to check (Total matching: {total})")
-                    
-                    if len(issues_raw) == 0:
-                        print(f"   [OK] No {issue_type_name} issues found matching criteria")
-                        continue
-                    
-                    # Initialize counters for summary
-                    total_issues_checked = 0
-                    total_violations = 0
-                    violations_by_severity = {'WARNING': 0, 'ERROR': 0, 'CRITICAL': 0}
-                    
-                    # Process each issue
-                    for i, issue in enumerate(issues_raw, 1):
-                        fields = issue.get('fields', {})
-                        
-                        # Create processed issue data
-                        assignee_info = fields.get('assignee', {})
-                        assignee_name = assignee_info.get('displayName') if assignee_info else 'Unassigned'
-                        assignee_email = assignee_info.get('emailAddress') if assignee_info else None
-                        
-                        reporter_info = fields.get('reporter', {})
-                        reporter_name = reporter_info.get('displayName') if reporter_info else 'Unassigned'
-                        reporter_email = reporter_info.get('emailAddress') if reporter_info else None
-                        
-                        processed_issue = {
-                            'key': issue.get('key'),
-                            'summary': fields.get('summary'),
-                            'status': fields.get('status', {}).get('name') if fields.get('status') else None,
-                            'assignee': assignee_name,
-                            'assignee_email': assignee_email,
-                            'reporter': reporter_name,
-                            'reporter_email': reporter_email,
-                            'priority': fields.get('priority', {}).get('name') if fields.get('priority') else None,
-                            'issue_type': fields.get('issuetype', {}).get('name') if fields.get('issuetype') else None,
-                            'description': fields.get('description'),
-                            'labels': fields.get('labels'),
-                            'components': fields.get('components'),
-                            'versions': fields.get('versions'),
-                            'created': fields.get('created'),
-                            'updated': fields.get('updated'),
-                            'url': f"{client.base_url}/browse/{issue.get('key')}",
-                            'issues': fields.get('issuelinks', []),
-                            'fixVersions': fields.get('fixVersions', []),
-                            'raw_fields': fields  # Keep raw fields for rules that need them
-                        }
-                        
-                        # Track labels for final report
-                        track_labels(
-                            processed_issue['key'],
-                            processed_issue['labels'],
-                            processed_issue['url'],
-                            processed_issue['summary'],
-                            issue_type_name
-                        )
-                        
-                        print(f"\n{i:2}. {issue_type_name}: {processed_issue['key']}")
-                        print(f"    Title: {safe_encode_for_cp1252(processed_issue['summary'])}")
-                        print(f"    Status: {processed_issue['status']}")
-                        
-                        # Display assignee with email if available
-                        if processed_issue['assignee_email']:
-                            print(f"    Assignee: {safe_encode_for_cp1252(processed_issue['assignee'])} ({processed_issue['assignee_email']})")
-                        else:
-                            print(f"    Assignee: {safe_encode_for_cp1252(processed_issue['assignee'])}")
-                        
-                        print(f"    URL: {processed_issue['url']}")
-                        
-                        # Check for TMF API references and enrich the issue
-                        enriched_issue = enrich_issue_with_tmf_info(processed_issue)
-                        if enriched_issue['tmf_apis']:
-                            print(f"    [TMF] TMF APIs Referenced:")
-                            for api_info in enriched_issue['tmf_apis']:
-                                print(f"       - {api_info['tmf_code']}: {api_info['long_name']} (Latest: {api_info['highest_version']})")
-                                print(f"         Documentation: {api_info['url']}")
-                        
-                        # Run all rules against this issue
-                        context = {
-                            'components': component_names,
-                            'thresholds': DEFAULT_CONFIG.get('thresholds', {}),
-                            'issue_type': issue_type_name  # Pass issue type for rule filtering
-                        }
-                        
-                        rule_results = rule_engine.run_rules(processed_issue, context)
-                        
-                        # Count violations
-                        total_issues_checked += 1
-                        failed_results = [r for r in rule_results if not r.passed]
-                        if failed_results:
-                            total_violations += len(failed_results)
-                            for result in failed_results:
-                                violations_by_severity[result.severity.value] = violations_by_severity.get(result.severity.value, 0) + 1
-                        
-                        # Display results
-                        output_config = DEFAULT_CONFIG.get('output', {})
-                        RuleReporter.display_results(
-                            rule_results,
-                            show_passed=output_config.get('show_passed', False),
-                            group_by_severity=output_config.get('group_by_severity', True)
-                        )
-                        
-                        # Add a small separator between issues
-                        if i < len(issues_raw):
-                            print("    " + "-" * 60)
-                    
-                    # Print summary for this issue type
-                    print(f"\n[SUMMARY] {issue_type_name} Summary:")
-                    print(f"   Issues checked: {total_issues_checked}")
-                    print(f"   Total violations: {total_violations}")
-                    if violations_by_severity:
-                        print("   Violations by severity:")
-                        for severity, count in violations_by_severity.items():
-                            if count > 0:
-                                print(f"     {severity}: {count}")
-                    
-                    violation_rate = (total_violations / total_issues_checked) if total_issues_checked > 0 else 0
-                    print(f"   Average violations per issue: {violation_rate:.1f}")
-                    
-                    # Quality assessment
-                    if violation_rate == 0:
-                        print("   [EXCELLENT] Data Quality: EXCELLENT - No issues found!")
-                    elif violation_rate < 2:
-                        print("   [GOOD] Data Quality: GOOD - Minor issues found")
-                    elif violation_rate < 5:
-                        print("   [WARNING] Data Quality: NEEDS ATTENTION - Multiple issues found")
-                    else:
-                        print("   [POOR] Data Quality: POOR - Many issues require immediate attention")
-                
-                else:
-                    print(f"   [OK] No {issue_type_name} issues found matching the criteria")
-                    
-            except JiraApiError as e:
-                print(f"   [ERROR] Error fetching {issue_type_name} issues: {e}")
-                continue
+        if execution_config.get('concurrent_queries', False) and len(selected_types) > 1:
+            # Fan the per-type searches out together; sections still print in order
+            await check_issue_types_concurrently(client, rule_engine, project_key, selected_types, component_names,
+                                                 store=store, fields=search_fields, now=run_started, events=events)
+        else:
+            # Process each issue type
+            for issue_type_config in selected_types:
+                await check_issue_type(client, rule_engine, project_key, issue_type_config, component_names,
+                                       store=store, fields=search_fields, now=run_started, events=events)
         
         # Generate comprehensive label usage report
         generate_label_report()
+        if events is not None:
+            events.emit('labels', labels=_label_tracker)
+        completed = True
         
         print("\n" + "=" * 100)
         print("[SUCCESS] Multi-issue type data quality check completed successfully!")
@@ -698,21 +1061,45 @@ async def main():
         import traceback
         traceback.print_exc()
         raise
+    finally:
+        if events is not None:
+            events.emit('run_end', completed=completed)
+            events.close()
+        if rule_engine is not None:
+            rule_engine.close()
+            if rule_engine.instrument:
+                print(f"\n[RULE-STATS] Per-rule cost, slowest first:")
+                RuleReporter.display_rule_stats(rule_engine.get_rule_summary()['rule_stats'],
+                                                as_json=rule_stats == 'json')
+        if store is not None:
+            store.close()
+        if client is not None:
+            print_rate_limit_summary(client.rate_limiter.metrics())
+            print_request_summary(client.metrics.totals())
+            if metrics_path:
+                write_metrics(client.metrics, metrics_path)
+                print(f"[HTTP] Request metrics written to {metrics_path}")
+            await client.close()
+        if recorder is not None:
+            recorder.close()
+            print(f"[RECORD] {recorder.records} JIRA requests recorded to {record_path}")
 
 
-async def check_specific_issue_type(issue_type: str, max_results: int = 50):
+async def check_specific_issue_type(issue_type: str, max_results: int = 50, base_url=None):
     """
     Helper function to check a specific issue type only.
     
     Args:
         issue_type: The JIRA issue type to check (e.g., "Story", "Task", "Bug")
         max_results: Maximum number of issues to check
+        base_url: JIRA instance to check (default: JIRA_BASE_URL or the TM Forum JIRA)
     """
     print(f"Checking {issue_type} issues in AP project")
     print("=" * 50)
     
+    client = None
     try:
-        client = JiraApiClient()
+        client = JiraApiClient(base_url=base_url)
         rule_engine = RuleEngine(config=DEFAULT_CONFIG)
         
         if not await client.authenticate():
@@ -723,34 +1110,20 @@ async def check_specific_issue_type(issue_type: str, max_results: int = 50):
         component_names = [comp.get('name') for comp in components if comp.get('name')]
         
         jql = f'project = AP AND type = "{issue_type}" AND status not in ("Closed", "Resolved", "Done") AND updated >= "-3M"'
-        search_results = await client.search_issues(jql, max_results=max_results)
+        search_fields = rule_engine.get_required_fields(['key', 'summary', 'assignee'])
+        raw_fields = rule_engine.get_required_raw_fields()
+        search_results = await client.search_issues(jql, max_results=max_results, fields=search_fields)
         
         if search_results and search_results.get('issues'):
             issues = search_results.get('issues', [])
             print(f"[DATA] Found {len(issues)} {issue_type} issues to check")
             
+            # Every rule measures ages from the same instant
+            run_started = datetime.now(timezone.utc)
+            RuleResult.start_run(run_started)
+            
             for i, issue in enumerate(issues, 1):
-                fields = issue.get('fields', {})
-                
-                assignee_info = fields.get('assignee', {})
-                assignee_name = assignee_info.get('displayName') if assignee_info else 'Unassigned'
-                assignee_email = assignee_info.get('emailAddress') if assignee_info else None
-                
-                processed_issue = {
-                    'key': issue.get('key'),
-                    'summary': fields.get('summary'),
-                    'status': fields.get('status', {}).get('name') if fields.get('status') else None,
-                    'assignee': assignee_name,
-                    'assignee_email': assignee_email,
-                    'description': fields.get('description'),
-                    'components': fields.get('components'),
-                    'fixVersions': fields.get('fixVersions', []),
-                    'issues': fields.get('issuelinks', []),
-                    'created': fields.get('created'),
-                    'updated': fields.get('updated'),
-                    'url': f"{client.base_url}/browse/{issue.get('key')}",
-                    'raw_fields': fields
-                }
+                processed_issue = ProcessedIssue.from_raw(issue, client.base_url, raw_fields)
                 
                 # Display issue info with email
                 if processed_issue['assignee_email']:
@@ -763,7 +1136,8 @@ async def check_specific_issue_type(issue_type: str, max_results: int = 50):
                 context = {
                     'components': component_names,
                     'thresholds': DEFAULT_CONFIG.get('thresholds', {}),
-                    'issue_type': issue_type
+                    'issue_type': issue_type,
+                    'now': run_started
                 }
                 
                 results = rule_engine.run_rules(processed_issue, context)
@@ -773,19 +1147,58 @@ async def check_specific_issue_type(issue_type: str, max_results: int = 50):
             
     except Exception as e:
         print(f"[ERROR] Error: {e}")
+    finally:
+        if client is not None:
+            await client.close()
 
 
 if __name__ == "__main__":
-    import sys
+    parser = argparse.ArgumentParser(description="Run data quality checks on JIRA issues in the AP project")
+    parser.add_argument('issue_type', nargs='?', help='Check only this issue type (e.g., Story, Task, Bug)')
+    parser.add_argument('max_results', nargs='?', type=int, default=50,
+                        help='Maximum number of issues to check for a single issue type (default: 50)')
+    parser.add_argument('--use-store', action='store_true',
+                        help='Sync the local issue store with changed issues and check issues from it')
+    parser.add_argument('--full-sync', action='store_true',
+                        help='Re-fetch all active issues into the local issue store')
+    parser.add_argument('--sync-only', action='store_true',
+                        help='Sync the local issue store without running any checks')
+    parser.add_argument('--workers', type=int,
+                        help='Worker processes for rule evaluation (default: rule_config execution.rule_workers)')
+    parser.add_argument('--failures-only', action='store_true',
+                        help='Discard passed checks as the rules run and report failures only')
+    parser.add_argument('--events', metavar='PATH',
+                        help='Also write the structured report events to PATH (render with report_events.py)')
+    parser.add_argument('--base-url', metavar='URL',
+                        help='JIRA instance to check, e.g. a local jira_stub.py server (default: JIRA_BASE_URL)')
+    parser.add_argument('--cookie-file', metavar='PATH',
+                        help='Session cookie file to use instead of the authentication cookie_file setting')
+    parser.add_argument('--rule-stats', nargs='?', const='table', choices=['table', 'json'],
+                        help='Time every rule and print per-rule stats at the end of the run (default: table)')
+    parser.add_argument('--record', metavar='PATH',
+                        help='Record every JIRA request and response to PATH for replay by jira_stub.py')
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='Write JIRA request metrics to PATH at the end of the run '
+                             '(Prometheus text for .prom/.txt, JSON otherwise)')
+    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='JIRA client log level; DEBUG logs every request (default: JIRA_LOG_LEVEL or WARNING)')
+    args = parser.parse_args()
+    
+    configure_logging(args.log_level)
+    
+    if args.cookie_file:
+        # A separate session (e.g., the stub's cookies); its session check is not
+        # cached, so the check cached for the real JIRA session is left alone
+        configure_session_manager(cookie_file=args.cookie_file, validation_cache_file='')
     
     # Check if user wants to check a specific issue type
-    if len(sys.argv) > 1:
-        issue_type = sys.argv[1]
-        max_results = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    if args.issue_type:
+        issue_type = args.issue_type
+        max_results = args.max_results
         
         print(f"[TARGET] Checking specific issue type: {issue_type}")
         try:
-            asyncio.run(check_specific_issue_type(issue_type, max_results))
+            asyncio.run(check_specific_issue_type(issue_type, max_results, base_url=args.base_url))
         except (JiraApiError, JiraAuthenticationError, JiraNetworkError, JiraValidationError, JiraConfigurationError) as e:
             print(f"\n[ERROR] JIRA Error: {e}")
             exit(1)
@@ -795,10 +1208,13 @@ if __name__ == "__main__":
     else:
         # Run full multi-issue type check
         try:
-            asyncio.run(main())
+            asyncio.run(main(use_store=args.use_store or None, full_sync=args.full_sync, sync_only=args.sync_only,
+                             workers=args.workers, drop_passed=args.failures_only or None,
+                             events_path=args.events, base_url=args.base_url, record_path=args.record,
+                             rule_stats=args.rule_stats, metrics_path=args.metrics))
         except (JiraApiError, JiraAuthenticationError, JiraNetworkError, JiraValidationError, JiraConfigurationError) as e:
             print(f"\n[ERROR] JIRA Error: {e}")
             exit(1)
         except Exception as e:
             print(f"\n[ERROR] Unexpected Error: {e}")
-            exit(1)
\ No newline at end of file
+            exit(1)
@@ -25,20 +25,12 @@ def main():
         output_file = sys.argv[2]
     
     try:
-        # Read the existing report
+        # Convert the existing report line by line, writing the markdown as it goes
         print(f"Reading report from: {input_file}")
-        with open(input_file, 'r', encoding='utf-8', errors='replace') as f:
-            console_content = f.read()
-        
-        print(f"Converting to markdown format...")
-        
-        # Convert to markdown
-        markdown_content = convert_console_output_to_markdown(console_content)
-        
-        # Write the markdown report
         print(f"Writing markdown report to: {output_file}")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        with open(input_file, 'r', encoding='utf-8', errors='replace') as console_file:
+            with open(output_file, 'w', encoding='utf-8') as markdown_file:
+                convert_console_output_to_markdown(console_file, out=markdown_file)
         
         print(f"✅ Successfully converted report to markdown!")
         print(f"📄 Input: {input_file}")
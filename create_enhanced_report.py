@@ -2,13 +2,16 @@
 Enhanced Markdown Report Generator for JIRA Issue Data Quality Checker
 
 This creates a more polished markdown report with better formatting,
-table of contents, and improved readability.
+table of contents, and improved readability, either from report.txt or from
+the check_issues.py --events stream.
 """
 
 import re
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from report_events import EventRenderer
+
 
 def create_enhanced_markdown_report(console_text: str) -> str:
     """
@@ -87,7 +90,21 @@ def create_enhanced_markdown_report(console_text: str) -> str:
         
         i += 1
     
-    # Build the final report
+    return build_enhanced_report(sections, issue_count, generate_summary_section(console_text))
+
+
+def build_enhanced_report(sections: Dict[str, str], issue_count: int, summary_markdown: str) -> str:
+    """
+    Assemble the enhanced report from its rendered sections.
+    
+    Args:
+        sections: Markdown per section ('authentication', 'rules', 'stories', ...)
+        issue_count: Number of issues analyzed
+        summary_markdown: Rendered summary & insights section
+    
+    Returns:
+        The complete markdown report
+    """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     report = f"""# 📊 JIRA Issue Data Quality Report
@@ -136,7 +153,7 @@ def create_enhanced_markdown_report(console_text: str) -> str:
 
 ## 📈 Summary & Insights
 
-{generate_summary_section(console_text)}
+{summary_markdown}
 
 ---
 
@@ -349,6 +366,13 @@ def generate_summary_section(console_text: str) -> str:
     error_count = console_text.count('[ERROR]')
     critical_count = console_text.count('[CRITICAL]')
     
+    return format_summary_section(story_count, task_count, bug_count, epic_count,
+                                  critical_count, error_count, warning_count)
+
+
+def format_summary_section(story_count: int, task_count: int, bug_count: int, epic_count: int,
+                           critical_count: int, error_count: int, warning_count: int) -> str:
+    """Format the summary insights from issue and violation counts"""
     summary = f"""### 📈 Issue Analysis Summary
 
 | Issue Type | Count |
@@ -380,6 +404,123 @@ def generate_summary_section(console_text: str) -> str:
     return summary
 
 
+def format_rules_section(enabled: int, total: int, rules_by_category: Dict[str, Any]) -> str:
+    """Format the rules section from the rule engine summary"""
+    rules_text = "✅ **Rule Engine Successfully Initialized**\n\n"
+    rules_text += f"**Rules Status:** {enabled}/{total} rules enabled\n\n"
+    for category, rules in rules_by_category.items():
+        rules_text += f"- **{category.title()}:** {len(rules)} rules\n"
+    return rules_text + "\n"
+
+
+def format_label_section(label_data: Dict[str, List[Dict[str, Any]]]) -> str:
+    """Format the label usage section from the tracked labels"""
+    total_usages = sum(len(issues) for issues in label_data.values())
+    issue_keys = {issue['key'] for issues in label_data.values() for issue in issues}
+    average = total_usages / len(issue_keys) if issue_keys else 0
+    
+    label_markdown = f"**📊 Total Unique Labels:** {len(label_data)}\n"
+    label_markdown += f"**🏷️ Total Label Usages:** {total_usages}\n"
+    label_markdown += f"**📈 Average per Issue:** {average:.1f}\n\n"
+    label_markdown += "### 🏆 Top Labels by Usage\n\n"
+    
+    for label, issues in sorted(label_data.items(), key=lambda item: len(item[1]), reverse=True):
+        label_markdown += f"- **`{label}`** - Used {len(issues)} times\n"
+    
+    return label_markdown
+
+
+class EnhancedMarkdownEventRenderer(EventRenderer):
+    """Renders the enhanced markdown report from the report event stream (see report_events.py)"""
+    
+    # Issue type -> (section, section heading)
+    ISSUE_TYPE_SECTIONS = {
+        'Story': ('stories', "## 📖 Story Issues\n\n"),
+        'Task': ('tasks', "## ✅ Task Issues\n\n"),
+        'Bug': ('bugs', "## 🐛 Bug Issues\n\n"),
+        'Epic': ('epics', "## 🎯 Epic Issues\n\n"),
+        'Sub-task': ('subtasks', "## 🔧 Sub-task Issues\n\n")
+    }
+    
+    SEVERITY_PREFIXES = ('WARNING', 'ERROR', 'CRITICAL')
+    
+    def __init__(self, out):
+        super().__init__(out)
+        self.sections = {name: '' for name in (
+            'authentication', 'rules', 'stories', 'tasks', 'bugs', 'epics', 'subtasks', 'labels', 'summary'
+        )}
+        self.issue_count = 0
+        self.issue_type_counts = {}
+        self.severity_counts = {severity: 0 for severity in self.SEVERITY_PREFIXES}
+    
+    def on_rules(self, event):
+        self.sections['rules'] = format_rules_section(
+            event.get('enabled_rules', 0), event.get('total_rules', 0), event.get('rules_by_category', {})
+        )
+    
+    def on_auth(self, event):
+        self.sections['authentication'] = format_auth_section(event.get('user', 'Unknown'), event.get('email', ''))
+    
+    def on_section_start(self, event):
+        section = self.ISSUE_TYPE_SECTIONS.get(event['issue_type'])
+        if section:
+            name, heading = section
+            self.sections[name] = heading
+    
+    def render_issue(self, issue, results):
+        section = self.ISSUE_TYPE_SECTIONS.get(issue.get('issue_type'))
+        if not section:
+            return
+        
+        assignee = issue.get('assignee') or 'Unassigned'
+        if issue.get('assignee_email'):
+            assignee += f" ({issue['assignee_email']})"
+        
+        violations = []
+        passes = []
+        for result in results:
+            if result.get('passed'):
+                passes.append(result.get('message', ''))
+            elif result.get('severity') in self.SEVERITY_PREFIXES:
+                violations.append(f"[{result['severity']}] {result.get('message', '')}")
+                self.severity_counts[result['severity']] += 1
+        
+        issue_data = {
+            'number': str(issue.get('position', '?')),
+            'type': issue.get('issue_type'),
+            'key': issue.get('key'),
+            'title': issue.get('summary'),
+            'status': issue.get('status'),
+            'assignee': assignee,
+            'url': issue.get('url'),
+            'tmf_apis': [
+                f"{api['tmf_code']}: {api['long_name']} (Latest: {api['highest_version']})"
+                for api in issue.get('tmf_apis') or []
+            ],
+            'violations': violations,
+            'passes': passes
+        }
+        self.sections[section[0]] += format_issue_markdown(issue_data)
+        self.issue_count += 1
+        self.issue_type_counts[issue_data['type']] = self.issue_type_counts.get(issue_data['type'], 0) + 1
+    
+    def on_labels(self, event):
+        self.sections['labels'] = format_label_section(event.get('labels', {}))
+    
+    def finish(self):
+        super().finish()
+        summary = format_summary_section(
+            self.issue_type_counts.get('Story', 0),
+            self.issue_type_counts.get('Task', 0),
+            self.issue_type_counts.get('Bug', 0),
+            self.issue_type_counts.get('Epic', 0),
+            self.severity_counts['CRITICAL'],
+            self.severity_counts['ERROR'],
+            self.severity_counts['WARNING']
+        )
+        self.out.write(build_enhanced_report(self.sections, self.issue_count, summary))
+
+
 def main():
     """Convert report.txt to enhanced markdown format"""
     
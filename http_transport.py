@@ -0,0 +1,295 @@
+"""
+Async HTTP transports for the JIRA API client.
+
+JiraApiClient sends every request through a transport object so that the HTTP
+stack can be swapped without touching the request/retry logic. Two transports
+are provided:
+
+- AiohttpTransport: native asyncio client with a pooled connector (used when
+  the optional ``aiohttp`` package is installed)
+- RequestsTransport: the original ``requests.Session`` path, run in a worker
+  thread so it no longer blocks the event loop
+
+Both transports raise ``requests.exceptions`` errors for network failures so the
+retry logic in JiraApiClient handles them identically. Both read the body as it
+came off the wire and decode its Content-Encoding themselves, so every response
+reports its size on the wire as well as its decoded size.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from exceptions import JiraConfigurationError
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional - fall back to requests
+    aiohttp = None
+
+try:
+    import brotli
+except ImportError:  # brotli is optional - 'br' bodies cannot be decoded without it
+    brotli = None
+
+
+DEFAULT_POOL_SIZE = 10
+READ_CHUNK_SIZE = 64 * 1024
+# Content codings decode_content() can handle, for the Accept-Encoding header
+ACCEPT_ENCODING = 'gzip, deflate, br' if brotli is not None else 'gzip, deflate'
+
+_DECODE_ERRORS = (OSError, EOFError, zlib.error) + ((brotli.error,) if brotli is not None else ())
+
+
+def decode_content(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """
+    Decode a response body read off the wire.
+
+    Args:
+        body: Body bytes as received
+        content_encoding: Content-Encoding header value (e.g., 'gzip')
+
+    Returns:
+        Decoded body
+
+    Raises:
+        requests.exceptions.ContentDecodingError: If the body cannot be decoded
+    """
+    if not body:
+        return body
+    codings = [coding.strip().lower() for coding in content_encoding.split(',')] if content_encoding else []
+    try:
+        # Codings are listed in the order they were applied
+        for coding in reversed(codings):
+            if coding in ('gzip', 'x-gzip'):
+                body = gzip.decompress(body)
+            elif coding == 'deflate':
+                try:
+                    body = zlib.decompress(body)
+                except zlib.error:
+                    # Some servers send raw deflate without the zlib header
+                    body = zlib.decompress(body, -zlib.MAX_WBITS)
+            elif coding == 'br' and brotli is not None:
+                body = brotli.decompress(body)
+            elif coding not in ('identity', ''):
+                raise requests.exceptions.ContentDecodingError(f"Unsupported Content-Encoding '{coding}'")
+    except _DECODE_ERRORS as e:
+        raise requests.exceptions.ContentDecodingError(f"Failed to decode '{content_encoding}' body: {e}") from e
+    return body
+
+
+class TransportResponse:
+    """
+    Fully-read HTTP response returned by every transport.
+
+    ``content`` is the decoded body; ``wire_bytes`` is the size of the body as
+    received, before its Content-Encoding was decoded (None if unknown).
+    """
+
+    def __init__(self, status_code: int, headers: Mapping[str, str], content: bytes,
+                 url: str = "", encoding: Optional[str] = None, wire_bytes: Optional[int] = None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content = content
+        self.url = url
+        self.encoding = encoding or 'utf-8'
+        self.wire_bytes = wire_bytes
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as text"""
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self) -> Any:
+        """Response body parsed as JSON"""
+        return json.loads(self.content)
+
+
+class HttpTransport(ABC):
+    """Abstract base class for pluggable async HTTP transports"""
+
+    name = "base"
+
+    @abstractmethod
+    def set_proxies(self, proxies: Dict[str, str]) -> None:
+        """Configure proxies as a {'http': url, 'https': url} mapping"""
+        pass
+
+    @abstractmethod
+    def set_cookies(self, cookies: Dict[str, str], domain: str) -> None:
+        """Set the authentication cookies sent with every request"""
+        pass
+
+    @abstractmethod
+    async def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None, json: Any = None,
+                      data: Any = None, timeout: Optional[float] = None) -> TransportResponse:
+        """Send a request and return the fully-read response"""
+        pass
+
+    async def close(self) -> None:
+        """Release pooled connections"""
+
+
+class RequestsTransport(HttpTransport):
+    """Transport backed by requests.Session, executed in a worker thread"""
+
+    name = "requests"
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE):
+        self.session = requests.Session()
+        # Size the connection pool for concurrent callers sharing this session
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def set_proxies(self, proxies: Dict[str, str]) -> None:
+        self.session.proxies = proxies
+
+    def set_cookies(self, cookies: Dict[str, str], domain: str) -> None:
+        for name, value in cookies.items():
+            self.session.cookies.set(name=name, value=value, domain=domain, path='/')
+
+    async def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None, json: Any = None,
+                      data: Any = None, timeout: Optional[float] = None) -> TransportResponse:
+        return await asyncio.to_thread(
+            self._send, method, url,
+            params=params, headers=headers, json=json, data=data, timeout=timeout
+        )
+
+    def _send(self, method: str, url: str, **kwargs) -> TransportResponse:
+        """Send a request and read the undecoded body off the raw stream"""
+        response = self.session.request(method, url, stream=True, **kwargs)
+        try:
+            body = b''.join(response.raw.stream(READ_CHUNK_SIZE, decode_content=False))
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(str(e)) from e
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        finally:
+            response.close()
+        return TransportResponse(
+            response.status_code, response.headers,
+            decode_content(body, response.headers.get('Content-Encoding')),
+            url=response.url, encoding=response.encoding, wire_bytes=len(body)
+        )
+
+    async def close(self) -> None:
+        self.session.close()
+
+
+class AiohttpTransport(HttpTransport):
+    """Transport backed by a pooled aiohttp.ClientSession"""
+
+    name = "aiohttp"
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE):
+        if aiohttp is None:
+            raise JiraConfigurationError(
+                "aiohttp is not installed. Install it or use the requests transport.",
+                config_key="http_transport"
+            )
+        self.pool_size = pool_size
+        self.proxies: Dict[str, str] = {}
+        self.cookies: Dict[str, str] = {}
+        self._session = None
+        self._loop = None
+
+    def set_proxies(self, proxies: Dict[str, str]) -> None:
+        self.proxies = dict(proxies)
+
+    def set_cookies(self, cookies: Dict[str, str], domain: str) -> None:
+        # Cookies are sent as an explicit header, so the domain is not needed here
+        self.cookies.update(cookies)
+
+    def _get_session(self):
+        """Create the pooled session lazily, once per running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300)
+            # Bodies are decoded in decode_content() so their size on the wire is known
+            self._session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar(),
+                                                  auto_decompress=False)
+            self._loop = loop
+        return self._session
+
+    async def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None, json: Any = None,
+                      data: Any = None, timeout: Optional[float] = None) -> TransportResponse:
+        session = self._get_session()
+
+        headers = dict(headers or {})
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f"{name}={value}" for name, value in self.cookies.items())
+
+        options: Dict[str, Any] = {
+            'params': params, 'headers': headers, 'json': json, 'data': data,
+            'proxy': self.proxies.get('https' if url.startswith('https://') else 'http'),
+        }
+        if timeout:
+            options['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        try:
+            async with session.request(method, url, **options) as response:
+                body = await response.read()
+                # Keep rotated session cookies (e.g. a refreshed XSRF token)
+                for name, morsel in response.cookies.items():
+                    self.cookies[name] = morsel.value
+                return TransportResponse(
+                    response.status, response.headers,
+                    decode_content(body, response.headers.get('Content-Encoding')),
+                    url=str(response.url), encoding=response.charset, wire_bytes=len(body)
+                )
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(f"Request to {url} timed out") from e
+        except aiohttp.ClientConnectionError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        except aiohttp.ClientError as e:
+            raise requests.exceptions.RequestException(str(e)) from e
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+def create_transport(name: Optional[str] = None, pool_size: int = DEFAULT_POOL_SIZE) -> HttpTransport:
+    """
+    Create an HTTP transport by name.
+
+    Args:
+        name: 'aiohttp', 'requests' or 'auto' (default: JIRA_HTTP_TRANSPORT env var, then 'auto').
+              'auto' prefers aiohttp and falls back to requests when it is not installed.
+        pool_size: Maximum number of pooled connections
+
+    Returns:
+        HttpTransport instance
+
+    Raises:
+        JiraConfigurationError: If the transport name is unknown or unavailable
+    """
+    name = (name or os.getenv('JIRA_HTTP_TRANSPORT') or 'auto').lower()
+
+    if name == 'auto':
+        name = 'aiohttp' if aiohttp is not None else 'requests'
+
+    if name == 'aiohttp':
+        return AiohttpTransport(pool_size=pool_size)
+    if name == 'requests':
+        return RequestsTransport(pool_size=pool_size)
+
+    raise JiraConfigurationError(
+        f"Unknown HTTP transport '{name}'. Use 'aiohttp', 'requests' or 'auto'.",
+        config_key="http_transport"
+    )
@@ -0,0 +1,297 @@
+"""
+Local SQLite store of JIRA issues with incremental sync.
+
+The store keeps the raw JSON of every synced issue keyed by issue key, along
+with the few columns needed to select issues locally (issue type, status and
+the ``updated`` timestamp). After the first full sync, each sync only asks
+JIRA for issues updated since the previous sync, so daily reruns download the
+changed issues instead of the whole project.
+
+Relative JQL dates (``updated >= "-90m"``) are used for incremental syncs so the
+query does not depend on the JIRA user's time zone.
+"""
+
+import json
+import math
+import sqlite3
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from exceptions import JiraConfigurationError
+from rules.date_utils import jira_epoch
+
+
+# Statuses treated as finished when selecting issues to check
+CLOSED_STATUSES = ("Closed", "Resolved", "Done")
+
+# Issues updated within this many months (or still in progress) are checked
+ACTIVE_MONTHS = 6
+
+
+def months_ago(months: int, now: Optional[datetime] = None) -> float:
+    """
+    Unix timestamp of the same moment the given number of calendar months ago.
+
+    Matches JIRA's relative "-6M" dates. The day is clamped to the end of
+    shorter months (e.g. 31 August minus 6 months is 28/29 February).
+    """
+    now = now or datetime.now(timezone.utc)
+    month_index = now.year * 12 + (now.month - 1) - months
+    year, month = divmod(month_index, 12)
+    month += 1
+    for day in range(now.day, 27, -1):
+        try:
+            return now.replace(year=year, month=month, day=day).timestamp()
+        except ValueError:
+            continue
+    return now.replace(year=year, month=month, day=min(now.day, 28)).timestamp()
+
+
+class IssueStore:
+    """
+    SQLite-backed store of raw JIRA issues for one or more projects.
+
+    Example:
+        store = IssueStore('jira_issues.db')
+        await store.sync(client, 'AP')
+        async for page in store.iter_search_pages('AP', 'Story'):
+            ...
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS issues (
+            key TEXT PRIMARY KEY,
+            project_key TEXT NOT NULL,
+            issue_type TEXT,
+            status TEXT,
+            updated TEXT,
+            updated_epoch REAL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_issues_project_type ON issues (project_key, issue_type);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            project_key TEXT PRIMARY KEY,
+            last_sync REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str = 'jira_issues.db', sync_overlap_minutes: int = 5):
+        """
+        Open (and create if needed) an issue store.
+
+        Args:
+            path: SQLite database file, or ':memory:'
+            sync_overlap_minutes: Extra minutes re-fetched on each incremental sync
+                                  to cover clock skew between this machine and JIRA
+
+        Raises:
+            JiraConfigurationError: If the database cannot be opened
+        """
+        self.path = path
+        self.sync_overlap_minutes = sync_overlap_minutes
+        try:
+            self.connection = sqlite3.connect(path)
+            self.connection.executescript(self.SCHEMA)
+        except sqlite3.Error as e:
+            raise JiraConfigurationError(
+                f"Could not open issue store '{path}': {e}",
+                config_key="issue_store.path"
+            )
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self.connection.close()
+
+    def get_last_sync(self, project_key: str) -> Optional[float]:
+        """Unix timestamp of the last completed sync of a project, or None"""
+        row = self.connection.execute(
+            "SELECT last_sync FROM sync_state WHERE project_key = ?", (project_key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def count(self, project_key: Optional[str] = None) -> int:
+        """Number of issues in the store, optionally for a single project"""
+        if project_key is None:
+            row = self.connection.execute("SELECT COUNT(*) FROM issues").fetchone()
+        else:
+            row = self.connection.execute(
+                "SELECT COUNT(*) FROM issues WHERE project_key = ?", (project_key,)
+            ).fetchone()
+        return row[0]
+
+    def upsert_issues(self, project_key: str, issues: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or replace raw issues from the JIRA search API.
+
+        Args:
+            project_key: Project the issues belong to
+            issues: Raw issue dictionaries ('key', 'fields', ...)
+
+        Returns:
+            Number of issues written
+        """
+        rows = []
+        for issue in issues:
+            fields = issue.get('fields') or {}
+            issue_type = (fields.get('issuetype') or {}).get('name')
+            status = (fields.get('status') or {}).get('name')
+            updated = fields.get('updated')
+            rows.append((
+                issue.get('key'), project_key, issue_type, status,
+                updated, jira_epoch(updated), json.dumps(issue)
+            ))
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO issues (key, project_key, issue_type, status, updated, updated_epoch, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def get_issues(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up stored issues by key.
+
+        Args:
+            keys: Issue keys (e.g., ['AP-1', 'AP-2'])
+
+        Returns:
+            Dictionary of key -> raw issue for the keys in the store
+        """
+        keys = list(keys)
+        issues = {}
+        # Stay well under SQLite's limit on query parameters
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ', '.join('?' for _ in chunk)
+            rows = self.connection.execute(
+                f"SELECT key, data FROM issues WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            issues.update((key, json.loads(data)) for key, data in rows)
+        return issues
+
+    def build_sync_jql(self, project_key: str, full: bool = False) -> str:
+        """
+        Build the JQL used to sync a project.
+
+        The first (or a forced full) sync fetches the active issues; later syncs
+        fetch every issue updated since the last sync, whatever its status, so
+        issues that were closed in JIRA are updated locally too.
+
+        Args:
+            project_key: The project key (e.g., 'AP')
+            full: Ignore the last sync time and fetch all active issues
+
+        Returns:
+            JQL query string
+        """
+        last_sync = None if full else self.get_last_sync(project_key)
+        if last_sync is None:
+            closed = ', '.join(f'"{status}"' for status in CLOSED_STATUSES)
+            return (f'project = {project_key} AND status not in ({closed}) '
+                    f'AND (updated >= "-{ACTIVE_MONTHS}M" OR status = "In Progress") ORDER BY key ASC')
+
+        minutes = math.ceil((time.time() - last_sync) / 60) + self.sync_overlap_minutes
+        return f'project = {project_key} AND updated >= "-{minutes}m" ORDER BY key ASC'
+
+    async def sync(self, client, project_key: str, full: bool = False, page_size: int = 100) -> int:
+        """
+        Fetch new and changed issues from JIRA and merge them into the store.
+
+        Args:
+            client: Authenticated JiraApiClient
+            project_key: The project key (e.g., 'AP')
+            full: Ignore the last sync time and fetch all active issues
+            page_size: Number of issues to request per page
+
+        Returns:
+            Number of issues fetched from JIRA
+
+        Raises:
+            JiraApiError: If the search fails (the last sync time is left unchanged)
+        """
+        # Take the sync time before searching so changes made during the sync are fetched next time
+        sync_started = time.time()
+        jql = self.build_sync_jql(project_key, full=full)
+        print(f"[STORE] Syncing {project_key} issues: {jql}")
+
+        full = full or self.get_last_sync(project_key) is None
+        fetched_keys = []
+        async for page in client.iter_search_pages(jql, page_size=page_size):
+            issues = page.get('issues', [])
+            self.upsert_issues(project_key, issues)
+            fetched_keys.extend(issue.get('key') for issue in issues)
+        fetched = len(fetched_keys)
+
+        with self.connection:
+            if full:
+                # A full sync replaces the project, dropping issues deleted or closed in JIRA
+                self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS synced_keys (key TEXT PRIMARY KEY)")
+                self.connection.execute("DELETE FROM synced_keys")
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO synced_keys (key) VALUES (?)", ((key,) for key in fetched_keys)
+                )
+                self.connection.execute(
+                    "DELETE FROM issues WHERE project_key = ? AND key NOT IN (SELECT key FROM synced_keys)",
+                    (project_key,)
+                )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state (project_key, last_sync) VALUES (?, ?)",
+                (project_key, sync_started)
+            )
+
+        print(f"[STORE] Fetched {fetched} new or changed issues ({self.count(project_key)} issues in store)")
+        return fetched
+
+    def get_active_issues(self, project_key: str, issue_type: str) -> List[Dict[str, Any]]:
+        """
+        Select the stored issues that check_issues.py checks for an issue type.
+
+        Mirrors the JQL used against JIRA: not closed/resolved/done, and either
+        updated in the last six months or in progress.
+
+        Args:
+            project_key: The project key (e.g., 'AP')
+            issue_type: Issue type name (e.g., 'Story')
+
+        Returns:
+            Raw issue dictionaries ordered by key
+        """
+        placeholders = ', '.join('?' for _ in CLOSED_STATUSES)
+        rows = self.connection.execute(
+            f"SELECT data FROM issues "
+            f"WHERE project_key = ? AND issue_type = ? "
+            f"AND (status IS NULL OR status NOT IN ({placeholders})) "
+            f"AND (updated_epoch >= ? OR status = 'In Progress') "
+            f"ORDER BY key",
+            (project_key, issue_type, *CLOSED_STATUSES, months_ago(ACTIVE_MONTHS))
+        ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    async def iter_search_pages(self, project_key: str, issue_type: str,
+                                page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield stored active issues in the same page format as JiraApiClient.iter_search_pages.
+
+        Args:
+            project_key: The project key (e.g., 'AP')
+            issue_type: Issue type name (e.g., 'Story')
+            page_size: Number of issues per page
+
+        Yields:
+            Search result dictionaries ('issues', 'total', 'startAt', 'maxResults')
+        """
+        issues = self.get_active_issues(project_key, issue_type)
+        total = len(issues)
+        if not issues:
+            yield {'issues': [], 'total': 0, 'startAt': 0, 'maxResults': page_size}
+            return
+        for start_at in range(0, total, page_size):
+            yield {
+                'issues': issues[start_at:start_at + page_size],
+                'total': total,
+                'startAt': start_at,
+                'maxResults': page_size
+            }
@@ -1,14 +1,22 @@
 import requests
 import json
+import logging
 import os
 import asyncio
 import time
 import re
+import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
+from urllib.parse import urlparse
 from dotenv import load_dotenv
-from login import JiraLoginBot
+from http_transport import ACCEPT_ENCODING, HttpTransport, TransportResponse
+from jira_session import JiraSessionManager, get_session_manager
+from jira_recorder import RequestRecorder
+from rate_limiter import THROTTLE_STATUS_CODES, AdaptiveRateLimiter, parse_retry_after
+from request_metrics import RequestMetrics
 from jql_validator import JQLValidator, validate_jql_for_ap_project, build_safe_ap_query
+from processed_issue import ProcessedIssue
 from exceptions import (
     JiraApiError, JiraAuthenticationError, JiraNetworkError, 
     JiraConfigurationError, JiraValidationError, JiraRateLimitError,
@@ -18,6 +26,26 @@ from exceptions import (
 # Load environment variables
 load_dotenv()
 
+# Per-request diagnostics go through logging, so they cost nothing unless enabled
+# (JIRA_LOG_LEVEL=DEBUG, or --log-level DEBUG in check_issues.py)
+logger = logging.getLogger('jira_api')
+
+
+def configure_logging(level: Optional[str] = None) -> None:
+    """
+    Send JIRA client log records to stdout as "[LEVEL] message" lines.
+
+    Args:
+        level: Log level name (default: JIRA_LOG_LEVEL, or WARNING)
+    """
+    level = (level or os.getenv('JIRA_LOG_LEVEL') or 'WARNING').upper()
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level)
+
 
 def safe_encode_for_cp1252(text):
     """
@@ -41,10 +69,70 @@ def safe_encode_for_cp1252(text):
     return text.encode('cp1252', errors='replace').decode('cp1252')
 
 
+# JIRA instance used unless a base URL is passed in or set in JIRA_BASE_URL
+# (e.g., http://127.0.0.1:8080/jira for the local stand-in server in jira_stub.py)
+DEFAULT_BASE_URL = "https://projects.tmforum.org/jira/"
+
+
+# Fields requested by search_issues when the caller does not ask for specific ones
+DEFAULT_SEARCH_FIELDS = [
+    'key', 'summary', 'status', 'assignee', 'created',
+    'updated', 'priority', 'issuetype', 'description',
+    'components', 'labels', 'reporter', 'resolution',
+    'comment', 'issuelinks', 'issues', 'fixVersions'
+]
+
+
+# Issue keys accepted by get_issues_by_keys (e.g., 'AP-123')
+ISSUE_KEY_PATTERN = re.compile(r'^[A-Z][A-Z0-9_]*-\d+$')
+
+# Longest JQL query the client sends (also bounds key batches when JQL validation is off)
+DEFAULT_MAX_QUERY_LENGTH = 2000
+
+
+def build_key_batches(keys: List[str], max_length: int = DEFAULT_MAX_QUERY_LENGTH,
+                      batch_size: int = 100) -> List[str]:
+    """
+    Split issue keys into 'key in (...)' JQL queries.
+
+    Args:
+        keys: Issue keys (already validated and de-duplicated)
+        max_length: Longest JQL query allowed
+        batch_size: Most keys in one query
+
+    Returns:
+        JQL queries, each within max_length and batch_size, covering every key once
+    """
+    prefix, suffix = 'key in (', ')'
+    batches = []
+    batch: List[str] = []
+    length = len(prefix) + len(suffix)
+    for key in keys:
+        # Keys after the first are preceded by ', '
+        added = len(key) + (2 if batch else 0)
+        if batch and (length + added > max_length or len(batch) >= batch_size):
+            batches.append(prefix + ', '.join(batch) + suffix)
+            batch = []
+            length = len(prefix) + len(suffix)
+            added = len(key)
+        batch.append(key)
+        length += added
+    if batch:
+        batches.append(prefix + ', '.join(batch) + suffix)
+    return batches
+
+
 class JiraApiClient:
-    def __init__(self, base_url: str = "https://projects.tmforum.org/jira/", 
+    def __init__(self, base_url: Optional[str] = None, 
                  enable_jql_validation: bool = True,
-                 allowed_projects: Optional[List[str]] = None):
+                 allowed_projects: Optional[List[str]] = None,
+                 transport: Optional[HttpTransport] = None,
+                 max_concurrent_requests: Optional[int] = None,
+                 session_manager: Optional[JiraSessionManager] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 recorder: Optional[RequestRecorder] = None):
+        base_url = base_url or os.getenv('JIRA_BASE_URL') or DEFAULT_BASE_URL
+        
         # Validate base URL
         if not base_url or not base_url.startswith(('http://', 'https://')):
             raise JiraConfigurationError(
@@ -55,14 +143,39 @@ class JiraApiClient:
         self.base_url = base_url.rstrip('/')
         self.api_base = f"{self.base_url}/rest/api/2"
         self.cookies: Dict[str, str] = {}
-        self.session = requests.Session()
+        
+        # Session cookies are shared by every client in the process, so a login
+        # (or a refresh after the session expires) happens once for all of them
+        self.session = session_manager or get_session_manager()
+        self._cookie_generation: Optional[int] = None
+        
+        # HTTP transport (aiohttp when available, requests otherwise); clients
+        # without their own transport share the session's connection pool
+        self._shared_transport = transport is None
+        self.transport = transport or self.session.acquire_transport()
+        
+        # Optional cap on in-flight requests shared by all concurrent callers
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._request_slots_loop = None
+        
+        # One token bucket paces every request from this client, learning the
+        # rate JIRA sustains from its 429s and response times
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter.from_config()
+        
+        # Optional recorder capturing every request/response pair for offline replay
+        self.recorder = recorder
+        
+        # Per-endpoint latency, bytes, retries and backoff, exported at the end of a run
+        self.metrics = RequestMetrics()
+        self.metrics.rate_limiter = self.rate_limiter
         
         # Initialize JQL validator
         self.enable_jql_validation = enable_jql_validation
         if enable_jql_validation:
             self.jql_validator = JQLValidator(
                 allowed_projects=set(allowed_projects) if allowed_projects else {'AP'},
-                max_query_length=2000,  # Reasonable limit for JQL queries
+                max_query_length=DEFAULT_MAX_QUERY_LENGTH,
             )
         else:
             self.jql_validator = None
@@ -84,7 +197,7 @@ class JiraApiClient:
                     proxies['https'] = https_proxy
                 elif http_proxy:
                     proxies['https'] = http_proxy
-                self.session.proxies = proxies
+                self.transport.set_proxies(proxies)
         except Exception as e:
             raise JiraConfigurationError(
                 f"Failed to configure proxy settings: {e}",
@@ -93,7 +206,11 @@ class JiraApiClient:
     
     async def authenticate(self, force_refresh: bool = False) -> bool:
         """
-        Authenticate with JIRA using the login bot
+        Authenticate with JIRA using the shared session.
+        
+        Cookies that passed a session check within the validation TTL are used
+        without any request. Otherwise a single /myself request checks them,
+        and rejected cookies are replaced by one fresh login.
         
         Args:
             force_refresh: Force a fresh login even if cookies exist
@@ -107,91 +224,54 @@ class JiraApiClient:
             JiraNetworkError: If network issues occur
         """
         try:
-            login_bot = JiraLoginBot(headless=False)
-            self.cookies = await login_bot.get_cookies(force_refresh=force_refresh)
+            self.cookies = await self.session.get_cookies(
+                force_refresh=force_refresh, seen_generation=self._cookie_generation
+            )
+            self._cookie_generation = self.session.generation
             
             if not self.cookies:
                 raise JiraAuthenticationError("Failed to obtain authentication cookies")
             
-            # Update session cookies with proper domain and path
-            for name, value in self.cookies.items():
-                self.session.cookies.set(
-                    name=name, 
-                    value=value, 
-                    domain='.tmforum.org',  # Set domain explicitly
-                    path='/'
-                )
-                print(f"[DEBUG] Set cookie {name}: {value[:20]}...")
-            
-            # Test authentication using a simple query that we know should work
+            # Update transport cookies with proper domain and path
+            self.transport.set_cookies(self.cookies, domain=self._cookie_domain())
+            logger.debug("Set cookies: %s", ', '.join(self.cookies))
+            
+            # Fast path: a recent check of these same cookies (this run or an earlier one) still holds
+            if self.session.is_validated(self._cookie_generation):
+                user_data = self.session.validated_user or {}
+                print(f"[AUTH] Session validated recently - skipping the authentication check "
+                      f"({user_data.get('displayName', 'Unknown')})")
+                return True
+            
+            # Otherwise one lightweight request confirms the cookies and identifies the user
             try:
-                print(f"[DEBUG] Testing authentication with {len(self.cookies)} cookies")
-                print(f"[DEBUG] Key cookies: JSESSIONID={'✓' if 'JSESSIONID' in self.cookies else '✗'}, XSRF={'✓' if any('xsrf' in k.lower() for k in self.cookies.keys()) else '✗'}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Checking session with %d cookies (JSESSIONID=%s, XSRF=%s)", len(self.cookies),
+                                 'JSESSIONID' in self.cookies,
+                                 any('xsrf' in name.lower() for name in self.cookies))
                 
-                # Test with a simple project query - this should work if we're authenticated
-                # Using a basic JQL search that returns minimal results
-                test_jql = "project = AP ORDER BY updated DESC"
-                test_params = {
-                    'jql': test_jql,
-                    'maxResults': 1,  # Just need to know if the query works
-                    'fields': 'key'  # Minimal fields
-                }
-                
-                print(f"[DEBUG] Testing authentication with JQL search...")
-                response = self._make_request('GET', '/search', params=test_params)
+                response = await self._make_request('GET', '/myself')
                 
                 if response.status_code == 200:
-                    print(f"[AUTH] Authentication successful - able to query JIRA")
-                    
-                    # Try to get user info as additional confirmation
-                    try:
-                        user_response = self._make_request('GET', '/myself')
-                        if user_response.status_code == 200:
-                            user_data = user_response.json()
-                            print(f"[AUTH] Authenticated as: {user_data.get('displayName', 'Unknown')} ({user_data.get('emailAddress', 'no email')})")
-                        else:
-                            print(f"[AUTH] Authenticated successfully (user info endpoint not accessible)")
-                    except Exception as e:
-                        print(f"[AUTH] Authenticated successfully (user info not available: {e})")
-                    
+                    user_data = response.json()
+                    self.session.mark_validated(self._cookie_generation, user_data)
+                    print(f"[AUTH] Authenticated as: {user_data.get('displayName', 'Unknown')} ({user_data.get('emailAddress', 'no email')})")
                     return True
-                    
-                elif response.status_code == 401:
-                    if not force_refresh:
-                        # Cookies expired, try fresh login
-                        print("[RETRY] Authentication failed (401), attempting fresh login...")
-                        return await self.authenticate(force_refresh=True)
-                    else:
-                        error_msg = f"Authentication failed even after fresh login - credentials may be invalid"
-                        raise JiraAuthenticationError(error_msg)
-                        
+                
+                self.session.invalidate(self._cookie_generation)
+                if response.status_code == 401:
+                    error_msg = "Authentication failed even after fresh login - credentials may be invalid"
                 elif response.status_code == 403:
-                    # Permission denied - might be a project-specific issue, try a different approach
-                    print(f"[DEBUG] Search returned 403, trying alternative authentication test...")
-                    
-                    # Try getting current user's dashboard as a fallback
-                    try:
-                        dash_response = self._make_request('GET', '/dashboard')
-                        if dash_response.status_code == 200:
-                            print(f"[AUTH] Authentication successful via dashboard check")
-                            return True
-                    except:
-                        pass
-                    
-                    if not force_refresh:
-                        print("[RETRY] Permission issues detected, attempting fresh login...")
-                        return await self.authenticate(force_refresh=True)
-                    else:
-                        error_msg = f"Authentication failed - insufficient permissions even after fresh login"
-                        raise JiraAuthenticationError(error_msg)
+                    error_msg = "Authentication failed - insufficient permissions even after fresh login"
                 else:
-                    error_msg = f"Authentication test failed with status {response.status_code}: {response.text[:200]}"
-                    print(f"[DEBUG] {error_msg}")
-                    if not force_refresh:
-                        print("[RETRY] Authentication test failed, attempting fresh login...")
-                        return await self.authenticate(force_refresh=True)
-                    else:
-                        raise JiraAuthenticationError(error_msg)
+                    error_msg = f"Authentication check failed with status {response.status_code}: {response.text[:200]}"
+                    logger.debug(error_msg)
+                
+                if not force_refresh:
+                    # Cookies rejected - log in again (shared with any other client doing the same)
+                    print(f"[RETRY] Session check failed ({response.status_code}), attempting fresh login...")
+                    return await self.authenticate(force_refresh=True)
+                raise JiraAuthenticationError(error_msg)
                     
             except JiraNetworkError as e:
                 raise JiraAuthenticationError(f"Network error during authentication test: {e}")
@@ -206,7 +286,49 @@ class JiraApiClient:
                 raise
             raise JiraAuthenticationError(f"Unexpected authentication error: {e}")
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+    def _cookie_domain(self) -> str:
+        """Cookie domain for the configured JIRA host"""
+        host = urlparse(self.base_url).hostname or ''
+        if host.endswith('tmforum.org'):
+            return '.tmforum.org'  # Share cookies across TM Forum subdomains
+        return host
+    
+    async def refresh_session(self) -> bool:
+        """
+        Replace expired session cookies, sharing one login with every other client and task.
+        
+        Returns:
+            bool: True if new cookies were obtained
+        """
+        print("[AUTH] Session expired - refreshing the shared JIRA session...")
+        self.session.invalidate(self._cookie_generation)
+        cookies = await self.session.get_cookies(force_refresh=True, seen_generation=self._cookie_generation)
+        self._cookie_generation = self.session.generation
+        if not cookies:
+            return False
+        
+        self.cookies = cookies
+        self.transport.set_cookies(cookies, domain=self._cookie_domain())
+        return True
+    
+    async def close(self) -> None:
+        """Close the HTTP transport (or release the shared one) and its pooled connections"""
+        if self._shared_transport:
+            await self.session.release_transport()
+        else:
+            await self.transport.close()
+    
+    def _get_request_slots(self) -> Optional[asyncio.Semaphore]:
+        """Semaphore limiting in-flight requests, created once per running event loop"""
+        if not self.max_concurrent_requests:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._request_slots is None or self._request_slots_loop is not loop:
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+            self._request_slots_loop = loop
+        return self._request_slots
+    
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> TransportResponse:
         """Make an authenticated request to JIRA API"""
         url = f"{self.api_base}{endpoint}"
         
@@ -216,7 +338,7 @@ class JiraApiClient:
         headers.update({
             'Accept': 'application/json,text/javascript,*/*;q=0.01',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'DNT': '1',
             'Connection': 'keep-alive',
@@ -243,21 +365,46 @@ class JiraApiClient:
                 xsrf_token = cookie_value
                 headers['X-Atlassian-Token'] = 'no-check'  # Common Atlassian header
                 headers['X-XSRF-TOKEN'] = xsrf_token
-                print(f"[DEBUG] Using XSRF token: {xsrf_token[:20]}...")
                 break
         
         kwargs['headers'] = headers
         
-        response = self.session.request(method, url, **kwargs)
+        # Wait for a token before taking a request slot, so throttled callers don't hold slots
+        await self.rate_limiter.acquire()
+        
+        request_slots = self._get_request_slots()
+        start_time = time.monotonic()
+        if request_slots is not None:
+            async with request_slots:
+                start_time = time.monotonic()
+                response = await self.transport.request(method, url, **kwargs)
+        else:
+            response = await self.transport.request(method, url, **kwargs)
+        
+        elapsed = time.monotonic() - start_time
+        self.rate_limiter.record_response(
+            response.status_code, elapsed, parse_retry_after(response.headers.get('Retry-After'))
+        )
+        self.metrics.record_response(endpoint, response, elapsed)
+        if self.recorder is not None:
+            self.recorder.record(method, endpoint, kwargs.get('params'), kwargs.get('json'), response, elapsed)
         
         if response.status_code == 401:
-            print("[WARNING] Authentication may have expired. Consider refreshing cookies.")
+            logger.warning("Authentication may have expired. Consider refreshing cookies.")
         elif response.status_code >= 400:
-            print(f"[WARNING] API request failed: {response.status_code} - {response.text[:200]}...")
+            logger.warning("API request failed: %s %s -> %d - %.200s", method, endpoint,
+                           response.status_code, response.text)
+        else:
+            logger.debug("%s %s -> %d in %.3fs", method, endpoint, response.status_code, elapsed)
         
         return response
     
-    async def _make_request_with_retry(self, method: str, endpoint: str, max_retries: int = 3, **kwargs) -> requests.Response:
+    async def _backoff(self, endpoint: str, wait_time: float) -> None:
+        """Sleep before retrying a request, recording the retry and the time slept"""
+        self.metrics.record_retry(endpoint, wait_time)
+        await asyncio.sleep(wait_time)
+    
+    async def _make_request_with_retry(self, method: str, endpoint: str, max_retries: int = 3, **kwargs) -> TransportResponse:
         """
         Make an authenticated request to JIRA API with retry logic and exponential backoff
         
@@ -268,7 +415,7 @@ class JiraApiClient:
             **kwargs: Additional arguments for the request
             
         Returns:
-            requests.Response: Response object
+            TransportResponse: Response object
             
         Raises:
             JiraNetworkError: For network/connection issues
@@ -276,19 +423,21 @@ class JiraApiClient:
             JiraPermissionError: For permission denied (403) responses
             JiraApiError: For other API errors
         """
-        import asyncio
-        import time
-        
         last_exception = None
+        session_refreshed = False
         
         for attempt in range(max_retries + 1):
             try:
-                response = self._make_request(method, endpoint, **kwargs)
+                response = await self._make_request(method, endpoint, **kwargs)
                 
                 # Check for specific HTTP status codes
                 if response.status_code == 200:
                     return response
                 elif response.status_code == 401:
+                    # Refresh the session once (coalesced with any other task that hit the same expiry)
+                    if not session_refreshed and attempt < max_retries and await self.refresh_session():
+                        session_refreshed = True
+                        continue
                     raise JiraAuthenticationError("Authentication failed - invalid or expired credentials")
                 elif response.status_code == 403:
                     raise JiraPermissionError(
@@ -296,22 +445,41 @@ class JiraApiClient:
                         resource=f"{method} {endpoint}"
                     )
                 elif response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
                     if attempt < max_retries:
-                        print(f"[RATE-LIMIT] Rate limited, waiting {retry_after} seconds before retry {attempt + 1}/{max_retries}")
-                        await asyncio.sleep(retry_after)
+                        if self.rate_limiter.enabled:
+                            # The limiter has paused every caller until Retry-After and lowered
+                            # its rate; the retry simply queues for the next token
+                            logger.warning("Rate limited, retrying at %.1f req/s after %.0fs pause (retry %d/%d)",
+                                           self.rate_limiter.rate, self.rate_limiter.paused_for,
+                                           attempt + 1, max_retries)
+                            self.metrics.record_retry(endpoint)
+                        else:
+                            wait_time = 60 if retry_after is None else retry_after
+                            logger.warning("Rate limited, waiting %.0f seconds before retry %d/%d",
+                                           wait_time, attempt + 1, max_retries)
+                            await self._backoff(endpoint, wait_time)
                         continue
                     else:
                         raise JiraRateLimitError(
                             f"Rate limit exceeded for {method} {endpoint}",
-                            retry_after=retry_after
+                            retry_after=int(retry_after) if retry_after is not None else None
                         )
                 elif response.status_code >= 500:
+                    if attempt < max_retries and self.rate_limiter.enabled and \
+                            response.status_code in THROTTLE_STATUS_CODES:
+                        # A 503 already paused every caller in the limiter; no second backoff here
+                        logger.warning("Service unavailable, retrying at %.1f req/s after %.0fs pause (retry %d/%d)",
+                                       self.rate_limiter.rate, self.rate_limiter.paused_for,
+                                       attempt + 1, max_retries)
+                        self.metrics.record_retry(endpoint)
+                        continue
                     # Server error - retry with exponential backoff
                     if attempt < max_retries:
                         wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                        print(f"[RETRY] Server error ({response.status_code}), retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                        await asyncio.sleep(wait_time)
+                        logger.warning("Server error (%d), retrying in %ds (attempt %d/%d)",
+                                       response.status_code, wait_time, attempt + 1, max_retries)
+                        await self._backoff(endpoint, wait_time)
                         continue
                     else:
                         raise JiraNetworkError(
@@ -327,30 +495,33 @@ class JiraApiClient:
                     
             except requests.exceptions.ConnectionError as e:
                 last_exception = e
+                self.metrics.record_error(endpoint)
                 if attempt < max_retries:
                     wait_time = 2 ** attempt
-                    print(f"[NETWORK] Connection error, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
+                    logger.warning("Connection error (%s), retrying in %ds (attempt %d/%d)", e, wait_time, attempt + 1, max_retries)
+                    await self._backoff(endpoint, wait_time)
                     continue
                 else:
                     raise JiraNetworkError(f"Connection failed after {max_retries} retries: {e}")
                     
             except requests.exceptions.Timeout as e:
                 last_exception = e
+                self.metrics.record_error(endpoint)
                 if attempt < max_retries:
                     wait_time = 2 ** attempt
-                    print(f"[TIMEOUT] Request timeout, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
+                    logger.warning("Request timeout (%s), retrying in %ds (attempt %d/%d)", e, wait_time, attempt + 1, max_retries)
+                    await self._backoff(endpoint, wait_time)
                     continue
                 else:
                     raise JiraNetworkError(f"Request timeout after {max_retries} retries: {e}")
                     
             except requests.exceptions.RequestException as e:
                 last_exception = e
+                self.metrics.record_error(endpoint)
                 if attempt < max_retries:
                     wait_time = 2 ** attempt
-                    print(f"[REQUEST] Request error, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
+                    logger.warning("Request error (%s), retrying in %ds (attempt %d/%d)", e, wait_time, attempt + 1, max_retries)
+                    await self._backoff(endpoint, wait_time)
                     continue
                 else:
                     raise JiraNetworkError(f"Request failed after {max_retries} retries: {e}")
@@ -388,8 +559,44 @@ class JiraApiClient:
         except Exception as e:
             raise JiraApiError(f"Unexpected error getting project components: {e}")
 
+    def prepare_jql(self, jql: str, validate_jql: Optional[bool] = None) -> str:
+        """
+        Validate a search query and print its warnings, as search_issues does.
+
+        iter_search_pages runs its searches in a background task, so callers that
+        capture their output (e.g., one section of a concurrent run) validate the
+        query here first and then search with validate_jql=False.
+
+        Args:
+            jql: JIRA Query Language string
+            validate_jql: Override global JQL validation setting
+
+        Returns:
+            Sanitized query (the query unchanged when validation is off)
+
+        Raises:
+            JiraValidationError: If JQL query is invalid or fails security checks
+        """
+        should_validate = validate_jql if validate_jql is not None else self.enable_jql_validation
+        if not should_validate or not self.jql_validator:
+            return jql
+        try:
+            validation_result = self.jql_validator.validate_jql_query(jql, strict_mode=True)
+        except JiraValidationError as e:
+            print(f"[ERROR] JQL Validation Failed: {e}")
+            raise
+
+        # Log warnings if any
+        if validation_result['warnings']:
+            print(f"[WARNING] JQL Warnings: {', '.join(validation_result['warnings'])}")
+        if validation_result['performance_warnings']:
+            print(f"[PERFORMANCE] Performance Warnings: {', '.join(validation_result['performance_warnings'])}")
+
+        # Use sanitized query
+        return validation_result['sanitized_query']
+
     async def search_issues(self, jql: str, max_results: int = 50, start_at: int = 0, fields: Optional[List[str]] = None, 
-                          validate_jql: Optional[bool] = None) -> Dict[str, Any]:
+                          validate_jql: Optional[bool] = None, strict_query: bool = True) -> Dict[str, Any]:
         """
         Search for issues using JQL (JIRA Query Language)
         
@@ -399,6 +606,8 @@ class JiraApiClient:
             start_at: Starting index for pagination
             fields: List of fields to include in results
             validate_jql: Override global JQL validation setting
+            strict_query: When False, JIRA reports unknown values (e.g., issue keys that do
+                          not exist) as warnings instead of failing the search
             
         Returns:
             Dictionary containing search results
@@ -412,23 +621,7 @@ class JiraApiClient:
             raise JiraValidationError("JQL query cannot be empty", field_name="jql")
         
         # Apply JQL validation if enabled
-        should_validate = validate_jql if validate_jql is not None else self.enable_jql_validation
-        if should_validate and self.jql_validator:
-            try:
-                validation_result = self.jql_validator.validate_jql_query(jql, strict_mode=True)
-                
-                # Log warnings if any
-                if validation_result['warnings']:
-                    print(f"[WARNING] JQL Warnings: {', '.join(validation_result['warnings'])}")
-                if validation_result['performance_warnings']:
-                    print(f"[PERFORMANCE] Performance Warnings: {', '.join(validation_result['performance_warnings'])}")
-                
-                # Use sanitized query
-                jql = validation_result['sanitized_query']
-                
-            except JiraValidationError as e:
-                print(f"[ERROR] JQL Validation Failed: {e}")
-                raise
+        jql = self.prepare_jql(jql, validate_jql)
             
         if max_results <= 0:
             raise JiraValidationError("max_results must be greater than 0", field_name="max_results")
@@ -437,11 +630,7 @@ class JiraApiClient:
             raise JiraValidationError("start_at must be >= 0", field_name="start_at")
         
         if fields is None:
-            fields = [
-                'key', 'summary', 'status', 'assignee', 'created',
-                'updated', 'priority', 'issuetype', 'description',
-                'components', 'labels', 'reporter', 'resolution',
-                'comment', 'issuelinks', 'issues', 'fixVersions' ]
+            fields = DEFAULT_SEARCH_FIELDS
         
         params = {
             'jql': jql,
@@ -449,6 +638,8 @@ class JiraApiClient:
             'startAt': start_at,
             'fields': ','.join(fields)
         }
+        if not strict_query:
+            params['validateQuery'] = 'false'
         
         try:
             response = await self._make_request_with_retry('GET', '/search', params=params)
@@ -458,8 +649,161 @@ class JiraApiClient:
             raise
         except Exception as e:
             raise JiraApiError(f"Unexpected error during issue search: {e}")
-    
-    async def get_ap_issues_last_month(self, max_results: int = 100) -> List[Dict[str, Any]]:
+
+    async def iter_search_pages(self, jql: str, page_size: int = 100, fields: Optional[List[str]] = None,
+                                validate_jql: Optional[bool] = None,
+                                strict_query: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Walk every page of a JQL search, yielding one search result page at a time.
+
+        The request for the next page is started before the current page is
+        yielded, so it downloads while the caller processes the current one.
+        At most two pages are held in memory at any time.
+
+        Args:
+            jql: JIRA Query Language string
+            page_size: Number of issues to request per page
+            fields: List of fields to include in results
+            validate_jql: Override global JQL validation setting (applied to the first page only)
+            strict_query: When False, JIRA reports unknown values as warnings instead of failing
+
+        Yields:
+            Search result dictionaries as returned by search_issues ('issues', 'total', 'startAt', ...)
+
+        Raises:
+            JiraValidationError: If JQL query is invalid or page_size is invalid
+            JiraApiError: For API-related errors
+            JiraNetworkError: For network issues
+        """
+        if page_size <= 0:
+            raise JiraValidationError("page_size must be greater than 0", field_name="page_size")
+
+        start_at = 0
+        pending = asyncio.ensure_future(
+            self.search_issues(jql, max_results=page_size, start_at=start_at, fields=fields,
+                               validate_jql=validate_jql, strict_query=strict_query)
+        )
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+
+                issues = page.get('issues', [])
+                total = page.get('total', 0)
+                # JIRA may return fewer issues than requested, so advance by what we actually got
+                start_at += len(issues)
+
+                if issues and start_at < total:
+                    # Prefetch the next page; the query was already validated on the first request
+                    pending = asyncio.ensure_future(
+                        self.search_issues(jql, max_results=page_size, start_at=start_at, fields=fields,
+                                           validate_jql=False, strict_query=strict_query)
+                    )
+
+                yield page
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def iter_issues(self, jql: str, page_size: int = 100, fields: Optional[List[str]] = None,
+                          validate_jql: Optional[bool] = None,
+                          strict_query: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every issue matching a JQL query, fetching pages on demand.
+
+        Args:
+            jql: JIRA Query Language string
+            page_size: Number of issues to request per page
+            fields: List of fields to include in results
+            validate_jql: Override global JQL validation setting
+            strict_query: When False, JIRA reports unknown values as warnings instead of failing
+
+        Yields:
+            Raw issue dictionaries from the search results
+        """
+        async for page in self.iter_search_pages(jql, page_size=page_size, fields=fields, validate_jql=validate_jql,
+                                                 strict_query=strict_query):
+            for issue in page.get('issues', []):
+                yield issue
+
+    async def get_issues_by_keys(self, keys: List[str], fields: Optional[List[str]] = None,
+                                 cache=None, batch_size: int = 100) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch a set of issues by key (e.g., linked issues or the parents of sub-tasks).
+
+        Keys are de-duplicated, looked up in the cache first, and the rest are
+        fetched with 'key in (...)' searches kept within the JQL length limit.
+        The batches run concurrently (paced by the rate limiter). Keys that do
+        not exist or are not visible are left out of the result.
+
+        Args:
+            keys: Issue keys (e.g., ['AP-1', 'AP-2'])
+            fields: List of fields to include in results
+            cache: Issues already available locally: an IssueStore, or a dictionary
+                   of key -> raw issue
+            batch_size: Most keys in one search
+
+        Returns:
+            Dictionary of key -> raw issue, in the order the keys were given
+
+        Raises:
+            JiraValidationError: If a key is malformed or in a project that is not allowed
+            JiraApiError: For API-related errors
+            JiraNetworkError: For network issues
+        """
+        if batch_size <= 0:
+            raise JiraValidationError("batch_size must be greater than 0", field_name="batch_size")
+
+        # Keys are case-insensitive in JIRA; validate them before they go into the JQL
+        unique_keys = list(dict.fromkeys(key.strip().upper() for key in keys if key and key.strip()))
+        for key in unique_keys:
+            if not ISSUE_KEY_PATTERN.match(key):
+                raise JiraValidationError(f"Invalid issue key: {key}", field_name="keys", invalid_value=key)
+        if self.enable_jql_validation and self.jql_validator and self.jql_validator.allowed_projects:
+            allowed = {project.upper() for project in self.jql_validator.allowed_projects}
+            for key in unique_keys:
+                if key.rsplit('-', 1)[0] not in allowed:
+                    raise JiraValidationError(
+                        f"Access denied to project of issue '{key}'. Allowed projects: {self.jql_validator.allowed_projects}",
+                        field_name="keys",
+                        invalid_value=key
+                    )
+
+        found: Dict[str, Dict[str, Any]] = {}
+        if cache is not None:
+            if hasattr(cache, 'get_issues'):
+                found.update(cache.get_issues(unique_keys))
+            else:
+                found.update((key, cache[key]) for key in unique_keys if key in cache)
+        missing = [key for key in unique_keys if key not in found]
+        cached = len(found)
+
+        if missing:
+            max_length = self.jql_validator.max_query_length if self.jql_validator else DEFAULT_MAX_QUERY_LENGTH
+            batches = build_key_batches(missing, max_length=max_length, batch_size=batch_size)
+
+            async def fetch_batch(jql: str) -> List[Dict[str, Any]]:
+                # Non-strict, so one deleted or hidden key does not fail the whole batch
+                return [issue async for issue in self.iter_issues(jql, page_size=batch_size, fields=fields,
+                                                                 strict_query=False)]
+
+            tasks = [asyncio.ensure_future(fetch_batch(jql)) for jql in batches]
+            try:
+                for issues in await asyncio.gather(*tasks):
+                    for issue in issues:
+                        found[issue.get('key', '').upper()] = issue
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+                # Wait for the cancelled batches so no task or exception is left unretrieved
+                await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info("Fetched %d of %d issues in %d searches (%d more from cache)",
+                        len(found) - cached, len(missing), len(batches), cached)
+
+        return {key: found[key] for key in unique_keys if key in found}
+
+    async def get_ap_issues_last_month(self, max_results: int = 100) -> List[ProcessedIssue]:
         """
         Get all issues from AP project created in the last month
         
@@ -467,7 +811,7 @@ class JiraApiClient:
             max_results: Maximum number of results to return
             
         Returns:
-            List of processed issue dictionaries
+            List of ProcessedIssue objects
             
         Raises:
             JiraValidationError: If max_results is invalid
@@ -515,47 +859,20 @@ class JiraApiClient:
                     print(f"Raw Issue:\n{safe_encode_for_cp1252(issue_json)}")
                 except Exception as e:
                     print(f"[WARNING] Could not serialize issue JSON: {e}")
-                fields = issue.get('fields', {})
-                # Process comments first
-                comment_data = []
-                comment_count = fields.get('comment', {}).get('total', 0) if fields.get('comment') else 0
+                processed_issue = ProcessedIssue.from_raw(issue, self.base_url, raw_fields=())
                 
+                comment_count = processed_issue['comment_count']
                 if comment_count > 0:
                     print(f"[COMMENTS] Found {comment_count} comments:")
-                    comments = fields.get('comment', {}).get('comments', [])                
-                    for comment in comments:
-                        comment_info = {
-                            'author': comment.get('author', {}).get('displayName', 'Unknown'),
-                            'author_email': comment.get('author', {}).get('emailAddress', ''),
-                            'created': comment.get('created'),
-                            'updated': comment.get('updated'),
-                            'body': comment.get('body', '')
-                        }
-                        comment_data.append(comment_info)
-                        
+                    for comment_info in processed_issue['comments']:
                         # Print comment for debugging
                         print(f"  Comment by {safe_encode_for_cp1252(comment_info['author'])} at {comment_info['created']}:")
                         print(f"    {safe_encode_for_cp1252(comment_info['body'][:100])}...")
                         print()
-
-                processed_issue = {
-                    'key': issue.get('key'),
-                    'summary': fields.get('summary'),
-                    'status': fields.get('status', {}).get('name') if fields.get('status') else None,
-                    'assignee': fields.get('assignee', {}).get('displayName') if fields.get('assignee') else 'Unassigned',
-                    'reporter': fields.get('reporter', {}).get('displayName') if fields.get('reporter') else 'Unassigned',
-                    'priority': fields.get('priority', {}).get('name') if fields.get('priority') else None,
-                    'issue_type': fields.get('issuetype', {}).get('name') if fields.get('issuetype') else None,
-                    'comment_count': comment_count,
-                    'comments': comment_data,  # Add the collected comments
-                    'created': fields.get('created'),
-                    'updated': fields.get('updated'),
-                    'url': f"{self.base_url}/browse/{issue.get('key')}"
-                }
                 
                 processed_issues.append(processed_issue)
                 try:
-                    processed_json = json.dumps(processed_issue, indent=2, ensure_ascii=True)
+                    processed_json = json.dumps(processed_issue.to_dict(), indent=2, ensure_ascii=True, default=str)
                     print(f"Processed Issue:\n{safe_encode_for_cp1252(processed_json)}")
                 except Exception as e:
                     print(f"[WARNING] Could not serialize processed issue JSON: {e}")
@@ -610,6 +927,10 @@ class JiraApiClient:
             JiraNetworkError: For network issues
             JiraAuthenticationError: If not authenticated
         """
+        # The session check already fetched /myself for these cookies
+        if self.session.is_validated(self._cookie_generation) and self.session.validated_user:
+            return self.session.validated_user
+        
         try:
             # Try /myself endpoint first
             response = await self._make_request_with_retry('GET', '/myself')
@@ -733,11 +1054,14 @@ async def get_ap_issues_quick() -> List[Dict[str, Any]]:
     """Quick function to get AP issues - handles authentication automatically"""
     client = JiraApiClient()
     
-    if await client.authenticate():
-        return await client.get_ap_issues_last_month()
-    else:
-        print("[ERROR] Failed to authenticate with JIRA")
-        return []
+    try:
+        if await client.authenticate():
+            return await client.get_ap_issues_last_month()
+        else:
+            print("[ERROR] Failed to authenticate with JIRA")
+            return []
+    finally:
+        await client.close()
 
 
 if __name__ == "__main__":
@@ -764,6 +1088,8 @@ if __name__ == "__main__":
                 print("[ERROR] No issues found or error occurred")
         else:
             print("[ERROR] Authentication failed")
+        
+        await client.close()
     
     # Run the example
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+Record JIRA API request/response pairs to disk for offline replay.
+
+A JiraApiClient created with a RequestRecorder writes every request it makes,
+with the response it got, as one JSON line:
+
+    {"method": "GET", "endpoint": "/search", "params": {...}, "json": null,
+     "status": 200, "headers": {"Content-Type": "application/json"},
+     "body": "{...}", "elapsed": 0.412}
+
+Request headers and cookies are never recorded. jira_stub.py replays a
+recording, so the checks can run against the same responses without JIRA.
+
+Usage:
+    python check_issues.py --record jira_recording.jsonl
+    python jira_stub.py --replay jira_recording.jsonl
+"""
+
+import json
+import threading
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from http_transport import TransportResponse
+
+
+# Response headers worth keeping (everything else is connection detail or session state)
+RECORDED_HEADERS = ('Content-Type', 'Retry-After')
+
+
+def request_key(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, str, str]:
+    """
+    Key identifying a request for replay.
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint relative to /rest/api/2 (e.g., '/search')
+        params: Query parameters
+
+    Returns:
+        (method, endpoint, canonical params) tuple
+    """
+    canonical_params = json.dumps({name: str(value) for name, value in (params or {}).items()}, sort_keys=True)
+    return method.upper(), endpoint, canonical_params
+
+
+class RequestRecorder:
+    """
+    Appends request/response pairs to a JSON lines file.
+
+    Example:
+        recorder = RequestRecorder.open('jira_recording.jsonl')
+        client = JiraApiClient(recorder=recorder)
+        ...
+        recorder.close()
+    """
+
+    def __init__(self, out: TextIO, close_stream: bool = False):
+        """
+        Args:
+            out: Text stream the records are written to
+            close_stream: Close the stream in close()
+        """
+        self.out = out
+        self.close_stream = close_stream
+        self.records = 0
+        # Records may come from the transport's worker threads as well as the event loop
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: str) -> 'RequestRecorder':
+        """Create a recorder writing to a new file at path"""
+        return cls(open(path, 'w', encoding='utf-8'), close_stream=True)
+
+    def record(self, method: str, endpoint: str, params: Optional[Dict[str, Any]], json_body: Any,
+               response: TransportResponse, elapsed: float) -> None:
+        """
+        Write one request and its response.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint relative to /rest/api/2
+            params: Query parameters
+            json_body: JSON request body
+            response: Response received
+            elapsed: Seconds the request took
+        """
+        record = {
+            'method': method.upper(),
+            'endpoint': endpoint,
+            'params': {name: str(value) for name, value in (params or {}).items()},
+            'json': json_body,
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            'body': response.content.decode('utf-8', errors='replace'),
+            'elapsed': round(elapsed, 4)
+        }
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self.out.write(line + '\n')
+            self.records += 1
+
+    def close(self) -> None:
+        self.out.flush()
+        if self.close_stream:
+            self.out.close()
+
+
+def read_recordings(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read the records of a recording file.
+
+    Args:
+        path: File written by RequestRecorder
+
+    Yields:
+        Record dictionaries, in the order they were recorded
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def load_recordings(path: str) -> Dict[Tuple[str, str, str], List[Dict[str, Any]]]:
+    """
+    Load a recording indexed for replay.
+
+    Args:
+        path: File written by RequestRecorder
+
+    Returns:
+        request_key() -> records for that request, in the order they were recorded
+    """
+    recordings: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+    for record in read_recordings(path):
+        key = request_key(record['method'], record['endpoint'], record.get('params'))
+        recordings.setdefault(key, []).append(record)
+    return recordings
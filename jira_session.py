@@ -0,0 +1,296 @@
+"""
+Process-wide JIRA session shared by every JiraApiClient.
+
+Logging in to JIRA drives a real browser, so it must not happen once per client
+or once per failing request. The session manager holds the session cookies for
+the whole process: it loads jira_cookies.json once, tracks when the session
+cookies expire, and runs the login bot under a lock, so any number of clients
+and concurrent tasks that find the session expired wait for one shared refresh.
+
+Whether the cookies work is checked against JIRA at most once per
+``validation_ttl_seconds``: the verdict (with the user it identified) is kept
+in a small cache file keyed by a hash of the cookies, so a warm start of
+check_issues.py needs no authentication requests at all.
+
+It also owns one pooled HTTP transport that clients created without their own
+transport share, instead of each opening a separate connection pool.
+
+Usage:
+    session = get_session_manager()
+    cookies = await session.get_cookies()
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+from http_transport import HttpTransport, create_transport
+from login import SESSION_COOKIE_MARKERS, JiraLoginBot, read_cookie_file
+from rule_config import get_authentication_config
+
+
+class JiraSessionManager:
+    """
+    Session cookies and pooled HTTP transport shared by all JIRA clients.
+
+    Every change of cookies bumps ``generation``. A client that finds its
+    cookies rejected asks for a refresh with the generation it was using; if
+    another task has refreshed in the meantime, the newer cookies are returned
+    without logging in again.
+    """
+
+    def __init__(self, cookie_file: Optional[str] = None, headless: Optional[bool] = None,
+                 expiry_margin_seconds: Optional[float] = None, validation_ttl_seconds: Optional[float] = None,
+                 validation_cache_file: Optional[str] = None):
+        """
+        Args:
+            cookie_file: File the session cookies are saved to
+                         (default: the authentication 'cookie_file' setting)
+            headless: Run the login browser without a window
+                      (default: the authentication 'headless_login' setting)
+            expiry_margin_seconds: Treat cookies as expired this long before they do
+                                   (default: the authentication 'expiry_margin_seconds' setting)
+            validation_ttl_seconds: How long a successful session check is trusted
+                                    (default: the authentication 'validation_ttl_seconds' setting)
+            validation_cache_file: File the last session check is kept in, or '' for none
+                                   (default: the authentication 'validation_cache_file' setting)
+        """
+        config = get_authentication_config()
+        self.cookie_file = cookie_file or config.get('cookie_file', 'jira_cookies.json')
+        self.headless = config.get('headless_login', True) if headless is None else headless
+        self.reuse_browser = config.get('reuse_login_browser', True)
+        self.browser_profile_dir = config.get('browser_profile_dir', '.jira_browser_profile')
+        if expiry_margin_seconds is None:
+            expiry_margin_seconds = config.get('expiry_margin_seconds', 300)
+        self.expiry_margin_seconds = expiry_margin_seconds
+        if validation_ttl_seconds is None:
+            validation_ttl_seconds = config.get('validation_ttl_seconds', 900)
+        self.validation_ttl_seconds = validation_ttl_seconds
+        if validation_cache_file is None:
+            validation_cache_file = config.get('validation_cache_file', 'jira_session_check.json')
+        self.validation_cache_file = validation_cache_file
+
+        self.cookies: Dict[str, str] = {}
+        self.cookie_expiry: Dict[str, float] = {}
+        self.generation = 0
+
+        # Last successful session check: cookie generation, time and the user it identified
+        self.validated_generation: Optional[int] = None
+        self.validated_at: Optional[float] = None
+        self.validated_user: Optional[Dict[str, Any]] = None
+
+        self._login_bot: Optional[JiraLoginBot] = None
+        self._cookie_file_loaded = False
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop = None
+        self._transport: Optional[HttpTransport] = None
+        self._transport_users = 0
+
+    def _get_login_bot(self) -> JiraLoginBot:
+        """The login bot, created on first use"""
+        if self._login_bot is None:
+            self._login_bot = JiraLoginBot(
+                headless=self.headless,
+                cookie_file=self.cookie_file,
+                reuse_browser=self.reuse_browser,
+                profile_dir=self.browser_profile_dir
+            )
+        return self._login_bot
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Lock serializing logins, created once per running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Unix time the first session cookie expires, or None if none has an expiry"""
+        expiries = [
+            expires for name, expires in self.cookie_expiry.items()
+            if expires and expires > 0 and any(marker in name.lower() for marker in SESSION_COOKIE_MARKERS)
+        ]
+        return min(expiries) if expiries else None
+
+    def cookies_expired(self, now: Optional[float] = None) -> bool:
+        """Whether the session cookies have expired (or are about to)"""
+        expires_at = self.expires_at
+        if expires_at is None:
+            return False
+        now = time.time() if now is None else now
+        return now >= expires_at - self.expiry_margin_seconds
+
+    def _has_usable_cookies(self) -> bool:
+        return bool(self.cookies) and not self.cookies_expired()
+
+    def _set_cookies(self, cookies: Dict[str, str], cookie_expiry: Dict[str, float]) -> None:
+        self.cookies = dict(cookies)
+        self.cookie_expiry = dict(cookie_expiry or {})
+        self.generation += 1
+        self.validated_generation = None
+        self.validated_at = None
+        self.validated_user = None
+        self._load_validation()
+
+    async def get_cookies(self, force_refresh: bool = False, seen_generation: Optional[int] = None) -> Dict[str, str]:
+        """
+        Get the session cookies, logging in only when there are no usable ones.
+
+        Args:
+            force_refresh: The caller's cookies were rejected; log in again
+            seen_generation: Generation of the rejected cookies. If the cookies
+                             have changed since, they are returned without a login.
+
+        Returns:
+            Cookie name -> value (empty if the login captured none)
+
+        Raises:
+            JiraAuthenticationError: If the login fails
+            JiraConfigurationError: If the JIRA credentials are missing
+        """
+        if not force_refresh and self._has_usable_cookies():
+            return self.cookies
+
+        async with self._get_lock():
+            if force_refresh and seen_generation is not None and seen_generation != self.generation:
+                # Another task refreshed the session while this one waited
+                return self.cookies
+            if not force_refresh and self._has_usable_cookies():
+                return self.cookies
+
+            if not force_refresh and not self._cookie_file_loaded:
+                # Saved cookies need no login bot (nor credentials) unless they have expired
+                self._cookie_file_loaded = True
+                cookies, cookie_expiry = read_cookie_file(self.cookie_file)
+                if cookies:
+                    print(f"Cookies loaded from {self.cookie_file}")
+                    self._set_cookies(cookies, cookie_expiry)
+                    if not self.cookies_expired():
+                        return self.cookies
+                    print("[AUTH] Saved session cookies have expired, logging in again...")
+
+            login_bot = self._get_login_bot()
+            cookies = await login_bot.login_and_capture_cookies()
+            self._set_cookies(cookies or {}, login_bot.cookie_expiry)
+            return self.cookies
+
+    def _cookie_fingerprint(self) -> str:
+        """Hash identifying the current cookies (the cookies themselves are not cached)"""
+        return hashlib.sha256(json.dumps(self.cookies, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _load_validation(self) -> None:
+        """Reuse a recent session check of these same cookies from an earlier run"""
+        if not self.validation_cache_file or not self.validation_ttl_seconds or not self.cookies:
+            return
+        try:
+            with open(self.validation_cache_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if saved.get('cookie_fingerprint') != self._cookie_fingerprint():
+            return
+        self.validated_generation = self.generation
+        self.validated_at = saved.get('validated_at')
+        self.validated_user = saved.get('user')
+
+    def _save_validation(self) -> None:
+        if not self.validation_cache_file or not self.validation_ttl_seconds:
+            return
+        saved = {
+            'cookie_fingerprint': self._cookie_fingerprint(),
+            'validated_at': self.validated_at,
+            'user': self.validated_user
+        }
+        try:
+            with open(self.validation_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(saved, f, indent=2)
+        except OSError as e:
+            print(f"[WARNING] Could not save the session check to {self.validation_cache_file}: {e}")
+
+    def is_validated(self, generation: Optional[int]) -> bool:
+        """Whether the cookies of this generation passed a session check within the validation TTL"""
+        if generation is None or generation != self.validated_generation or self.validated_at is None:
+            return False
+        if time.time() - self.validated_at >= self.validation_ttl_seconds:
+            return False
+        return self._has_usable_cookies()
+
+    def mark_validated(self, generation: Optional[int], user_info: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record that the cookies of this generation were accepted by JIRA.
+
+        Args:
+            generation: Cookie generation that was checked
+            user_info: User the check identified (e.g., from /myself), reused by later runs
+        """
+        if generation != self.generation:
+            return
+        self.validated_generation = generation
+        self.validated_at = time.time()
+        self.validated_user = user_info
+        self._save_validation()
+
+    def invalidate(self, generation: Optional[int]) -> None:
+        """Forget the session check of this generation after JIRA rejected its cookies"""
+        if generation != self.validated_generation:
+            return
+        self.validated_generation = None
+        self.validated_at = None
+        self.validated_user = None
+        if self.validation_cache_file and os.path.exists(self.validation_cache_file):
+            try:
+                os.remove(self.validation_cache_file)
+            except OSError:
+                pass
+
+    def acquire_transport(self) -> HttpTransport:
+        """Get the shared pooled transport (release it with release_transport)"""
+        if self._transport is None:
+            self._transport = create_transport()
+        self._transport_users += 1
+        return self._transport
+
+    async def release_transport(self) -> None:
+        """Release the shared transport, closing it (and the login browser) when its last user is done"""
+        self._transport_users = max(self._transport_users - 1, 0)
+        if self._transport_users == 0:
+            if self._transport is not None:
+                await self._transport.close()
+                self._transport = None
+            if self._login_bot is not None:
+                await self._login_bot.close()
+
+
+# Global variable holding the process-wide session manager
+_session_manager = None
+
+
+def get_session_manager() -> JiraSessionManager:
+    """Get the process-wide session manager, creating it on first use"""
+    global _session_manager
+    if _session_manager is None:
+        _session_manager = JiraSessionManager()
+    return _session_manager
+
+
+def configure_session_manager(**settings) -> JiraSessionManager:
+    """
+    Replace the process-wide session manager with one using other settings.
+
+    Must be called before any client is created (e.g., to use the cookie file
+    written by jira_stub.py).
+
+    Args:
+        **settings: JiraSessionManager arguments (cookie_file, headless, ...)
+
+    Returns:
+        The new session manager
+    """
+    global _session_manager
+    _session_manager = JiraSessionManager(**settings)
+    return _session_manager
@@ -0,0 +1,434 @@
+"""
+Local stand-in for the JIRA REST API, for offline, repeatable runs.
+
+The stub serves the endpoints JiraApiClient uses (/search, /myself,
+/project/{key}, /project/{key}/components, /session) from either:
+
+- a recording made with ``check_issues.py --record`` (see jira_recorder.py),
+  replayed request by request, or
+- N synthetic issues built from data/sample-epic.json, with issue types,
+  TMF references, assignees and dates varied deterministically (--seed).
+
+Searches are paged like JIRA (startAt/maxResults, capped at --max-page-size)
+and filtered on the project, issue type and ``key in (...)`` clauses of the
+JQL. Latency and 429 responses can be injected to exercise the client's
+retry and rate limiting.
+
+On start the stub writes a cookie file that JiraSessionManager loads, so no
+browser login is needed.
+
+Usage:
+    python jira_stub.py --issues 1000 --latency 50 --rate-limit 20
+    python check_issues.py --base-url http://127.0.0.1:8080/jira --cookie-file jira_stub_cookies.json
+"""
+
+import argparse
+import copy
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from jira_recorder import load_recordings, request_key
+
+
+SAMPLE_ISSUE_FILE = 'data/sample-epic.json'
+STUB_COOKIE_FILE = 'jira_stub_cookies.json'
+API_PREFIX = '/rest/api/2'
+
+# (name, id) of the issue types check_issues.py checks
+ISSUE_TYPES = [('Story', '10001'), ('Task', '3'), ('Bug', '1'), ('Epic', '6'), ('Sub-task', '5')]
+
+# Open statuses, so the synthetic issues pass the checks' status filter
+STATUSES = [('Open', '1'), ('In Progress', '3'), ('To Do', '10000')]
+
+TMF_APIS = [
+    ('TMF620', 'Product Catalog Management'), ('TMF622', 'Product Ordering Management'),
+    ('TMF629', 'Customer Management'), ('TMF632', 'Party Management'),
+    ('TMF637', 'Product Inventory Management'), ('TMF638', 'Service Inventory Management'),
+    ('TMF641', 'Service Ordering Management'), ('TMF666', 'Account Management'),
+    ('TMF678', 'Customer Bill Management'), ('TMF006', 'Capability Invocation Management')
+]
+
+VERSIONS = ['v4.0.0', 'v4.1.0', 'v5.0.0']
+
+STUB_USER = {
+    'name': 'stub.user@example.com',
+    'key': 'stub.user@example.com',
+    'emailAddress': 'stub.user@example.com',
+    'displayName': 'JIRA Stub User',
+    'active': True
+}
+
+_TYPE_PATTERN = re.compile(r'\b(?:issue)?type\s*=\s*"?([\w-]+)"?', re.IGNORECASE)
+_PROJECT_PATTERN = re.compile(r'\bproject\s*=\s*"?(\w+)"?', re.IGNORECASE)
+_KEYS_PATTERN = re.compile(r'\bkey\s+in\s*\(([^)]*)\)', re.IGNORECASE)
+
+
+def _jira_timestamp(moment: datetime) -> str:
+    """Format a datetime the way JIRA does (2025-08-20T14:49:22.823+0000)"""
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.') + f"{moment.microsecond // 1000:03d}+0000"
+
+
+class JiraStub:
+    """
+    Responses of the stand-in JIRA server.
+
+    Thread-safe: the HTTP server handles each request on its own thread.
+    """
+
+    def __init__(self, issues: int = 0, replay_file: Optional[str] = None, latency_ms: float = 0,
+                 jitter_ms: float = 0, max_page_size: int = 100, rate_limit: float = 0,
+                 throttle_every: int = 0, retry_after: float = 1, project_key: str = 'AP',
+                 sample_file: str = SAMPLE_ISSUE_FILE, seed: int = 0):
+        """
+        Args:
+            issues: Number of synthetic issues to serve
+            replay_file: Recording to replay (requests it lacks fall back to the synthetic issues)
+            latency_ms: Delay added to every response
+            jitter_ms: Random extra delay, up to this much
+            max_page_size: Most issues one search page returns
+            rate_limit: Requests per second allowed before answering 429 (0 for no limit)
+            throttle_every: Also answer every Nth request with 429 (0 for never)
+            retry_after: Retry-After seconds sent with a 429
+            project_key: Project the synthetic issues belong to
+            sample_file: Issue JSON the synthetic issues are built from
+            seed: Seed for the synthetic issue variations
+        """
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.max_page_size = max_page_size
+        self.rate_limit = rate_limit
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.project_key = project_key
+
+        self.recordings = load_recordings(replay_file) if replay_file else {}
+        self._replay_positions: Dict[Tuple[str, str, str], int] = {}
+
+        with open(sample_file, 'r', encoding='utf-8') as f:
+            self.template = json.load(f)
+        self.issues = self._synthesize(issues, seed)
+        self._search_cache: Dict[str, List[int]] = {}
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._recent_requests: deque = deque()
+        self.requests = 0
+        self.throttled = 0
+
+    def _synthesize(self, count: int, seed: int) -> List[Dict[str, Any]]:
+        """Per-issue variations; full issues are only built when a page is served"""
+        rng = random.Random(seed)
+        now = datetime.now(timezone.utc)
+        issues = []
+        for number in range(1, count + 1):
+            code, name = rng.choice(TMF_APIS)
+            created = now - timedelta(days=rng.randint(1, 400), seconds=rng.randint(0, 86399))
+            updated = min(created + timedelta(days=rng.randint(0, 200)), now)
+            issues.append({
+                'key': f"{self.project_key}-{number}",
+                'id': str(100000 + number),
+                'type': ISSUE_TYPES[number % len(ISSUE_TYPES)],
+                'status': rng.choice(STATUSES),
+                'summary': f"{code} {name} API {rng.choice(VERSIONS)}",
+                'description': (f"Work on the {code} {name} API." if rng.random() < 0.8 else None),
+                'assigned': rng.random() < 0.7,
+                'component': f"{code} {name}" if rng.random() < 0.5 else None,
+                'fix_version': rng.choice(VERSIONS) if rng.random() < 0.6 else None,
+                'created': _jira_timestamp(created),
+                'updated': _jira_timestamp(updated)
+            })
+        return issues
+
+    def _build_issue(self, variation: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        """Full issue JSON for one synthetic issue, limited to the requested fields"""
+        template_fields = self.template['fields']
+        wanted = fields if fields and '*all' not in fields else list(template_fields)
+        issue_fields = {name: copy.deepcopy(template_fields[name]) for name in wanted if name in template_fields}
+
+        overrides = {
+            'summary': variation['summary'],
+            'description': variation['description'],
+            'created': variation['created'],
+            'updated': variation['updated'],
+            'assignee': copy.deepcopy(template_fields.get('assignee')) if variation['assigned'] else None,
+            'components': [{'name': variation['component']}] if variation['component'] else [],
+            'fixVersions': [{'name': variation['fix_version'], 'archived': False, 'released': False}]
+                           if variation['fix_version'] else []
+        }
+        type_name, type_id = variation['type']
+        status_name, status_id = variation['status']
+        overrides['issuetype'] = {'id': type_id, 'name': type_name, 'subtask': type_name == 'Sub-task'}
+        overrides['status'] = {'id': status_id, 'name': status_name}
+        for name, value in overrides.items():
+            if name in issue_fields or name in wanted:
+                issue_fields[name] = value
+
+        return {
+            'expand': self.template.get('expand', ''),
+            'id': variation['id'],
+            'self': f"{API_PREFIX}/issue/{variation['id']}",
+            'key': variation['key'],
+            'fields': issue_fields
+        }
+
+    def iter_issues(self, fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Build every synthetic issue, as a search would return it.
+
+        Args:
+            fields: Fields to include (default: all fields of the sample issue)
+
+        Yields:
+            Raw issue dictionaries
+        """
+        for variation in self.issues:
+            yield self._build_issue(variation, fields)
+
+    def _matching_issues(self, jql: str) -> List[int]:
+        """Indexes of the synthetic issues a JQL query selects (project, type and key clauses only)"""
+        with self._lock:
+            cached = self._search_cache.get(jql)
+        if cached is not None:
+            return cached
+
+        project = _PROJECT_PATTERN.search(jql)
+        issue_type = _TYPE_PATTERN.search(jql)
+        keys = _KEYS_PATTERN.search(jql)
+        key_set = None
+        if keys:
+            key_set = {key.strip().strip('"\'') for key in keys.group(1).split(',')}
+
+        matches = []
+        if not project or project.group(1).upper() == self.project_key:
+            for index, variation in enumerate(self.issues):
+                if issue_type and variation['type'][0].lower() != issue_type.group(1).lower():
+                    continue
+                if key_set is not None and variation['key'] not in key_set:
+                    continue
+                matches.append(index)
+
+        with self._lock:
+            self._search_cache[jql] = matches
+        return matches
+
+    def _search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        matches = self._matching_issues(params.get('jql', ''))
+        start_at = max(int(params.get('startAt', 0)), 0)
+        max_results = min(max(int(params.get('maxResults', 50)), 0), self.max_page_size)
+        fields = [name for name in params.get('fields', '').split(',') if name] or None
+        page = [self._build_issue(self.issues[index], fields) for index in matches[start_at:start_at + max_results]]
+        return {
+            'expand': 'schema,names',
+            'startAt': start_at,
+            'maxResults': max_results,
+            'total': len(matches),
+            'issues': page
+        }
+
+    def _components(self) -> List[Dict[str, Any]]:
+        return [
+            {'id': str(20000 + position), 'name': f"{code} {name}"}
+            for position, (code, name) in enumerate(TMF_APIS)
+        ]
+
+    def _should_throttle(self) -> bool:
+        """Count the request and decide whether it gets a 429"""
+        now = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            if self.throttle_every and self.requests % self.throttle_every == 0:
+                self.throttled += 1
+                return True
+            if self.rate_limit:
+                while self._recent_requests and now - self._recent_requests[0] >= 1.0:
+                    self._recent_requests.popleft()
+                if len(self._recent_requests) >= self.rate_limit:
+                    self.throttled += 1
+                    return True
+                self._recent_requests.append(now)
+        return False
+
+    def _replay(self, method: str, endpoint: str, params: Dict[str, str]) -> Optional[Tuple[int, Dict[str, str], str]]:
+        """Next recorded response for a request (the last one repeats), or None if it was not recorded"""
+        key = request_key(method, endpoint, params)
+        records = self.recordings.get(key)
+        if not records:
+            return None
+        with self._lock:
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+        record = records[min(position, len(records) - 1)]
+        return record['status'], record.get('headers', {}), record.get('body', '')
+
+    def respond(self, method: str, path: str, query: str) -> Tuple[int, Dict[str, str], str]:
+        """
+        Response to one request.
+
+        Args:
+            method: HTTP method
+            path: Request path (anything before /rest/api/2 is ignored)
+            query: Raw query string
+
+        Returns:
+            (status, headers, body) tuple
+        """
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        if self._should_throttle():
+            return 429, {'Retry-After': f"{self.retry_after:g}"}, json.dumps(
+                {'errorMessages': ['Rate limit exceeded'], 'errors': {}})
+
+        if API_PREFIX in path:
+            endpoint = path[path.index(API_PREFIX) + len(API_PREFIX):] or '/'
+        else:
+            endpoint = path
+        params = dict(parse_qsl(query, keep_blank_values=True))
+
+        replayed = self._replay(method, endpoint, params)
+        if replayed is not None:
+            return replayed
+
+        json_headers = {'Content-Type': 'application/json;charset=UTF-8'}
+        if method == 'GET':
+            if endpoint == '/search':
+                return 200, json_headers, json.dumps(self._search(params))
+            if endpoint in ('/myself', '/session'):
+                return 200, json_headers, json.dumps(STUB_USER)
+            if endpoint == f"/project/{self.project_key}":
+                return 200, json_headers, json.dumps(self.template['fields'].get('project', {}))
+            if endpoint == f"/project/{self.project_key}/components":
+                return 200, json_headers, json.dumps(self._components())
+
+        return 404, json_headers, json.dumps({'errorMessages': [f"No stub response for {method} {endpoint}"], 'errors': {}})
+
+
+class JiraStubRequestHandler(BaseHTTPRequestHandler):
+    """Hands every request to the server's JiraStub"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        url = urlsplit(self.path)
+        status, headers, body = self.server.stub.respond(self.command, url.path, url.query)
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PUT = _handle
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def create_stub_server(stub: JiraStub, host: str = '127.0.0.1', port: int = 8080,
+                       verbose: bool = False) -> ThreadingHTTPServer:
+    """
+    Create an HTTP server answering with a JiraStub.
+
+    Args:
+        stub: Responses to serve
+        host: Interface to listen on
+        port: Port to listen on (0 picks a free port)
+        verbose: Log every request
+
+    Returns:
+        Server (call serve_forever(), or use serve_in_background())
+    """
+    server = ThreadingHTTPServer((host, port), JiraStubRequestHandler)
+    server.daemon_threads = True
+    server.stub = stub
+    server.verbose = verbose
+    return server
+
+
+def stub_base_url(server: ThreadingHTTPServer) -> str:
+    """Base URL to pass to JiraApiClient for a stub server"""
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/jira"
+
+
+def serve_in_background(server: ThreadingHTTPServer) -> threading.Thread:
+    """Serve a stub server from a daemon thread (stop it with server.shutdown())"""
+    thread = threading.Thread(target=server.serve_forever, name='jira-stub', daemon=True)
+    thread.start()
+    return thread
+
+
+def write_stub_cookies(path: str = STUB_COOKIE_FILE) -> None:
+    """
+    Write session cookies the stub accepts, in the login bot's cookie file format.
+
+    Args:
+        path: Cookie file to write
+    """
+    expires = time.time() + 7 * 24 * 3600
+    cookies = {'JSESSIONID': 'stub-session', 'atlassian.xsrf.token': 'stub-xsrf-token'}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'cookies': cookies, 'expires': {name: expires for name in cookies}}, f, indent=2)
+
+
+def main():
+    """Run the stub server until interrupted"""
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the JIRA REST API")
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    parser.add_argument('--issues', type=int, default=500, help='Synthetic issues to serve (default: 500)')
+    parser.add_argument('--replay', metavar='PATH', help='Replay a recording made with check_issues.py --record')
+    parser.add_argument('--latency', type=float, default=0, help='Delay added to every response, in ms')
+    parser.add_argument('--jitter', type=float, default=0, help='Random extra delay, up to this many ms')
+    parser.add_argument('--max-page-size', type=int, default=100, help='Most issues per search page (default: 100)')
+    parser.add_argument('--rate-limit', type=float, default=0,
+                        help='Requests per second allowed before answering 429 (default: no limit)')
+    parser.add_argument('--throttle-every', type=int, default=0, help='Answer every Nth request with 429')
+    parser.add_argument('--retry-after', type=float, default=1, help='Retry-After seconds sent with a 429 (default: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic issues (default: 0)')
+    parser.add_argument('--cookie-file', default=STUB_COOKIE_FILE,
+                        help=f'Session cookie file to write for the client (default: {STUB_COOKIE_FILE})')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    stub = JiraStub(
+        issues=args.issues, replay_file=args.replay, latency_ms=args.latency, jitter_ms=args.jitter,
+        max_page_size=args.max_page_size, rate_limit=args.rate_limit, throttle_every=args.throttle_every,
+        retry_after=args.retry_after, seed=args.seed
+    )
+    write_stub_cookies(args.cookie_file)
+    server = create_stub_server(stub, args.host, args.port, verbose=args.verbose)
+
+    if args.replay:
+        print(f"[STUB] Replaying {sum(len(records) for records in stub.recordings.values())} recorded responses "
+              f"from {args.replay}")
+    print(f"[STUB] Serving {len(stub.issues)} synthetic issues at {stub_base_url(server)}")
+    print(f"[STUB] Session cookies written to {args.cookie_file}")
+    print(f"[STUB] Run: python check_issues.py --base-url {stub_base_url(server)} --cookie-file {args.cookie_file}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"[STUB] Served {stub.requests} requests ({stub.throttled} throttled)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import asyncio
 import os
 import json
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Optional, Dict, Any
 from dotenv import load_dotenv
@@ -15,15 +16,87 @@ from exceptions import (
 # Load environment variables
 load_dotenv()
 
+# Browser profile kept by the pooled login browser (consent choices survive between logins)
+DEFAULT_BROWSER_PROFILE_DIR = '.jira_browser_profile'
+
+# Longest wait for the session cookie after submitting the login form (milliseconds)
+LOGIN_COOKIE_TIMEOUT_MS = 15000
+
+# Interval between checks for the session cookie (seconds)
+COOKIE_POLL_INTERVAL = 0.1
+
+# Cookies that make up the JIRA login session (JSESSIONID, atlassian.xsrf.token,
+# seraph.rememberme.cookie, ...). Cleared before a pooled browser logs in again, and
+# their expiry decides whether a saved session is still usable (see jira_session.py)
+SESSION_COOKIE_MARKERS = ('session', 'xsrf', 'remember', 'token')
+
+# URL parts of the login page (JIRA renders it again, with an error, when a login fails)
+LOGIN_PAGE_MARKERS = ('login.jsp', '/login')
+
+
+def is_login_page(url: str) -> bool:
+    """Whether a URL is JIRA's login page"""
+    url = url.lower()
+    return any(marker in url for marker in LOGIN_PAGE_MARKERS)
+
+
+def is_logged_in_cookie(name: str, value: str) -> bool:
+    """Whether a cookie shows a logged-in JIRA session (the XSRF token ends in 'lin' once logged in)"""
+    name = name.lower()
+    if 'rememberme' in name:
+        return True
+    return 'xsrf' in name and value.endswith('lin')
+
+
+def read_cookie_file(filename):
+    """
+    Read a cookie file written by JiraLoginBot.save_cookies (or the older name -> value format).
+    
+    Args:
+        filename: Cookie file to read
+    
+    Returns:
+        tuple: (cookie name -> value, cookie name -> expiry), both empty if the file does not exist
+    """
+    if not os.path.exists(filename):
+        return {}, {}
+    with open(filename, 'r') as f:
+        saved = json.load(f)
+    if isinstance(saved.get('cookies'), dict):
+        return saved['cookies'], saved.get('expires', {})
+    return saved, {}
+
+
 class JiraLoginBot:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, cookie_file="jira_cookies.json", reuse_browser=False,
+                 profile_dir=DEFAULT_BROWSER_PROFILE_DIR):
+        """
+        Args:
+            headless: Run the browser without a window
+            cookie_file: File the captured cookies are saved to
+            reuse_browser: Keep one browser with a persistent context open and reuse it
+                           for every login (close it with close())
+            profile_dir: Browser profile directory used when reuse_browser is set
+        """
         self.username = os.getenv('JIRA_USERNAME')
         self.password = os.getenv('JIRA_PASSWORD')
         self.http_proxy = os.getenv('HTTP_PROXY')
         self.https_proxy = os.getenv('HTTPS_PROXY')
         self.base_url = 'https://projects.tmforum.org/jira/'
         self.cookies = {}
+        # Cookie name -> expiry (Unix time; -1 for cookies that last the browser session)
+        self.cookie_expiry = {}
         self.headless = headless
+        self.cookie_file = cookie_file
+        self.reuse_browser = reuse_browser
+        self.profile_dir = profile_dir
+        
+        # Pooled browser (reuse_browser mode), bound to the event loop that started it;
+        # a task on that loop closes it when the loop shuts down (see _keep_pool)
+        self._playwright = None
+        self._pooled_context: Optional[BrowserContext] = None
+        self._pooled_loop = None
+        self._pool_keeper: Optional[asyncio.Task] = None
         
         if not self.username or not self.password:
             raise JiraConfigurationError(
@@ -104,6 +177,133 @@ class JiraLoginBot:
             await page.close()
             print("[PAGE] Page closed safely")
     
+    async def pooled_context(self) -> BrowserContext:
+        """
+        Persistent browser context shared by every login in reuse_browser mode.
+        
+        The browser is launched on first use and kept open until close(), or
+        until its event loop shuts down (asyncio.run cancels the task keeping it).
+        
+        Returns:
+            BrowserContext: Context of the pooled browser
+        """
+        loop = asyncio.get_running_loop()
+        if self._pooled_context is not None and self._pooled_loop is not loop:
+            # Started by another event loop - its keeper task closed it when that loop shut down
+            if self._pool_keeper is not None and not self._pool_keeper.done():
+                print("[WARNING] Pooled browser belongs to an event loop that is still running - launching another")
+            self._pooled_context = None
+            self._playwright = None
+            self._pool_keeper = None
+        
+        if self._pooled_context is None:
+            options = {'headless': self.headless}
+            proxy_config = self._proxy_config()
+            if proxy_config:
+                options['proxy'] = proxy_config
+            
+            print(f"[BROWSER] Launching pooled browser (profile: {self.profile_dir})...")
+            self._playwright = await async_playwright().start()
+            try:
+                self._pooled_context = await self._playwright.chromium.launch_persistent_context(
+                    self.profile_dir, **options
+                )
+            except Exception:
+                await self._playwright.stop()
+                self._playwright = None
+                raise
+            self._pooled_loop = loop
+            self._pool_keeper = loop.create_task(self._keep_pool())
+        
+        return self._pooled_context
+    
+    async def _keep_pool(self) -> None:
+        """
+        Wait until cancelled, then close the pooled browser.
+        
+        asyncio.run cancels this task when its loop finishes, which closes a
+        pool nobody closed explicitly instead of leaving the browser running.
+        """
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await self._shutdown_pool()
+    
+    async def _shutdown_pool(self) -> None:
+        """Close the pooled browser and stop Playwright (once, whoever gets here first)"""
+        context, playwright = self._pooled_context, self._playwright
+        self._pooled_context = None
+        self._playwright = None
+        if context is None:
+            return
+        try:
+            await context.close()
+        finally:
+            await playwright.stop()
+        print("[BROWSER] Pooled browser closed safely")
+    
+    async def close(self) -> None:
+        """Close the pooled browser, if one is open"""
+        keeper = self._pool_keeper
+        if keeper is not None and not keeper.done() and self._pooled_loop is asyncio.get_running_loop():
+            keeper.cancel()
+            await self._shutdown_pool()
+            await asyncio.gather(keeper, return_exceptions=True)
+        self._pooled_context = None
+        self._playwright = None
+        self._pooled_loop = None
+        self._pool_keeper = None
+    
+    async def _clear_session_cookies(self, context: BrowserContext) -> None:
+        """Drop the previous login's session cookies, keeping others such as the consent choice"""
+        cookies = await context.cookies()
+        kept = [
+            cookie for cookie in cookies
+            if not any(marker in cookie.get('name', '').lower() for marker in SESSION_COOKIE_MARKERS)
+        ]
+        if len(kept) < len(cookies):
+            await context.clear_cookies()
+            if kept:
+                await context.add_cookies(kept)
+    
+    async def _wait_for_login_cookie(self, page: Page, context: BrowserContext, previous_session_id: Optional[str],
+                                     timeout_ms: int = LOGIN_COOKIE_TIMEOUT_MS) -> bool:
+        """
+        Wait until the browser holds a logged-in session cookie.
+        
+        The logged-in XSRF token (ending in 'lin') or a remember-me cookie proves
+        the login. A new JSESSIONID only counts once the page has left the login
+        page, since a failed login renders the form again with a fresh session.
+        
+        Args:
+            page: Page the login form was submitted on
+            context: Browser context the login runs in
+            previous_session_id: JSESSIONID before the login form was submitted
+                                 (JIRA issues a new one on login)
+            timeout_ms: Longest wait in milliseconds
+            
+        Returns:
+            bool: True if the cookie appeared, False on timeout
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            cookies = {cookie.get('name', ''): cookie.get('value', '') for cookie in await context.cookies()}
+            if any(is_logged_in_cookie(name, value) for name, value in cookies.items()):
+                return True
+            session_id = cookies.get('JSESSIONID')
+            if session_id and session_id != previous_session_id and not is_login_page(page.url):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(COOKIE_POLL_INTERVAL)
+    
+    def _proxy_config(self) -> Optional[ProxySettings]:
+        """Browser proxy settings from the environment, if a proxy is configured"""
+        if not self.http_proxy:
+            return None
+        print(f"Using proxy: {self.http_proxy}")
+        return ProxySettings(server=self.http_proxy)  # Create proper ProxySettings object
+    
     async def get_cookies(self, force_refresh=False):
         """Get cookies either from cache, file, or by performing fresh login"""
         if not force_refresh and self.cookies:
@@ -117,183 +317,191 @@ class JiraLoginBot:
         return await self.login_and_capture_cookies()
     
     async def login_and_capture_cookies(self):
-        """Login to Jira and capture session cookies using context managers"""
+        """Login to Jira and capture session cookies, in the pooled browser or a fresh one"""
         print("Performing fresh login to JIRA...")
         
+        if self.reuse_browser:
+            context = await self.pooled_context()
+            await self._clear_session_cookies(context)
+            async with self.page_session(context) as page:
+                return await self._login_on_page(page, context)
+        
         # Configure proxy settings if available
-        proxy_config = None
-        if self.http_proxy:
-            proxy_url = self.http_proxy
-            print(f"Using proxy: {proxy_url}")
-            proxy_config = ProxySettings(server=proxy_url)  # Create proper ProxySettings object
+        proxy_config = self._proxy_config()
         
         # Use nested context managers for proper resource cleanup
         async with self.browser_session(proxy_config) as browser:
             async with self.browser_context(browser) as context:
                 async with self.page_session(context) as page:
-                    try:
-                        print(f"Navigating to {self.base_url}")
-                        await page.goto(self.base_url)
-                        
-                        # Wait for the page to load
-                        await page.wait_for_load_state('networkidle')
-                        
-                        # Now look for login elements (no cookie handling on main page)
-                        print("Looking for login elements...")
-                        # Check if we're already on a login page or need to find login link
-                        # Look for the specific login link structure you identified
-                        login_link = page.locator('#user-options > a.login-link, a.login-link')
-                        
-                        # If we see a login form directly
-                        username_field = page.locator('input[name="username"], input[id="username"], input[name="j_username"]')
-                        password_field = page.locator('input[name="password"], input[id="password"], input[name="j_password"]')
-                        
-                        if await username_field.count() > 0:
-                            print("Found login form on current page")
-                        else:
-                            print("Looking for login link...")
-                            # Try to find and click the specific login link
-                            if await login_link.count() > 0:
-                                print("Found login link, clicking...")
-                                await login_link.click()
-                                await page.wait_for_load_state('networkidle')
-                                
-                            else:
-                                # Fallback: try other common login link patterns
-                                fallback_link = page.locator('a:has-text("Log in"), a:has-text("Login"), a[href*="login"]').first
-                                if await fallback_link.count() > 0:
-                                    print("Found fallback login link, clicking...")
-                                    await fallback_link.click()
-                                    await page.wait_for_load_state('networkidle')
-                                    
-                                else:
-                                    # Try going directly to login URL
-                                    login_url = f"{self.base_url}login.jsp"
-                                    print(f"No login link found, navigating directly to login page: {login_url}")
-                                    await page.goto(login_url)
-                                    await page.wait_for_load_state('networkidle')
-                        
-                        # NOW handle cookie consent popup on the login page
-                        print("Checking for cookie consent popup on login page...")
-                        try:
-                            # Common Cookiebot selectors for "Allow all" or "Accept all" buttons
-                            cookie_selectors = [
-                                '#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll',
-                                '#CybotCookiebotDialogBodyButtonAccept',
-                                'button[id*="CybotCookiebot"][id*="Accept"]',
-                                'button[id*="CybotCookiebot"][id*="Allow"]',
-                                'button:has-text("Allow all")',
-                                'button:has-text("Accept all")',
-                                'button:has-text("Accept")',
-                                '.CybotCookiebotDialogBodyButton',
-                                '[data-cy="accept-all-button"]'
-                            ]
-                            
-                            cookie_accepted = False
-                            for selector in cookie_selectors:
-                                cookie_button = page.locator(selector)
-                                if await cookie_button.count() > 0:
-                                    print(f"Found cookie consent button with selector: {selector}")
-                                    await cookie_button.click()
-                                    await page.wait_for_load_state('networkidle')
-                                    await asyncio.sleep(2)  # Give time for popup to disappear
-                                    cookie_accepted = True
-                                    break
-                            
-                            if not cookie_accepted:
-                                print("No cookie consent popup found on login page")
-                                
-                        except Exception as e:
-                            # Cookie consent handling is optional - don't fail the entire login
-                            print(f"Cookie consent handling error (continuing anyway): {str(e)}")
-                        
-                        # Small delay to ensure any popup animations complete
-                        await asyncio.sleep(1)
-                        
-                        # Wait for login form elements
-                        await page.wait_for_selector('input[name="username"], input[id="username"], input[name="j_username"]', timeout=10000)
-                        
-                        # Fill in credentials
-                        print("Filling in login credentials...")
-                        username_field = page.locator('input[name="username"], input[id="username"], input[name="j_username"]').first
-                        password_field = page.locator('input[name="password"], input[id="password"], input[name="j_password"]').first
-                        
-                        if self.username and self.password:
-                            await username_field.fill(self.username)
-                            await password_field.fill(self.password)
-                        
-                        # Submit the form
-                        submit_button = page.locator('#btnSubmit')
-                        
-                        print("Submitting login form...")
-                        if await submit_button.count() > 0:
-                            print("Found #btnSubmit, clicking...")
-                            await submit_button.click()
-                        else:
-                            # Fallback to other submit button patterns
-                            print("btnSubmit not found, trying fallback selectors...")
-                            fallback_submit = page.locator('input[type="submit"], button[type="submit"], button:has-text("Log"), a:has-text("Log in")').first
-                            if await fallback_submit.count() > 0:
-                                await fallback_submit.click()
-                            else:
-                                print("No submit button found!")
-                                raise JiraAuthenticationError("Could not find login submit button on page")
-                        
-                        # Wait for login to complete
+                    return await self._login_on_page(page, context)
+    
+    async def _login_on_page(self, page: Page, context: BrowserContext) -> Dict[str, str]:
+        """Fill in the login form on a page and capture the resulting session cookies"""
+        try:
+            print(f"Navigating to {self.base_url}")
+            await page.goto(self.base_url)
+            
+            # Wait for the page to load
+            await page.wait_for_load_state('networkidle')
+            
+            # Now look for login elements (no cookie handling on main page)
+            print("Looking for login elements...")
+            # Check if we're already on a login page or need to find login link
+            # Look for the specific login link structure you identified
+            login_link = page.locator('#user-options > a.login-link, a.login-link')
+            
+            # If we see a login form directly
+            username_field = page.locator('input[name="username"], input[id="username"], input[name="j_username"]')
+            password_field = page.locator('input[name="password"], input[id="password"], input[name="j_password"]')
+            
+            if await username_field.count() > 0:
+                print("Found login form on current page")
+            else:
+                print("Looking for login link...")
+                # Try to find and click the specific login link
+                if await login_link.count() > 0:
+                    print("Found login link, clicking...")
+                    await login_link.click()
+                    await page.wait_for_load_state('networkidle')
+                
+                else:
+                    # Fallback: try other common login link patterns
+                    fallback_link = page.locator('a:has-text("Log in"), a:has-text("Login"), a[href*="login"]').first
+                    if await fallback_link.count() > 0:
+                        print("Found fallback login link, clicking...")
+                        await fallback_link.click()
                         await page.wait_for_load_state('networkidle')
-                        
-                        # Check if login was successful (look for typical post-login elements)
-                        await asyncio.sleep(3)  # Give time for any redirects
-                        
-                        # Capture all cookies
-                        cookies = await context.cookies()
-                        self.cookies = {cookie.get('name', ''): cookie.get('value', '') for cookie in cookies if cookie.get('name')}
-                        
-                        print("Login completed! Captured cookies:")
-                        for name, value in self.cookies.items():
-                            if 'session' in name.lower() or name == 'JSESSIONID':
-                                print(f"  {name}: {value}")
-                            else:
-                                print(f"  {name}: {value[:20]}..." if len(value) > 20 else f"  {name}: {value}")
-                        
-                        # Save cookies to file for later use
-                        self.save_cookies()
-                        
-                        return self.cookies
-                        
-                    except Exception as e:
-                        # Take a screenshot for debugging (if possible)
-                        try:
-                            await page.screenshot(path="login_error.png")
-                            print("Screenshot saved to login_error.png for debugging")
-                        except:
-                            pass  # Screenshot failed, but don't hide the original error
-                        
-                        # Classify the exception based on the error message and context
-                        error_msg = str(e)
-                        if isinstance(e, (JiraAuthenticationError, JiraConfigurationError, JiraNetworkError)):
-                            # Re-raise specific JIRA exceptions
-                            raise
-                        elif "timeout" in error_msg.lower() or "network" in error_msg.lower():
-                            raise JiraNetworkError(f"Network error during login: {error_msg}")
-                        elif "invalid" in error_msg.lower() or "denied" in error_msg.lower() or "submit button" in error_msg.lower():
-                            raise JiraAuthenticationError(f"Authentication failed: {error_msg}")
-                        else:
-                            raise JiraAuthenticationError(f"Login failed: {error_msg}")
                     
-                    # Context managers will automatically handle cleanup here
-    
-    def save_cookies(self, filename="jira_cookies.json"):
-        """Save cookies to a JSON file"""
+                    else:
+                        # Try going directly to login URL
+                        login_url = f"{self.base_url}login.jsp"
+                        print(f"No login link found, navigating directly to login page: {login_url}")
+                        await page.goto(login_url)
+                        await page.wait_for_load_state('networkidle')
+            
+            # NOW handle cookie consent popup on the login page
+            print("Checking for cookie consent popup on login page...")
+            try:
+                # Common Cookiebot selectors for "Allow all" or "Accept all" buttons
+                cookie_selectors = [
+                    '#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll',
+                    '#CybotCookiebotDialogBodyButtonAccept',
+                    'button[id*="CybotCookiebot"][id*="Accept"]',
+                    'button[id*="CybotCookiebot"][id*="Allow"]',
+                    'button:has-text("Allow all")',
+                    'button:has-text("Accept all")',
+                    'button:has-text("Accept")',
+                    '.CybotCookiebotDialogBodyButton',
+                    '[data-cy="accept-all-button"]'
+                ]
+                
+                cookie_accepted = False
+                for selector in cookie_selectors:
+                    cookie_button = page.locator(selector)
+                    if await cookie_button.count() > 0:
+                        print(f"Found cookie consent button with selector: {selector}")
+                        await cookie_button.click()
+                        # Wait for the popup to disappear rather than a fixed delay
+                        await cookie_button.first.wait_for(state='hidden', timeout=5000)
+                        cookie_accepted = True
+                        break
+                
+                if not cookie_accepted:
+                    print("No cookie consent popup found on login page")
+            
+            except Exception as e:
+                # Cookie consent handling is optional - don't fail the entire login
+                print(f"Cookie consent handling error (continuing anyway): {str(e)}")
+            
+            # Wait for login form elements
+            await page.wait_for_selector('input[name="username"], input[id="username"], input[name="j_username"]', timeout=10000)
+            
+            # Fill in credentials
+            print("Filling in login credentials...")
+            username_field = page.locator('input[name="username"], input[id="username"], input[name="j_username"]').first
+            password_field = page.locator('input[name="password"], input[id="password"], input[name="j_password"]').first
+            
+            if self.username and self.password:
+                await username_field.fill(self.username)
+                await password_field.fill(self.password)
+            
+            # Submit the form
+            submit_button = page.locator('#btnSubmit')
+            
+            print("Submitting login form...")
+            previous_session_id = next(
+                (cookie.get('value') for cookie in await context.cookies() if cookie.get('name') == 'JSESSIONID'), None
+            )
+            if await submit_button.count() > 0:
+                print("Found #btnSubmit, clicking...")
+                await submit_button.click()
+            else:
+                # Fallback to other submit button patterns
+                print("btnSubmit not found, trying fallback selectors...")
+                fallback_submit = page.locator('input[type="submit"], button[type="submit"], button:has-text("Log"), a:has-text("Log in")').first
+                if await fallback_submit.count() > 0:
+                    await fallback_submit.click()
+                else:
+                    print("No submit button found!")
+                    raise JiraAuthenticationError("Could not find login submit button on page")
+            
+            # Wait for the logged-in session cookie to appear (returns as soon as it does)
+            if not await self._wait_for_login_cookie(page, context, previous_session_id):
+                if is_login_page(page.url):
+                    raise JiraAuthenticationError(
+                        "Login failed - still on the login page after submitting the form (check JIRA_USERNAME/JIRA_PASSWORD)"
+                    )
+                print(f"[WARNING] No logged-in session cookie after {LOGIN_COOKIE_TIMEOUT_MS // 1000}s - capturing cookies anyway")
+            
+            # Capture all cookies
+            cookies = await context.cookies()
+            self.cookies = {cookie.get('name', ''): cookie.get('value', '') for cookie in cookies if cookie.get('name')}
+            self.cookie_expiry = {cookie['name']: cookie.get('expires', -1) for cookie in cookies if cookie.get('name')}
+            
+            print("Login completed! Captured cookies:")
+            for name, value in self.cookies.items():
+                if 'session' in name.lower() or name == 'JSESSIONID':
+                    print(f"  {name}: {value}")
+                else:
+                    print(f"  {name}: {value[:20]}..." if len(value) > 20 else f"  {name}: {value}")
+            
+            # Save cookies to file for later use
+            self.save_cookies()
+            
+            return self.cookies
+        
+        except Exception as e:
+            # Take a screenshot for debugging (if possible)
+            try:
+                await page.screenshot(path="login_error.png")
+                print("Screenshot saved to login_error.png for debugging")
+            except:
+                pass  # Screenshot failed, but don't hide the original error
+            
+            # Classify the exception based on the error message and context
+            error_msg = str(e)
+            if isinstance(e, (JiraAuthenticationError, JiraConfigurationError, JiraNetworkError)):
+                # Re-raise specific JIRA exceptions
+                raise
+            elif "timeout" in error_msg.lower() or "network" in error_msg.lower():
+                raise JiraNetworkError(f"Network error during login: {error_msg}")
+            elif "invalid" in error_msg.lower() or "denied" in error_msg.lower() or "submit button" in error_msg.lower():
+                raise JiraAuthenticationError(f"Authentication failed: {error_msg}")
+            else:
+                raise JiraAuthenticationError(f"Login failed: {error_msg}")
+
+    def save_cookies(self, filename=None):
+        """Save cookies, with their expiry times, to a JSON file (default: the bot's cookie file)"""
+        filename = filename or self.cookie_file
         with open(filename, 'w') as f:
-            json.dump(self.cookies, f, indent=2)
+            json.dump({'cookies': self.cookies, 'expires': self.cookie_expiry}, f, indent=2)
         print(f"Cookies saved to {filename}")
     
-    def load_cookies(self, filename="jira_cookies.json"):
-        """Load cookies from a JSON file"""
+    def load_cookies(self, filename=None):
+        """Load cookies from a JSON file (also reads the older name -> value format)"""
+        filename = filename or self.cookie_file
         if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                self.cookies = json.load(f)
+            self.cookies, self.cookie_expiry = read_cookie_file(filename)
             print(f"Cookies loaded from {filename}")
             return self.cookies
         else:
@@ -2,22 +2,203 @@
 Markdown Report Generator for JIRA Issue Data Quality Checker
 
 This module provides markdown formatting functions to convert the console output
-from check_issues.py into a properly formatted markdown report.
+from check_issues.py into a properly formatted markdown report, or to render
+the report directly from the check_issues.py --events stream.
+
+A MarkdownReporter created with an output stream writes the report section by
+section as it is produced. Only a small index of the sections and issue counts
+is kept in memory; the title, summary and table of contents that head the
+report are written from that index when the report is finished.
 """
 
+import collections
+import io
 import re
+import shutil
+import tempfile
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Any, Deque, Dict, IO, Iterable, Iterator, List, Optional, Union
+
+from report_events import EventRenderer
+
+
+# Report body held in memory before it is spooled to a temporary file
+BODY_SPOOL_SIZE = 1024 * 1024
+
+# Characters copied at a time when the body is appended to the output
+COPY_CHUNK_SIZE = 64 * 1024
+
+SEVERITY_ICONS = {'CRITICAL': '🔴', 'ERROR': '🟠', 'WARNING': '🟡'}
 
 
 class MarkdownReporter:
-    """Handles conversion of console output to markdown format"""
+    """
+    Formats the data quality report as markdown.
+    
+    The format_* methods return markdown text. Given an output stream, the
+    reporter also writes the report incrementally:
     
-    def __init__(self):
+        reporter = MarkdownReporter.open('report.md')
+        reporter.begin_section("Checking Story Issues")
+        reporter.write(reporter.format_issue_details(1, issue))
+        reporter.record_issue(['WARNING'])
+        reporter.close()  # Writes the title, summary and table of contents, then the body
+    """
+    
+    def __init__(self, out: Optional[IO[str]] = None, title: str = "JIRA Issue Data Quality Report",
+                 close_stream: bool = False):
+        """
+        Args:
+            out: Text stream the report is written to (None to only use the format_* methods)
+            title: Report title
+            close_stream: Close the stream when the reporter is closed
+        """
+        self.out = out
+        self.title = title
+        self.close_stream = close_stream
+        
+        # Index of the written sections: title, anchor, level and counts
         self.sections = []
         self.current_section = None
         self.issue_count = 0
         self.violation_count = 0
+        self.violations_by_severity = {}
+        self._anchors = set()
+        
+        # The body is written before the heading that summarizes it, so it is
+        # held here (spilling to disk when large) until the report is finished
+        self._body = None
+        if out is not None:
+            self._body = tempfile.SpooledTemporaryFile(
+                max_size=BODY_SPOOL_SIZE, mode='w+', encoding='utf-8', newline=''
+            )
+    
+    @classmethod
+    def open(cls, path: str, title: str = "JIRA Issue Data Quality Report") -> 'MarkdownReporter':
+        """Create a reporter writing to a new markdown file"""
+        return cls(open(path, 'w', encoding='utf-8'), title=title, close_stream=True)
+    
+    def write(self, markdown: str) -> None:
+        """Append markdown to the report body"""
+        self._body.write(markdown)
+    
+    def begin_section(self, text: str, level: int = 2) -> None:
+        """
+        Start a new section, writing its header and adding it to the table of contents.
+        
+        Args:
+            text: Section header text (cleaned up like format_section_header)
+            level: Header level
+        """
+        header = self.format_section_header(text, level)
+        self.write_section(header.strip().lstrip('#').strip(), header, level)
+    
+    def write_section(self, title: str, markdown: str, level: int = 2) -> None:
+        """
+        Write a section whose markdown already starts with its header.
+        
+        Args:
+            title: Section title as it appears in the header
+            markdown: Section markdown
+            level: Header level
+        """
+        section = {
+            'title': title,
+            'anchor': self._unique_anchor(title),
+            'level': level,
+            'issues': 0,
+            'violations': 0
+        }
+        self.sections.append(section)
+        if level <= 2:
+            self.current_section = section
+        self.write(markdown)
+    
+    def record_issue(self, violation_severities: Iterable[str] = ()) -> None:
+        """
+        Count a reported issue and its violations towards the summary.
+        
+        Args:
+            violation_severities: Severity of each of the issue's violations
+        """
+        self.issue_count += 1
+        if self.current_section is not None:
+            self.current_section['issues'] += 1
+        for severity in violation_severities:
+            self.record_violation(severity)
+    
+    def record_violation(self, severity: str) -> None:
+        """Count one more violation of the last reported issue towards the summary"""
+        self.violation_count += 1
+        self.violations_by_severity[severity] = self.violations_by_severity.get(severity, 0) + 1
+        if self.current_section is not None:
+            self.current_section['violations'] += 1
+    
+    def finish(self) -> None:
+        """Write the title, summary and table of contents, then the body and the footer"""
+        out = self.out
+        out.write(self.start_report(self.title))
+        out.write(self.format_report_summary())
+        out.write(self.format_table_of_contents())
+        
+        self._body.seek(0)
+        shutil.copyfileobj(self._body, out, COPY_CHUNK_SIZE)
+        self._body.close()
+        
+        out.write(self.finish_report())
+        out.flush()
+    
+    def close(self) -> None:
+        """Finish the report and close the output if the reporter opened it"""
+        self.finish()
+        if self.close_stream:
+            self.out.close()
+    
+    @staticmethod
+    def _anchor(title: str) -> str:
+        """GitHub-style anchor for a header"""
+        anchor = re.sub(r'[^\w\- ]', '', title.strip().lower())
+        return anchor.replace(' ', '-')
+    
+    def _unique_anchor(self, title: str) -> str:
+        anchor = base = self._anchor(title)
+        suffix = 1
+        while anchor in self._anchors:
+            anchor = f"{base}-{suffix}"
+            suffix += 1
+        self._anchors.add(anchor)
+        return anchor
+    
+    def format_report_summary(self) -> str:
+        """Format the report summary from the section index"""
+        markdown = f"""## Summary
+
+- **Issues Reported:** {self.issue_count}
+- **Total Violations:** {self.violation_count}
+"""
+        for severity, icon in SEVERITY_ICONS.items():
+            if self.violations_by_severity.get(severity):
+                markdown += f"- {icon} {severity}: {self.violations_by_severity[severity]}\n"
+        
+        checked_sections = [section for section in self.sections if section['issues']]
+        if checked_sections:
+            markdown += "\n| Section | Issues | Violations |\n|---------|--------|------------|\n"
+            for section in checked_sections:
+                markdown += f"| [{section['title']}](#{section['anchor']}) | {section['issues']} | {section['violations']} |\n"
+        
+        return markdown + "\n"
+    
+    def format_table_of_contents(self) -> str:
+        """Format the table of contents from the section index"""
+        if not self.sections:
+            return ""
+        
+        markdown = "## Table of Contents\n\n"
+        for section in self.sections:
+            indent = "  " * (section['level'] - 2)
+            markdown += f"{indent}- [{section['title']}](#{section['anchor']})\n"
+        
+        return markdown + "\n---\n"
         
     def start_report(self, title: str = "JIRA Issue Data Quality Report"):
         """Start a new markdown report"""
@@ -124,16 +305,8 @@ class MarkdownReporter:
             by_severity[severity].append(violation)
         
         # Display by severity (Critical first)
-        severity_order = ['CRITICAL', 'ERROR', 'WARNING']
-        severity_icons = {
-            'CRITICAL': '🔴',
-            'ERROR': '🟠', 
-            'WARNING': '🟡'
-        }
-        
-        for severity in severity_order:
+        for severity, icon in SEVERITY_ICONS.items():
             if severity in by_severity:
-                icon = severity_icons.get(severity, '❓')
                 markdown += f"##### {icon} {severity}\n\n"
                 
                 for violation in by_severity[severity]:
@@ -156,7 +329,7 @@ class MarkdownReporter:
         severity_text = ""
         for severity, count in violations_by_severity.items():
             if count > 0:
-                icon = {'CRITICAL': '🔴', 'ERROR': '🟠', 'WARNING': '🟡'}.get(severity, '❓')
+                icon = SEVERITY_ICONS.get(severity, '❓')
                 severity_text += f"- {icon} {severity}: {count}\n"
         
         if not severity_text:
@@ -253,52 +426,161 @@ No labels found in any checked issues.
 """
 
 
-def convert_console_output_to_markdown(console_text: str) -> str:
+class MarkdownEventRenderer(EventRenderer):
+    """Renders the basic markdown report from the report event stream (see report_events.py)"""
+    
+    def __init__(self, out):
+        super().__init__(out)
+        self.reporter = MarkdownReporter(out)
+        
+    def on_rules(self, event):
+        self.reporter.write_section("Rule Engine Configuration", self.reporter.format_rule_engine_summary(event))
+        
+    def on_auth(self, event):
+        self.reporter.write_section(
+            "Authentication Status",
+            self.reporter.format_authentication_section(event.get('user', 'Unknown'), event.get('email', ''))
+        )
+        
+    def on_section_start(self, event):
+        self.reporter.begin_section(f"Checking {event['issue_type']} Issues")
+        self.reporter.write(f"**JQL Query:** `{event.get('jql', '')}`\n\n")
+        
+    def on_section_found(self, event):
+        total = event.get('total', 0)
+        self.reporter.write(f"**Found:** {total} {event['issue_type']} issues to check\n\n")
+        
+    def render_issue(self, issue, results):
+        self.reporter.write(self.reporter.format_issue_details(issue.get('position', 0), issue, issue.get('tmf_apis')))
+        violations = [
+            {
+                'severity': result.get('severity'),
+                'rule_name': result.get('rule_id'),
+                'message': result.get('message'),
+                'details': result.get('suggestion') or ''
+            }
+            for result in results if not result.get('passed')
+        ]
+        self.reporter.record_issue(violation['severity'] for violation in violations)
+        self.reporter.write(self.reporter.format_rule_violations(violations))
+        
+    def on_section_end(self, event):
+        if event.get('error'):
+            self.reporter.write(f"⚠️ **Error fetching {event['issue_type']} issues:** {event['error']}\n\n")
+            return
+        self.reporter.write(self.reporter.format_issue_type_summary(
+            event['issue_type'],
+            event.get('checked', 0),
+            event.get('violations', 0),
+            event.get('violations_by_severity', {})
+        ))
+        
+    def on_labels(self, event):
+        labels = event.get('labels', {})
+        self.reporter.write_section("Label Usage Report", self.reporter.format_label_usage_report(labels))
+        
+        # Same insights as the console label report
+        sorted_labels = sorted(labels.items(), key=lambda item: len(item[1]), reverse=True)
+        insights = [f"Top label: `{label}` ({len(issues)} issues)" for label, issues in sorted_labels[:5]]
+        single_use = [label for label, issues in sorted_labels if len(issues) == 1]
+        if single_use:
+            insights.append(f"Labels used only once: {len(single_use)}")
+        self.reporter.write(self.reporter.format_insights_section(insights))
+        
+    def finish(self):
+        super().finish()
+        self.reporter.finish()
+
+
+class _LineReader:
+    """Reads lines one at a time with a little lookahead, so the whole input is never held"""
+    
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self._ahead: Deque[str] = collections.deque()
+    
+    def _fill(self, count: int) -> bool:
+        while len(self._ahead) < count:
+            line = next(self._lines, None)
+            if line is None:
+                return False
+            self._ahead.append(line.rstrip('\r\n'))
+        return True
+    
+    def peek(self, offset: int = 0) -> Optional[str]:
+        """Line offset lines ahead of the next one, or None past the end"""
+        if not self._fill(offset + 1):
+            return None
+        return self._ahead[offset]
+    
+    def skip(self, count: int = 1) -> None:
+        """Consume lines"""
+        for _ in range(count):
+            if not self._fill(1):
+                return
+            self._ahead.popleft()
+    
+    def __iter__(self) -> Iterator[str]:
+        while self._fill(1):
+            yield self._ahead.popleft()
+
+
+def convert_console_output_to_markdown(console_text: Union[str, Iterable[str]],
+                                       out: Optional[IO[str]] = None) -> Optional[str]:
     """
     Convert the existing console output format to markdown.
     This is a utility function for converting existing report.txt files.
+    
+    Args:
+        console_text: Console output, as one string or as lines (e.g., an open report.txt)
+        out: Text stream to write the markdown to as it is converted
+    
+    Returns:
+        The markdown, or None when it was written to out
     """
-    reporter = MarkdownReporter()
-    lines = console_text.split('\n')
+    if isinstance(console_text, str):
+        console_text = io.StringIO(console_text)
     
-    markdown_content = reporter.start_report()
-    current_section = None
+    sink = out if out is not None else io.StringIO()
+    reporter = MarkdownReporter(sink)
+    lines = _LineReader(console_text)
     in_issue_details = False
-    issue_buffer = []
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    for raw_line in lines:
+        line = raw_line.strip()
         
         if not line:
-            i += 1
             continue
         
         # Skip the initial title and separator
         if line.startswith('Checking for JIRA Issue data quality') or line == '=' * 70:
-            i += 1
             continue
             
         # Detect main section headers
         if line.startswith('[CHECK]') and 'CHECKING' in line:
             issue_type = line.replace('[CHECK] CHECKING', '').replace('ISSUES', '').strip()
-            markdown_content += reporter.format_section_header(f"Checking {issue_type} Issues")
+            reporter.begin_section(f"Checking {issue_type} Issues")
+            in_issue_details = False
             
         elif line.startswith('[AUTH]') and 'Logged in as:' in line:
             user_name = line.split('Logged in as:')[1].strip()
             # Look for email in next line
             email = ""
-            if i + 1 < len(lines) and 'Email:' in lines[i + 1]:
-                email = lines[i + 1].split('Email:')[1].strip()
-                i += 1  # Skip the email line
-            markdown_content += reporter.format_authentication_section(user_name, email)
+            next_line = lines.peek()
+            if next_line is not None and 'Email:' in next_line:
+                email = next_line.split('Email:')[1].strip()
+                lines.skip()  # Skip the email line
+            reporter.write_section("Authentication Status", reporter.format_authentication_section(user_name, email))
             
         elif line.startswith('[RULES]') and 'Rule Engine initialized:' in line:
             # Look ahead for rule summary information
             summary_data = {'enabled_rules': 0, 'total_rules': 0, 'rules_by_category': {}}
-            j = i + 1
-            while j < len(lines) and j < i + 10:  # Look ahead max 10 lines
-                next_line = lines[j].strip()
+            consumed = 0
+            while consumed < 9:  # Look ahead max 9 lines
+                next_line = lines.peek()
+                if next_line is None:
+                    break
+                next_line = next_line.strip()
                 if '/' in next_line and 'rules enabled' in next_line:
                     # Parse "X/Y rules enabled"
                     match = re.search(r'(\d+)/(\d+) rules enabled', next_line)
@@ -314,90 +596,97 @@ def convert_console_output_to_markdown(console_text: str) -> str:
                         summary_data['rules_by_category'][category] = list(range(count))
                 elif next_line.startswith('[') or next_line == '':
                     break
-                j += 1
-            i = j - 1  # Set i to the last line we processed
-            markdown_content += reporter.format_rule_engine_summary(summary_data)
+                lines.skip()
+                consumed += 1
+            reporter.write_section("Rule Engine Configuration", reporter.format_rule_engine_summary(summary_data))
             
         elif line.startswith('[QUERY]') and 'JQL Query:' in line:
             jql = line.replace('[QUERY] JQL Query:', '').strip()
-            markdown_content += f"**JQL Query:** `{jql}`\n\n"
+            reporter.write(f"**JQL Query:** `{jql}`\n\n")
             
         elif line.startswith('[RESULTS]') and 'Found' in line:
-            # Extract count information
-            match = re.search(r'Found (\d+) (\w+) issues.*Total matching: (\d+)', line)
+            # Extract count information (older logs also print the total matching)
+            match = re.search(r'Found (\d+) (\w+) issues(?:.*Total matching: (\d+))?', line)
             if match:
                 found_count, issue_type, total_count = match.groups()
-                markdown_content += f"**Found:** {found_count} {issue_type} issues to check (Total matching: {total_count})\n\n"
+                if total_count is None or total_count == found_count:
+                    reporter.write(f"**Found:** {found_count} {issue_type} issues to check\n\n")
+                else:
+                    reporter.write(f"**Found:** {found_count} {issue_type} issues to check (Total matching: {total_count})\n\n")
                 
         elif re.match(r'^\s*\d+\.\s+\w+:', line):
             # Issue details line (e.g., "1. Story: AP-1234")
             issue_match = re.match(r'^\s*(\d+)\.\s+(\w+):\s+(\w+-\d+)', line)
             if issue_match:
                 issue_num, issue_type, issue_key = issue_match.groups()
-                markdown_content += f"### {issue_num}. {issue_type}: {issue_key}\n\n"
+                reporter.write(f"### {issue_num}. {issue_type}: {issue_key}\n\n")
+                reporter.record_issue()
+                in_issue_details = True
             else:
-                markdown_content += f"### {line}\n\n"
+                reporter.write(f"### {line}\n\n")
                 
         elif line.startswith('Title:'):
             title = line.replace('Title:', '').strip()
-            markdown_content += f"**Title:** {title}\n"
+            reporter.write(f"**Title:** {title}\n")
         elif line.startswith('Status:'):
             status = line.replace('Status:', '').strip()
-            markdown_content += f"**Status:** {status}\n"
+            reporter.write(f"**Status:** {status}\n")
         elif line.startswith('Assignee:'):
             assignee = line.replace('Assignee:', '').strip()
-            markdown_content += f"**Assignee:** {assignee}\n"
+            reporter.write(f"**Assignee:** {assignee}\n")
         elif line.startswith('URL:'):
             url = line.replace('URL:', '').strip()
-            markdown_content += f"**URL:** [{url}]({url})\n\n"
+            reporter.write(f"**URL:** [{url}]({url})\n\n")
             
         elif line.startswith('[TMF]') and 'TMF APIs Referenced:' in line:
-            markdown_content += "**TMF APIs Referenced:**\n"
+            reporter.write("**TMF APIs Referenced:**\n")
             # Look ahead for API details
-            j = i + 1
-            while j < len(lines):
-                next_line = lines[j].strip()
+            while True:
+                next_line = lines.peek()
+                if next_line is None:
+                    break
+                next_line = next_line.strip()
                 if next_line.startswith('- ') and ':' in next_line:
                     # API line like "- TMF622: Product Ordering Management (Latest: 4.1.0)"
                     api_info = next_line[2:].strip()  # Remove "- "
-                    markdown_content += f"- **{api_info}**\n"
+                    reporter.write(f"- **{api_info}**\n")
                 elif next_line.startswith('Documentation:'):
                     doc_url = next_line.replace('Documentation:', '').strip()
-                    markdown_content += f"  - Documentation: [{doc_url}]({doc_url})\n"
+                    reporter.write(f"  - Documentation: [{doc_url}]({doc_url})\n")
                 elif not next_line.startswith(' ') and next_line != '':
                     break
-                j += 1
-            i = j - 1
-            markdown_content += "\n"
+                lines.skip()
+            reporter.write("\n")
             
         elif line.startswith('[VIOLATION]') or 'Rule Violation' in line:
             # Rule violation details - format as alert box
             violation_text = line.replace('[VIOLATION]', '').strip()
-            markdown_content += f"⚠️ **{violation_text}**\n\n"
+            reporter.write(f"⚠️ **{violation_text}**\n\n")
             
         elif line.startswith('[REPORT] LABEL USAGE REPORT'):
-            markdown_content += "## Label Usage Report\n\n"
+            reporter.write_section("Label Usage Report", "## Label Usage Report\n\n")
+            in_issue_details = False
             
         elif line.startswith('Total unique labels:'):
             count = line.split(':')[1].strip()
-            markdown_content += f"- **Total unique labels:** {count}\n"
+            reporter.write(f"- **Total unique labels:** {count}\n")
         elif line.startswith('Total label usages:'):
             count = line.split(':')[1].strip()
-            markdown_content += f"- **Total label usages:** {count}\n"
+            reporter.write(f"- **Total label usages:** {count}\n")
         elif line.startswith('Average labels per issue:'):
             avg = line.split(':')[1].strip()
-            markdown_content += f"- **Average labels per issue:** {avg}\n\n"
+            reporter.write(f"- **Average labels per issue:** {avg}\n\n")
             
         elif re.match(r'^\s*\d+\.\s+Label:', line):
             # Label details like "1. Label: 'api-first' (used 5 times)"
             label_match = re.search(r"Label: '([^']+)' \(used (\d+) times\)", line)
             if label_match:
                 label_name, usage_count = label_match.groups()
-                markdown_content += f"#### {line.split('.')[0].strip()}. Label: `{label_name}` (used {usage_count} times)\n\n"
+                reporter.write(f"#### {line.split('.')[0].strip()}. Label: `{label_name}` (used {usage_count} times)\n\n")
                 
         elif line.endswith('s (') and ')' in line:
             # Issue type grouping like "Stories (3):"
-            markdown_content += f"**{line}**\n"
+            reporter.write(f"**{line}**\n")
             
         elif line.startswith('- ') and ':' in line and 'http' in line:
             # Issue link line like "- AP-1234: Title... URL: http://..."
@@ -410,12 +699,12 @@ def convert_console_output_to_markdown(console_text: str) -> str:
                 if issue_key_match:
                     issue_key = issue_key_match.group(1)
                     title = issue_info.replace(f'{issue_key}:', '').strip()
-                    markdown_content += f"- [{issue_key}]({url}): {title}\n"
+                    reporter.write(f"- [{issue_key}]({url}): {title}\n")
                 else:
-                    markdown_content += f"- {issue_info} - [Link]({url})\n"
+                    reporter.write(f"- {issue_info} - [Link]({url})\n")
                     
         elif line.startswith('[INSIGHTS]'):
-            markdown_content += "### Label Insights\n\n"
+            reporter.write("### Label Insights\n\n")
             
         # Skip over separator lines and other formatting
         elif line.startswith('=') or line.startswith('-'):
@@ -423,13 +712,19 @@ def convert_console_output_to_markdown(console_text: str) -> str:
         elif line.startswith('[') and line.endswith(']'):
             # Other bracketed sections - treat as subheadings
             section_name = line[1:-1]
-            markdown_content += f"### {section_name}\n\n"
+            reporter.write(f"### {section_name}\n\n")
         else:
             # Regular text line
-            if line.strip():
-                markdown_content += f"{line}\n"
-        
-        i += 1
+            if line.startswith('[SUMMARY]'):
+                in_issue_details = False
+            elif in_issue_details:
+                # Rule results printed under an issue, e.g. "[WARNING] ..."
+                severity_match = re.match(r'\[(CRITICAL|ERROR|WARNING)\] ', line)
+                if severity_match:
+                    reporter.record_violation(severity_match.group(1))
+            reporter.write(f"{line}\n")
     
-    markdown_content += reporter.finish_report()
-    return markdown_content
\ No newline at end of file
+    reporter.finish()
+    if out is None:
+        return sink.getvalue()
+    return None
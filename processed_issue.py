@@ -0,0 +1,187 @@
+"""
+Compact processed form of a JIRA issue, as read by the data quality rules.
+
+Every place that flattens a raw issue from the JIRA search API goes through
+ProcessedIssue.from_raw, so the rules always see the same fields. Issues are
+stored in ``__slots__`` instead of a dict, and only the raw fields the rules
+declare (see BaseRule.required_raw_fields) are kept from the raw payload,
+which otherwise carries hundreds of mostly-null ``customfield_*`` entries.
+
+ProcessedIssue is a read-only Mapping, so rules keep using ``issue.get('key')``
+and ``issue['summary']``.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from rules.date_utils import parse_issue_dates
+from rules.text_analysis import TEXT_ANALYSIS_KEY
+
+
+class ProcessedIssue(Mapping):
+    """
+    Flattened JIRA issue.
+
+    Example:
+        issue = ProcessedIssue.from_raw(raw_issue, base_url, raw_fields=['assignee'])
+        issue['status'], issue.get('created_epoch')
+    """
+
+    # Keys readable through the Mapping interface, in display order
+    FIELDS = (
+        'key', 'summary', 'status', 'assignee', 'assignee_email', 'reporter', 'reporter_email',
+        'priority', 'issue_type', 'description', 'labels', 'components', 'versions', 'fixVersions',
+        'issues', 'comment_count', 'comments', 'created', 'created_at', 'created_epoch',
+        'updated', 'updated_at', 'updated_epoch', 'url', 'raw_fields'
+    )
+
+    # Values computed and stored by the rules (see rules.text_analysis)
+    MEMO_FIELDS = (TEXT_ANALYSIS_KEY,)
+
+    __slots__ = FIELDS + MEMO_FIELDS
+
+    _KEYS = frozenset(__slots__)
+
+    def __init__(self, **values: Any):
+        """
+        Create a processed issue. Fields not given are None.
+
+        Raises:
+            TypeError: If an unknown field is given
+        """
+        unknown = set(values) - set(self.FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown ProcessedIssue fields: {', '.join(sorted(unknown))}")
+        for name in self.FIELDS:
+            object.__setattr__(self, name, values.get(name))
+
+    @classmethod
+    def from_raw(cls, issue: Dict[str, Any], base_url: str,
+                 raw_fields: Optional[Iterable[str]] = None) -> 'ProcessedIssue':
+        """
+        Flatten a raw issue from the JIRA search API.
+
+        Args:
+            issue: Raw issue ('key', 'fields', ...)
+            base_url: JIRA base URL used to build the issue URL
+            raw_fields: Raw field names to keep in 'raw_fields' (None keeps them all)
+
+        Returns:
+            ProcessedIssue
+        """
+        fields = issue.get('fields') or {}
+        key = issue.get('key')
+
+        assignee_info = fields.get('assignee') or {}
+        reporter_info = fields.get('reporter') or {}
+
+        comment_info = fields.get('comment') or {}
+        comments = [cls._process_comment(comment) for comment in comment_info.get('comments', [])]
+
+        if raw_fields is None:
+            kept_raw_fields = fields
+        else:
+            kept_raw_fields = {name: fields[name] for name in raw_fields if name in fields}
+
+        values = {
+            'key': key,
+            'summary': fields.get('summary'),
+            'status': (fields.get('status') or {}).get('name'),
+            'assignee': assignee_info.get('displayName') if assignee_info else 'Unassigned',
+            'assignee_email': assignee_info.get('emailAddress') if assignee_info else None,
+            'reporter': reporter_info.get('displayName') if reporter_info else 'Unassigned',
+            'reporter_email': reporter_info.get('emailAddress') if reporter_info else None,
+            'priority': (fields.get('priority') or {}).get('name'),
+            'issue_type': (fields.get('issuetype') or {}).get('name'),
+            'description': fields.get('description'),
+            'labels': fields.get('labels'),
+            'components': fields.get('components'),
+            'versions': fields.get('versions'),
+            'fixVersions': fields.get('fixVersions', []),
+            'issues': fields.get('issuelinks', []),
+            'comment_count': comment_info.get('total', 0),
+            'comments': comments,
+            'created': fields.get('created'),
+            'updated': fields.get('updated'),
+            'url': f"{base_url}/browse/{key}",
+            'raw_fields': kept_raw_fields
+        }
+        values.update(parse_issue_dates(values))
+        return cls(**values)
+
+    @staticmethod
+    def _process_comment(comment: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the parts of a JIRA comment the rules and reports use"""
+        author = comment.get('author') or {}
+        return {
+            'author': author.get('displayName', 'Unknown'),
+            'author_email': author.get('emailAddress', ''),
+            'created': comment.get('created'),
+            'updated': comment.get('updated'),
+            'body': comment.get('body', '')
+        }
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._KEYS:
+            raise KeyError(name)
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            # Memo slot not filled in yet
+            raise KeyError(name) from None
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        """Store a memoized value computed by the rules (e.g. the text analysis)"""
+        if name not in self.MEMO_FIELDS:
+            raise TypeError(f"ProcessedIssue field '{name}' is read-only")
+        object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ProcessedIssue is read-only")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.FIELDS or (name in self.MEMO_FIELDS and hasattr(self, name))
+
+    def __reduce__(self):
+        # Slots are read-only, so pickling (for the rule worker processes) goes through a helper
+        state = {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+        return (_restore_processed_issue, (state,))
+
+    def __repr__(self) -> str:
+        return f"ProcessedIssue(key={self.key!r}, issue_type={self.issue_type!r}, status={self.status!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the issue fields (e.g. for JSON output)"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+def _restore_processed_issue(state: Dict[str, Any]) -> ProcessedIssue:
+    """Rebuild a pickled ProcessedIssue (used by the rule worker processes)"""
+    issue = ProcessedIssue.__new__(ProcessedIssue)
+    for name, value in state.items():
+        object.__setattr__(issue, name, value)
+    return issue
+
+
+def process_issues(issues: List[Dict[str, Any]], base_url: str,
+                   raw_fields: Optional[Iterable[str]] = None) -> List[ProcessedIssue]:
+    """
+    Flatten a page of raw issues.
+
+    Args:
+        issues: Raw issues from the JIRA search API
+        base_url: JIRA base URL used to build the issue URLs
+        raw_fields: Raw field names to keep in 'raw_fields' (None keeps them all)
+
+    Returns:
+        ProcessedIssue objects in the same order
+    """
+    if raw_fields is not None:
+        raw_fields = tuple(raw_fields)
+    return [ProcessedIssue.from_raw(issue, base_url, raw_fields) for issue in issues]
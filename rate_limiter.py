@@ -0,0 +1,257 @@
+"""
+Adaptive client-side rate limiter for the JIRA API.
+
+Requests are not paced while JIRA keeps up. The first 429/503, or an average
+latency above the target, engages one token bucket shared by every request
+made by a JiraApiClient, so all concurrent callers are throttled together.
+From then on the refill rate is learned from the server's responses
+(additive increase, multiplicative decrease):
+
+- a 429 (or 503) halves the rate and pauses *every* caller until the
+  Retry-After time has passed, instead of each task sleeping on its own
+- a slow response lowers the rate slightly (at most once per second)
+- each successful response raises the rate a little, as long as responses
+  come back within the target latency; once it is back at the maximum rate
+  the bucket disengages again
+
+The limiter's state is available from metrics() for reporting.
+"""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from rule_config import get_rate_limit_config
+
+
+# Responses that mean the server wants fewer requests
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Weight of the newest sample in the moving average latency
+LATENCY_SMOOTHING = 0.2
+
+# Rate reduction applied when responses are slower than the target latency
+SLOW_RESPONSE_FACTOR = 0.9
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either seconds or an HTTP date
+        now: Current Unix time (default: now)
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = time.time() if now is None else now
+    return max(retry_at.timestamp() - now, 0.0)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket whose rate adapts to the server's 429s and latency.
+
+    Example:
+        limiter = AdaptiveRateLimiter(max_rate=20)
+        await limiter.acquire()
+        ... send the request ...
+        limiter.record_response(response.status_code, latency, retry_after)
+    """
+
+    def __init__(self, min_rate: float = 0.5, max_rate: float = 20.0,
+                 burst: float = 4.0, increase_step: float = 0.5, decrease_factor: float = 0.5,
+                 target_latency: float = 3.0, default_pause: float = 5.0, max_pause: float = 60.0,
+                 enabled: bool = True):
+        """
+        Args:
+            min_rate: Lowest rate the limiter backs off to (requests per second)
+            max_rate: Rate the limiter engages at, and grows back to before disengaging
+            burst: Most tokens the bucket holds (requests that may start at once)
+            increase_step: Rate increase per second of successful responses
+            decrease_factor: Rate multiplier applied on a 429/503
+            target_latency: Responses slower than this (seconds) lower the rate
+            default_pause: Pause after a 429/503 without a Retry-After header (seconds)
+            max_pause: Longest pause honoured from a Retry-After header (seconds)
+            enabled: When False, acquire() never waits and responses are ignored
+        """
+        self.enabled = enabled
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = max(burst, 1.0)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.target_latency = target_latency
+        self.default_pause = default_pause
+        self.max_pause = max_pause
+
+        # Not pacing until the server pushes back
+        self.engaged = False
+        self.rate = max_rate
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._last_slowdown = 0.0
+
+        # Metrics
+        self.requests = 0
+        self.throttled_requests = 0
+        self.throttle_wait_seconds = 0.0
+        self.throttle_responses = 0
+        self.pauses = 0
+        self.engagements = 0
+        self.latency_average: Optional[float] = None
+        self.lowest_rate = self.rate
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'AdaptiveRateLimiter':
+        """Create a limiter from the rule_config 'rate_limit' settings"""
+        settings = get_rate_limit_config(config)
+        return cls(
+            min_rate=settings.get('min_rate', 0.5),
+            max_rate=settings.get('max_rate', 20.0),
+            burst=settings.get('burst', 4),
+            increase_step=settings.get('increase_step', 0.5),
+            decrease_factor=settings.get('decrease_factor', 0.5),
+            target_latency=settings.get('target_latency_seconds', 3.0),
+            default_pause=settings.get('default_pause_seconds', 5.0),
+            max_pause=settings.get('max_pause_seconds', 60.0),
+            enabled=settings.get('enabled', True)
+        )
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def _set_rate(self, rate: float) -> None:
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.lowest_rate = min(self.lowest_rate, self.rate)
+
+    def _engage(self, now: float) -> None:
+        """Start pacing requests through the bucket (at the current rate)"""
+        if not self.engaged:
+            self.engaged = True
+            self.engagements += 1
+            self._tokens = min(self._tokens, self.burst)
+            self._last_refill = now
+
+    async def acquire(self) -> float:
+        """
+        Wait for a token (and for any pause after a 429 to end).
+
+        Token bookkeeping happens between awaits, so concurrent tasks on the
+        event loop never need a lock.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                wait = self._paused_until - now
+            elif not self.engaged:
+                self.requests += 1
+                if waited:
+                    self.throttled_requests += 1
+                    self.throttle_wait_seconds += waited
+                return waited
+            else:
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.requests += 1
+                    if waited:
+                        self.throttled_requests += 1
+                        self.throttle_wait_seconds += waited
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def record_response(self, status_code: int, latency: float, retry_after: Optional[float] = None) -> None:
+        """
+        Adapt the rate to a response.
+
+        Args:
+            status_code: HTTP status of the response
+            latency: Seconds the request took
+            retry_after: Seconds from the response's Retry-After header, if any
+        """
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+
+        if status_code in THROTTLE_STATUS_CODES:
+            self.throttle_responses += 1
+            if now >= self._paused_until:
+                # First throttle response of this episode: back off once for all callers
+                # (responses to requests already in flight must not keep halving the rate)
+                self._engage(now)
+                self._set_rate(self.rate * self.decrease_factor)
+                self.pauses += 1
+            pause = self.default_pause if retry_after is None else min(retry_after, self.max_pause)
+            self._paused_until = max(self._paused_until, now + pause)
+            self._tokens = 0.0
+            self._last_refill = max(self._last_refill, self._paused_until)
+            return
+
+        if status_code >= 400:
+            return
+
+        if self.latency_average is None:
+            self.latency_average = latency
+        else:
+            self.latency_average += LATENCY_SMOOTHING * (latency - self.latency_average)
+
+        if self.latency_average > self.target_latency:
+            if now - self._last_slowdown >= 1.0:
+                self._engage(now)
+                self._set_rate(self.rate * SLOW_RESPONSE_FACTOR)
+                self._last_slowdown = now
+        elif self.engaged:
+            # One step per second at the current rate, whatever that rate is
+            self._set_rate(self.rate + self.increase_step / max(self.rate, 1.0))
+            if self.rate >= self.max_rate:
+                self.engaged = False
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds left in the current pause (0 if not paused)"""
+        return max(self._paused_until - time.monotonic(), 0.0)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current limiter state and counters"""
+        return {
+            'enabled': self.enabled,
+            'engaged': self.engaged,
+            'engagements': self.engagements,
+            'rate': round(self.rate, 3),
+            'lowest_rate': round(self.lowest_rate, 3),
+            'tokens': round(self._tokens, 3),
+            'paused_for_seconds': round(self.paused_for, 3),
+            'requests': self.requests,
+            'throttled_requests': self.throttled_requests,
+            'throttle_wait_seconds': round(self.throttle_wait_seconds, 3),
+            'throttle_responses': self.throttle_responses,
+            'pauses': self.pauses,
+            'latency_average_seconds': round(self.latency_average, 4) if self.latency_average is not None else None
+        }
@@ -0,0 +1,435 @@
+"""
+Structured report event stream for JIRA Issue Data Quality Checker
+
+check_issues.py --events report.jsonl writes one JSON object per line as the
+check runs: the rule engine setup, each issue type section, every checked issue
+followed by its rule results, the per-type summaries and the label usage.
+Renderers turn the stream into the plain text, basic markdown and enhanced
+markdown reports in a single pass, so the console output never has to be
+parsed back into structure.
+
+Event types (the 'event' key of every line):
+    run_start       project, generated
+    rules           enabled_rules, total_rules, rules_by_category
+    auth            user, email
+    section_start   issue_type, jql, source ('jira' or 'store')
+    section_found   issue_type, total
+    issue           issue_type, position, total, key, summary, status, assignee,
+                    assignee_email, url, labels, tmf_apis
+    result          issue_key, rule_id, severity, passed, message, suggestion
+    section_end     issue_type, checked, violations, violations_by_severity, error
+    labels          labels (label -> list of {key, summary, url, type})
+    run_end         completed
+
+Usage:
+    python report_events.py report.jsonl
+    python report_events.py report.jsonl --text report.txt --markdown report.md --enhanced report_enhanced.md
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Union
+
+
+# Output held in memory per spooled stream before it spills to a temporary file
+SPOOL_SIZE = 1024 * 1024
+
+
+class SpooledStream:
+    """
+    Text stream that holds what is written to it until forward_to() is called.
+
+    The held text stays in memory while small and spills to a temporary file
+    after that. Once forwarded, the held text is copied to the target and every
+    later write goes straight through, so output that is waiting its turn (e.g.,
+    a concurrently checked section) costs no memory beyond the spool size.
+    """
+
+    def __init__(self, max_size: int = SPOOL_SIZE):
+        self._spool = tempfile.SpooledTemporaryFile(max_size=max_size, mode='w+', encoding='utf-8', newline='')
+        self._target: Optional[IO[str]] = None
+
+    def write(self, text: str) -> int:
+        if self._target is not None:
+            return self._target.write(text)
+        return self._spool.write(text)
+
+    def flush(self) -> None:
+        if self._target is not None:
+            self._target.flush()
+
+    def forward_to(self, target: IO[str]) -> None:
+        """Copy the held text to target and send every later write there"""
+        if self._target is not None:
+            return
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, target)
+        self._spool.close()
+        self._target = target
+
+    def close(self) -> None:
+        """Discard any held text (a forwarded target is left open)"""
+        if self._target is None:
+            self._spool.close()
+
+
+class ReportEventWriter:
+    """Writes report events as JSON lines"""
+
+    def __init__(self, stream: IO[str], close_stream: bool = False):
+        """
+        Args:
+            stream: Text stream to write the events to
+            close_stream: Close the stream when the writer is closed
+        """
+        self.stream = stream
+        self.close_stream = close_stream
+
+    @classmethod
+    def open(cls, path: str) -> 'ReportEventWriter':
+        """Create a writer for a new events file"""
+        return cls(open(path, 'w', encoding='utf-8', newline='\n'), close_stream=True)
+
+    @classmethod
+    def buffered(cls) -> 'ReportEventWriter':
+        """Create a writer that holds its events in a SpooledStream until extend() forwards them"""
+        return cls(SpooledStream())
+
+    def emit(self, event: str, **data: Any) -> None:
+        """
+        Write one event.
+
+        Args:
+            event: Event type (e.g., 'issue')
+            **data: Event fields (must be JSON serializable; datetimes become strings)
+        """
+        self.stream.write(json.dumps({'event': event, **data}, ensure_ascii=False, default=str))
+        self.stream.write('\n')
+
+    def extend(self, other: 'ReportEventWriter') -> None:
+        """
+        Append the events held by a buffered writer, e.g. one concurrently checked section.
+
+        Events the buffered writer emits afterwards are written straight to this writer's stream.
+        """
+        other.stream.forward_to(self.stream)
+
+    def close(self) -> None:
+        """Flush the events and close the file if the writer opened it"""
+        if self.close_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+
+def read_events(source: Union[str, IO[str]]) -> Iterator[Dict[str, Any]]:
+    """
+    Read report events one at a time.
+
+    Args:
+        source: Path of an events file, or an open text stream
+
+    Yields:
+        Event dictionaries
+    """
+    if isinstance(source, str):
+        with open(source, 'r', encoding='utf-8') as stream:
+            yield from read_events(stream)
+        return
+
+    for line in source:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def result_event_data(result) -> Dict[str, Any]:
+    """Fields of the 'result' event for a RuleResult"""
+    return {
+        'issue_key': result.issue_key,
+        'rule_id': result.rule_id,
+        'severity': result.severity.value,
+        'passed': result.passed,
+        'message': result.message,
+        'suggestion': result.suggestion
+    }
+
+
+def result_display_text(result: Dict[str, Any]) -> str:
+    """Render a 'result' event the way RuleResult prints on the console"""
+    status = "[PASS]" if result.get('passed') else f"[{result.get('severity', 'UNKNOWN')}]"
+    text = f"{status} {result.get('message', '')}"
+    if result.get('suggestion') and not result.get('passed'):
+        text += f"\n      [SUGGESTION] {result['suggestion']}"
+    return text
+
+
+class EventRenderer:
+    """
+    Base class for renderers of the report event stream.
+
+    Each event is passed to the on_<event type> method, if the renderer has one.
+    An issue's 'result' events are gathered and handed to render_issue together
+    with the issue, as soon as the next non-result event arrives.
+    """
+
+    def __init__(self, out: IO[str]):
+        """
+        Args:
+            out: Text stream the rendered report is written to
+        """
+        self.out = out
+        self._pending_issue: Optional[Dict[str, Any]] = None
+        self._pending_results: List[Dict[str, Any]] = []
+
+    def handle(self, event: Dict[str, Any]) -> None:
+        """Render one event"""
+        event_type = event.get('event')
+        if event_type == 'result':
+            self._pending_results.append(event)
+            return
+
+        self._flush_issue()
+        if event_type == 'issue':
+            self._pending_issue = event
+            return
+
+        handler = getattr(self, f'on_{event_type}', None)
+        if handler is not None:
+            handler(event)
+
+    def finish(self) -> None:
+        """Render anything still pending at the end of the stream"""
+        self._flush_issue()
+
+    def render_issue(self, issue: Dict[str, Any], results: List[Dict[str, Any]]) -> None:
+        """Render one checked issue and its rule results"""
+        pass
+
+    def _flush_issue(self) -> None:
+        if self._pending_issue is not None:
+            self.render_issue(self._pending_issue, self._pending_results)
+        self._pending_issue = None
+        self._pending_results = []
+
+
+class TextRenderer(EventRenderer):
+    """Renders the plain text report, laid out like the console output"""
+
+    SEVERITY_ORDER = ('CRITICAL', 'ERROR', 'WARNING', 'INFO')
+
+    def __init__(self, out: IO[str], show_passed: bool = False):
+        """
+        Args:
+            out: Text stream the report is written to
+            show_passed: Show passed checks that are not INFO (INFO results are always shown)
+        """
+        super().__init__(out)
+        self.show_passed = show_passed
+
+    def write(self, text: str = '') -> None:
+        self.out.write(text + '\n')
+
+    def on_run_start(self, event):
+        self.write(f"JIRA Issue Data Quality Report - {event.get('project', '')} project")
+        self.write(f"Generated: {event.get('generated', '')}")
+        self.write("=" * 70)
+
+    def on_rules(self, event):
+        self.write("\n[RULES] Rule Engine initialized:")
+        self.write(f"   {event.get('enabled_rules', 0)}/{event.get('total_rules', 0)} rules enabled")
+        for category, rules in event.get('rules_by_category', {}).items():
+            self.write(f"   - {category}: {len(rules)} rules")
+
+    def on_auth(self, event):
+        self.write("\n[AUTH] Authenticated with JIRA")
+        self.write(f"   Logged in as: {event.get('user', 'Unknown')}")
+        self.write(f"   Email: {event.get('email', 'Not provided')}")
+
+    def on_section_start(self, event):
+        self.write("\n" + "=" * 80)
+        self.write(f"[CHECK] CHECKING {event['issue_type'].upper()} ISSUES")
+        self.write("=" * 80)
+        if event.get('source') == 'store':
+            self.write(f"[QUERY] Local store query (same criteria as): {event.get('jql', '')}")
+        else:
+            self.write(f"[QUERY] JQL Query: {event.get('jql', '')}")
+
+    def on_section_found(self, event):
+        total = event.get('total', 0)
+        self.write(f"\n[RESULTS] Found {total} {event['issue_type']} issues to check")
+
+    def render_issue(self, issue, results):
+        self.write(f"\n{issue.get('position', 0):2}. {issue.get('issue_type')}: {issue.get('key')}")
+        self.write(f"    Title: {issue.get('summary')}")
+        self.write(f"    Status: {issue.get('status')}")
+        if issue.get('assignee_email'):
+            self.write(f"    Assignee: {issue.get('assignee')} ({issue['assignee_email']})")
+        else:
+            self.write(f"    Assignee: {issue.get('assignee')}")
+        self.write(f"    URL: {issue.get('url')}")
+
+        if issue.get('tmf_apis'):
+            self.write("    [TMF] TMF APIs Referenced:")
+            for api_info in issue['tmf_apis']:
+                self.write(f"       - {api_info['tmf_code']}: {api_info['long_name']} (Latest: {api_info['highest_version']})")
+                self.write(f"         Documentation: {api_info['url']}")
+
+        if not results:
+            self.write("    [OK] No issues found")
+        else:
+            shown = [
+                result for result in results
+                if not result.get('passed') or self.show_passed or result.get('severity') == 'INFO'
+            ]
+            for severity in self.SEVERITY_ORDER:
+                for result in shown:
+                    if result.get('severity') == severity:
+                        self.write(f"    {result_display_text(result)}")
+
+        if issue.get('position', 0) < issue.get('total', 0):
+            self.write("    " + "-" * 60)
+
+    def on_section_end(self, event):
+        issue_type = event['issue_type']
+        if event.get('error'):
+            self.write(f"   [ERROR] Error fetching {issue_type} issues: {event['error']}")
+            return
+
+        checked = event.get('checked', 0)
+        if checked == 0:
+            self.write(f"   [OK] No {issue_type} issues found matching the criteria")
+            return
+
+        violations = event.get('violations', 0)
+        self.write(f"\n[SUMMARY] {issue_type} Summary:")
+        self.write(f"   Issues checked: {checked}")
+        self.write(f"   Total violations: {violations}")
+        by_severity = event.get('violations_by_severity', {})
+        if by_severity:
+            self.write("   Violations by severity:")
+            for severity, count in by_severity.items():
+                if count > 0:
+                    self.write(f"     {severity}: {count}")
+        violation_rate = violations / checked
+        self.write(f"   Average violations per issue: {violation_rate:.1f}")
+        if violation_rate == 0:
+            self.write("   [EXCELLENT] Data Quality: EXCELLENT - No issues found!")
+        elif violation_rate < 2:
+            self.write("   [GOOD] Data Quality: GOOD - Minor issues found")
+        elif violation_rate < 5:
+            self.write("   [WARNING] Data Quality: NEEDS ATTENTION - Multiple issues found")
+        else:
+            self.write("   [POOR] Data Quality: POOR - Many issues require immediate attention")
+
+    def on_labels(self, event):
+        labels = event.get('labels', {})
+        self.write("\n[REPORT] LABEL USAGE REPORT")
+        self.write("=" * 60)
+        if not labels:
+            self.write("   No labels found in any checked issues.")
+            return
+
+        sorted_labels = sorted(labels.items(), key=lambda item: len(item[1]), reverse=True)
+        total_usages = sum(len(issues) for issues in labels.values())
+        issue_keys = {issue['key'] for issues in labels.values() for issue in issues}
+        self.write("[SUMMARY]:")
+        self.write(f"   Total unique labels found: {len(sorted_labels)}")
+        self.write(f"   Total label usages: {total_usages}")
+        self.write(f"   Average labels per issue: {total_usages / len(issue_keys):.1f}")
+
+        self.write("\n[LABELS] Label Details (sorted by usage count):")
+        self.write("-" * 60)
+        for i, (label, issues) in enumerate(sorted_labels, 1):
+            self.write(f"\n{i:2}. Label: '{label}' (used {len(issues)} times)")
+            by_type = {}
+            for issue in issues:
+                by_type.setdefault(issue['type'], []).append(issue)
+            for issue_type, type_issues in sorted(by_type.items()):
+                self.write(f"    {issue_type}s ({len(type_issues)}):")
+                for issue in type_issues:
+                    summary = issue['summary'] or ''
+                    if len(summary) > 80:
+                        summary = summary[:77] + "..."
+                    self.write(f"      - {issue['key']}: {summary}")
+                    self.write(f"        URL: {issue['url']}")
+
+    def on_run_end(self, event):
+        self.write("\n" + "=" * 100)
+        if event.get('completed', True):
+            self.write("[SUCCESS] Multi-issue type data quality check completed successfully!")
+        else:
+            self.write("[ERROR] The data quality check did not complete")
+
+
+def render_events(events: Iterable[Dict[str, Any]], renderers: List[EventRenderer]) -> int:
+    """
+    Feed an event stream through several renderers in one pass.
+
+    Args:
+        events: Report events (e.g., from read_events)
+        renderers: Renderers to write
+
+    Returns:
+        Number of events rendered
+    """
+    count = 0
+    for event in events:
+        for renderer in renderers:
+            renderer.handle(event)
+        count += 1
+    for renderer in renderers:
+        renderer.finish()
+    return count
+
+
+def main():
+    """Render the text and markdown reports from an events file"""
+    # Imported here because the markdown renderers build on this module
+    from markdown_reporter import MarkdownEventRenderer
+    from create_enhanced_report import EnhancedMarkdownEventRenderer
+
+    parser = argparse.ArgumentParser(description="Render reports from a check_issues.py --events file")
+    parser.add_argument('events', nargs='?', default='report.jsonl', help='Events file (default: report.jsonl)')
+    parser.add_argument('--text', default='report.txt', help='Plain text report (default: report.txt)')
+    parser.add_argument('--markdown', default='report.md', help='Basic markdown report (default: report.md)')
+    parser.add_argument('--enhanced', default='report_enhanced.md',
+                        help='Enhanced markdown report (default: report_enhanced.md)')
+    args = parser.parse_args()
+
+    outputs = [
+        (args.text, TextRenderer),
+        (args.markdown, MarkdownEventRenderer),
+        (args.enhanced, EnhancedMarkdownEventRenderer)
+    ]
+
+    # Open the events file before any report, so a wrong path leaves existing reports untouched
+    try:
+        events_file = open(args.events, 'r', encoding='utf-8')
+    except FileNotFoundError as e:
+        print(f"❌ Error: Could not find events file: {e.filename}")
+        sys.exit(1)
+
+    streams = [events_file]
+    try:
+        renderers = []
+        for path, renderer_class in outputs:
+            stream = open(path, 'w', encoding='utf-8')
+            streams.append(stream)
+            renderers.append(renderer_class(stream))
+
+        count = render_events(read_events(events_file), renderers)
+    finally:
+        for stream in streams:
+            stream.close()
+
+    print(f"✅ Rendered {count:,} events from {args.events}")
+    for path, _ in outputs:
+        print(f"📝 Output: {path}")
+
+
+if __name__ == "__main__":
+    main()
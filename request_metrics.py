@@ -0,0 +1,318 @@
+"""
+Request telemetry for JiraApiClient.
+
+Every response the client receives is recorded against its endpoint (with
+issue keys and project keys replaced by placeholders, so /project/AP and
+/project/XY are one endpoint):
+
+- a latency histogram (Prometheus-style cumulative buckets)
+- responses by status code, with 429 and 5xx counts
+- bytes transferred: on the wire (compressed) and after decoding; responses
+  whose transport did not report a wire size make the compressed figure unknown
+- retries, and the time spent sleeping in backoff before them
+- requests that failed without a response (connection errors, timeouts)
+
+At the end of a run the metrics can be exported as JSON or in the Prometheus
+text exposition format.
+
+Usage:
+    client = JiraApiClient()
+    ...
+    write_metrics(client.metrics, 'jira_metrics.json')       # JSON
+    write_metrics(client.metrics, 'jira_metrics.prom')       # Prometheus text
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from http_transport import TransportResponse
+
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments replaced by placeholders so each endpoint is one time series
+_ENDPOINT_PATTERNS = [
+    (re.compile(r'/[A-Z][A-Z0-9_]*-\d+(?=/|$)'), '/{issueKey}'),
+    (re.compile(r'(?<=/project/)[^/]+'), '{projectKey}'),
+    (re.compile(r'/\d+(?=/|$)'), '/{id}'),
+]
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Endpoint name used for metrics.
+
+    Args:
+        endpoint: API endpoint relative to /rest/api/2 (e.g., '/project/AP/components')
+
+    Returns:
+        Endpoint with keys and ids replaced (e.g., '/project/{projectKey}/components')
+    """
+    endpoint = endpoint.split('?', 1)[0]
+    for pattern, placeholder in _ENDPOINT_PATTERNS:
+        endpoint = pattern.sub(placeholder, endpoint)
+    return endpoint
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram with fixed bucket bounds"""
+
+    __slots__ = ('bucket_counts', 'count', 'sum', 'max')
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.bucket_counts[index] += 1
+                break
+        else:
+            self.bucket_counts[-1] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def cumulative_buckets(self) -> List[Tuple[str, int]]:
+        """(upper bound, observations at or below it) pairs, ending with '+Inf'"""
+        buckets = []
+        running = 0
+        for bound, count in zip(list(LATENCY_BUCKETS) + ['+Inf'], self.bucket_counts):
+            running += count
+            buckets.append((f"{bound:g}" if bound != '+Inf' else bound, running))
+        return buckets
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated quantile (upper bound of the bucket it falls in; max for the last bucket)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        running = 0
+        for index, count in enumerate(self.bucket_counts):
+            running += count
+            if running >= target:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum_seconds': round(self.sum, 6),
+            'max_seconds': round(self.max, 6),
+            'p50_seconds': self.quantile(0.5),
+            'p95_seconds': self.quantile(0.95),
+            'buckets': dict(self.cumulative_buckets())
+        }
+
+
+class EndpointMetrics:
+    """Counters of one endpoint"""
+
+    __slots__ = ('latency', 'status_counts', 'compressed_bytes', 'decompressed_bytes',
+                 'unmeasured_responses', 'retries', 'backoff_seconds', 'errors')
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.status_counts: Dict[int, int] = {}
+        self.compressed_bytes = 0
+        self.decompressed_bytes = 0
+        # Responses without a wire size; compressed_bytes undercounts while this is non-zero
+        self.unmeasured_responses = 0
+        self.retries = 0
+        self.backoff_seconds = 0.0
+        self.errors = 0
+
+    @property
+    def throttled(self) -> int:
+        return self.status_counts.get(429, 0)
+
+    @property
+    def server_errors(self) -> int:
+        return sum(count for status, count in self.status_counts.items() if status >= 500)
+
+    @property
+    def wire_bytes(self) -> Optional[int]:
+        """Bytes on the wire, or None if any response's wire size is unknown"""
+        return None if self.unmeasured_responses else self.compressed_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.latency.count,
+            'latency': self.latency.to_dict(),
+            'status_codes': {str(status): count for status, count in sorted(self.status_counts.items())},
+            'throttled_responses': self.throttled,
+            'server_errors': self.server_errors,
+            'compressed_bytes': self.wire_bytes,
+            'decompressed_bytes': self.decompressed_bytes,
+            'unmeasured_responses': self.unmeasured_responses,
+            'retries': self.retries,
+            'backoff_seconds': round(self.backoff_seconds, 6),
+            'failed_requests': self.errors
+        }
+
+
+class RequestMetrics:
+    """Request telemetry of one JiraApiClient, per endpoint"""
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        # Extra state exported with the metrics (e.g., the rate limiter's)
+        self.rate_limiter = None
+
+    def _get(self, endpoint: str) -> EndpointMetrics:
+        name = normalize_endpoint(endpoint)
+        metrics = self.endpoints.get(name)
+        if metrics is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    def record_response(self, endpoint: str, response: TransportResponse, elapsed: float) -> None:
+        """
+        Record a response.
+
+        Args:
+            endpoint: API endpoint the request went to
+            response: Response received
+            elapsed: Seconds the request took
+        """
+        metrics = self._get(endpoint)
+        metrics.latency.observe(elapsed)
+        metrics.status_counts[response.status_code] = metrics.status_counts.get(response.status_code, 0) + 1
+
+        metrics.decompressed_bytes += len(response.content)
+        if response.wire_bytes is not None:
+            metrics.compressed_bytes += response.wire_bytes
+        else:
+            metrics.unmeasured_responses += 1
+
+    def record_error(self, endpoint: str) -> None:
+        """Record a request that failed without a response"""
+        self._get(endpoint).errors += 1
+
+    def record_retry(self, endpoint: str, backoff_seconds: float = 0.0) -> None:
+        """
+        Record a retry.
+
+        Args:
+            endpoint: API endpoint being retried
+            backoff_seconds: Time slept before the retry
+        """
+        metrics = self._get(endpoint)
+        metrics.retries += 1
+        metrics.backoff_seconds += backoff_seconds
+
+    def totals(self) -> Dict[str, Any]:
+        """Counters summed over every endpoint"""
+        endpoints = self.endpoints.values()
+        return {
+            'requests': sum(metrics.latency.count for metrics in endpoints),
+            'request_seconds': round(sum(metrics.latency.sum for metrics in endpoints), 6),
+            'throttled_responses': sum(metrics.throttled for metrics in endpoints),
+            'server_errors': sum(metrics.server_errors for metrics in endpoints),
+            'compressed_bytes': (None if any(metrics.unmeasured_responses for metrics in endpoints)
+                                 else sum(metrics.compressed_bytes for metrics in endpoints)),
+            'decompressed_bytes': sum(metrics.decompressed_bytes for metrics in endpoints),
+            'unmeasured_responses': sum(metrics.unmeasured_responses for metrics in endpoints),
+            'retries': sum(metrics.retries for metrics in endpoints),
+            'backoff_seconds': round(sum(metrics.backoff_seconds for metrics in endpoints), 6),
+            'failed_requests': sum(metrics.errors for metrics in endpoints)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """All metrics as a JSON-serializable dictionary"""
+        result = {
+            'totals': self.totals(),
+            'endpoints': {name: metrics.to_dict() for name, metrics in sorted(self.endpoints.items())}
+        }
+        if self.rate_limiter is not None:
+            result['rate_limiter'] = self.rate_limiter.metrics()
+        return result
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self, prefix: str = 'jira_client') -> str:
+        """
+        All metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text
+        """
+        lines = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            full_name = f"{prefix}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            return full_name
+
+        def label(value: Any) -> str:
+            return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+        name = family('request_duration_seconds', 'histogram', 'JIRA request latency')
+        for endpoint, metrics in sorted(self.endpoints.items()):
+            for bound, count in metrics.latency.cumulative_buckets():
+                lines.append(f'{name}_bucket{{endpoint="{label(endpoint)}",le="{bound}"}} {count}')
+            lines.append(f'{name}_sum{{endpoint="{label(endpoint)}"}} {metrics.latency.sum:.6f}')
+            lines.append(f'{name}_count{{endpoint="{label(endpoint)}"}} {metrics.latency.count}')
+
+        name = family('responses_total', 'counter', 'JIRA responses by status code')
+        for endpoint, metrics in sorted(self.endpoints.items()):
+            for status, count in sorted(metrics.status_counts.items()):
+                lines.append(f'{name}{{endpoint="{label(endpoint)}",status="{status}"}} {count}')
+
+        # The compressed series is left out of endpoints with responses of unknown wire size
+        name = family('response_bytes_total', 'counter', 'JIRA response bytes, on the wire and decompressed')
+        for endpoint, metrics in sorted(self.endpoints.items()):
+            if metrics.wire_bytes is not None:
+                lines.append(f'{name}{{endpoint="{label(endpoint)}",encoding="compressed"}} {metrics.wire_bytes}')
+            lines.append(f'{name}{{endpoint="{label(endpoint)}",encoding="decompressed"}} '
+                         f'{metrics.decompressed_bytes}')
+
+        for metric, help_text, attribute in [
+            ('unmeasured_responses_total', 'JIRA responses whose size on the wire is unknown',
+             'unmeasured_responses'),
+            ('retries_total', 'JIRA request retries', 'retries'),
+            ('backoff_seconds_total', 'Time slept in backoff before retries', 'backoff_seconds'),
+            ('failed_requests_total', 'JIRA requests that failed without a response', 'errors'),
+        ]:
+            name = family(metric, 'counter', help_text)
+            for endpoint, metrics in sorted(self.endpoints.items()):
+                lines.append(f'{name}{{endpoint="{label(endpoint)}"}} {getattr(metrics, attribute):g}')
+
+        if self.rate_limiter is not None:
+            limiter = self.rate_limiter.metrics()
+            for metric, kind, help_text, key in [
+                ('rate_limit_rate', 'gauge', 'Current request rate allowed by the rate limiter (req/s)', 'rate'),
+                ('rate_limit_wait_seconds_total', 'counter', 'Time requests waited for the rate limiter',
+                 'throttle_wait_seconds'),
+                ('rate_limit_pauses_total', 'counter', 'Shared pauses after 429 responses', 'pauses'),
+            ]:
+                name = family(metric, kind, help_text)
+                lines.append(f"{name} {limiter[key]}")
+
+        return '\n'.join(lines) + '\n'
+
+
+def write_metrics(metrics: RequestMetrics, path: str, format: Optional[str] = None) -> None:
+    """
+    Export request metrics to a file.
+
+    Args:
+        metrics: Metrics to export
+        path: Output file
+        format: 'json' or 'prometheus' (default: prometheus for .prom/.txt files, JSON otherwise)
+    """
+    if format is None:
+        format = 'prometheus' if path.endswith(('.prom', '.txt')) else 'json'
+    text = metrics.to_prometheus() if format == 'prometheus' else metrics.to_json()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
@@ -114,6 +114,43 @@ DEFAULT_CONFIG = {
         'show_suggestions': True,  # Show improvement suggestions
     },
     
+    'execution': {
+        'concurrent_queries': True,  # Run the per-issue-type searches concurrently
+        'max_concurrent_requests': 4,  # Cap on in-flight JIRA requests
+        'rule_workers': 0,  # Worker processes for rule evaluation (0 or 1 runs rules in-process)
+        'rule_chunk_size': 50,  # Issues per worker shard
+        'drop_passed_results': False,  # Discard passed results as rules produce them (only failures are reported)
+        'instrument_rules': False,  # Record per-rule time, calls, applicable issues, failures and exceptions
+    },
+    
+    'rate_limit': {
+        'enabled': True,  # Pace JIRA requests through one shared token bucket once JIRA pushes back
+        'min_rate': 0.5,  # Lowest rate to back off to after 429s
+        'max_rate': 20.0,  # Rate the bucket engages at; back at this rate it stops pacing
+        'burst': 4,  # Requests that may start at once after an idle spell
+        'increase_step': 0.5,  # Rate increase per second of successful responses
+        'decrease_factor': 0.5,  # Rate multiplier applied on a 429/503
+        'target_latency_seconds': 3.0,  # Slower average responses lower the rate
+        'default_pause_seconds': 5.0,  # Pause after a 429 without a Retry-After header
+        'max_pause_seconds': 60.0,  # Longest Retry-After pause honoured
+    },
+    
+    'issue_store': {
+        'enabled': False,  # Check issues from the local store instead of searching JIRA
+        'path': 'jira_issues.db',  # SQLite file holding synced issues
+        'sync_overlap_minutes': 5,  # Re-fetch window covering clock skew between syncs
+    },
+    
+    'authentication': {
+        'cookie_file': 'jira_cookies.json',  # Session cookies saved by the login bot
+        'headless_login': True,  # Run the login browser without a window
+        'reuse_login_browser': True,  # Keep one browser open and reuse it for every login in a run
+        'browser_profile_dir': '.jira_browser_profile',  # Profile of the reused login browser
+        'expiry_margin_seconds': 300,  # Log in again this long before a session cookie expires
+        'validation_ttl_seconds': 900,  # Trust a successful session check this long (0 checks every run)
+        'validation_cache_file': 'jira_session_check.json',  # Last session check, reused by later runs
+    },
+    
     'thresholds': {
         'stale_days': 180,  # Days without update to consider stale
         'long_running_days': 365,  # Days in progress to consider long-running
@@ -147,6 +184,30 @@ def get_output_config(config: Dict[str, Any] = None) -> Dict[str, Any]:
     return config.get('output', {})
 
 
+def get_execution_config(config: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Get execution (concurrency) configuration settings"""
+    config = config or DEFAULT_CONFIG
+    return config.get('execution', {})
+
+
+def get_rate_limit_config(config: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Get JIRA request rate limiter configuration settings"""
+    config = config or DEFAULT_CONFIG
+    return config.get('rate_limit', {})
+
+
+def get_issue_store_config(config: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Get local issue store configuration settings"""
+    config = config or DEFAULT_CONFIG
+    return config.get('issue_store', {})
+
+
+def get_authentication_config(config: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Get JIRA login and session cookie configuration settings"""
+    config = config or DEFAULT_CONFIG
+    return config.get('authentication', {})
+
+
 # Example of custom configuration for different environments
 DEVELOPMENT_CONFIG = {
     **DEFAULT_CONFIG,
@@ -4,28 +4,107 @@ Rule engine for executing data quality rules against JIRA issues.
 This module orchestrates the execution of rules and provides reporting capabilities.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import importlib
+import json
 import pkgutil
+import time
 from pathlib import Path
 
 from rules.base_rule import BaseRule, RuleResult, RuleSeverity, RuleCategory
 
 
+# Rule engine used by each worker process of a RuleEngine process pool
+_worker_engine = None
+
+
+def _initialize_worker(config: Dict[str, Any], drop_passed: bool = False, instrument: bool = False):
+    """Load the rule set and its lookup tables once per worker process"""
+    global _worker_engine
+    
+    worker_config = dict(config)
+    worker_config['execution'] = {**config.get('execution', {}), 'rule_workers': 0}
+    _worker_engine = RuleEngine(config=worker_config, drop_passed=drop_passed, instrument=instrument)
+    _worker_engine.warm_up()
+
+
+def _run_worker_batch(issues: List[Dict[str, Any]],
+                      context: Dict[str, Any]) -> Tuple[List[List[RuleResult]], Dict[str, Dict[str, Any]]]:
+    """Run the worker's rule set against one shard of issues, returning the results and the shard's rule stats"""
+    results = _worker_engine.run_rules_batch(issues, context)
+    return results, _worker_engine.take_rule_stats()
+
+
+class RuleStats:
+    """Cumulative cost and outcome counters of one rule (collected when a RuleEngine is instrumented)"""
+    
+    __slots__ = ('calls', 'applicable', 'failures', 'exceptions', 'wall_seconds')
+    
+    def __init__(self):
+        self.calls = 0          # Issues the rule was considered for
+        self.applicable = 0     # Issues the rule applied to
+        self.failures = 0       # Failed results the rule returned
+        self.exceptions = 0     # Exceptions the rule raised
+        self.wall_seconds = 0.0 # Time spent in is_applicable, check and check_batch
+    
+    def merge(self, stats: Dict[str, Any]):
+        """Add counters from another engine (e.g., a worker process)"""
+        self.calls += stats.get('calls', 0)
+        self.applicable += stats.get('applicable', 0)
+        self.failures += stats.get('failures', 0)
+        self.exceptions += stats.get('exceptions', 0)
+        self.wall_seconds += stats.get('wall_seconds', 0.0)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'applicable': self.applicable,
+            'failures': self.failures,
+            'exceptions': self.exceptions,
+            'wall_seconds': round(self.wall_seconds, 6)
+        }
+
+
 class RuleEngine:
     """Engine for running data quality rules against JIRA issues"""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, workers: Optional[int] = None,
+                 drop_passed: Optional[bool] = None, instrument: Optional[bool] = None):
         """
         Initialize the rule engine.
         
         Args:
             config: Configuration dictionary for enabling/disabling rules
+            workers: Number of worker processes for batch rule runs
+                     (default: the execution 'rule_workers' setting; 0 or 1 runs in-process)
+            drop_passed: Discard passed results as soon as rules return them
+                         (default: the execution 'drop_passed_results' setting)
+            instrument: Record per-rule timings and counts (see get_rule_stats)
+                        (default: the execution 'instrument_rules' setting)
         """
         self.config = config or {}
         self.rules: List[BaseRule] = []
+        # Issue type (casefolded) -> [(rule, call is_applicable)], see _build_dispatch_table
+        self._rules_by_issue_type: Dict[str, List[Tuple[BaseRule, bool]]] = {}
+        self._rules_for_any_type: List[Tuple[BaseRule, bool]] = []
         self._load_rules()
+        self._build_dispatch_table()
+        
+        # Process pool for batch runs, created on first use
+        execution_config = self.config.get('execution', {})
+        self.workers = workers if workers is not None else execution_config.get('rule_workers', 0)
+        self.chunk_size = max(1, execution_config.get('rule_chunk_size', 50))
+        self.drop_passed = drop_passed if drop_passed is not None else execution_config.get('drop_passed_results', False)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Workers load the configured rules, so rules added or removed by hand run in-process
+        self._rules_customized = False
+        
+        # Per-rule instrumentation: rule_id -> RuleStats
+        self.instrument = instrument if instrument is not None else execution_config.get('instrument_rules', False)
+        self.rule_stats: Dict[str, RuleStats] = {}
         
     def _load_rules(self):
         """Automatically discover and load all rule classes"""
@@ -63,18 +142,97 @@ class RuleEngine:
         rule_config = rules_config.get(rule_name, {})
         return rule_config.get('enabled', True)  # Default to enabled
         
+    def _build_dispatch_table(self):
+        """
+        Index the loaded rules by the issue types they apply to.
+        
+        Rules without declared issue types run for every issue type. The original
+        rule order is kept within each entry, so results come out in the same order.
+        Each entry also records whether the rule overrides is_applicable, so the
+        default (always True) implementation is never called.
+        """
+        declared_types = set()
+        for rule in self.rules:
+            if rule.issue_types:
+                declared_types.update(issue_type.casefold() for issue_type in rule.issue_types)
+        
+        def entries_for(issue_type: Optional[str]) -> List[Tuple[BaseRule, bool]]:
+            entries = []
+            for rule in self.rules:
+                if rule.issue_types and (
+                        issue_type is None or
+                        issue_type not in {declared.casefold() for declared in rule.issue_types}):
+                    continue
+                overrides_applicable = type(rule).is_applicable is not BaseRule.is_applicable
+                entries.append((rule, overrides_applicable))
+            return entries
+        
+        self._rules_for_any_type = entries_for(None)
+        self._rules_by_issue_type = {issue_type: entries_for(issue_type) for issue_type in declared_types}
+    
+    def _get_dispatch_entries(self, issue_type: Optional[str]) -> List[Tuple[BaseRule, bool]]:
+        """Get the (rule, call is_applicable) entries for an issue type, in run order"""
+        key = issue_type.casefold() if issue_type else None
+        return self._rules_by_issue_type.get(key, self._rules_for_any_type)
+    
+    def get_rules_for_issue_type(self, issue_type: Optional[str]) -> List[BaseRule]:
+        """Get the rules that can fire for an issue type, in run order"""
+        return [rule for rule, _ in self._get_dispatch_entries(issue_type)]
+    
+    @staticmethod
+    def _is_rule_applicable(rule: BaseRule, check_applicable: bool, issue: Dict[str, Any]) -> bool:
+        """Check a rule's declared preconditions and, if overridden, its is_applicable"""
+        if rule.preconditions and not rule.matches_preconditions(issue):
+            return False
+        return not check_applicable or rule.is_applicable(issue)
+    
+    def _get_rule_stats(self, rule: BaseRule) -> RuleStats:
+        """Counters of a rule, created on first use"""
+        stats = self.rule_stats.get(rule.rule_id)
+        if stats is None:
+            stats = self.rule_stats[rule.rule_id] = RuleStats()
+        return stats
+    
+    def _error_result(self, rule: BaseRule, issue: Dict[str, Any], error: Exception) -> RuleResult:
+        """Log a failed rule and build the error result reported in its place"""
+        print(f"[WARNING] Error running rule {rule.rule_id}: {error}")
+        if self.instrument:
+            self._get_rule_stats(rule).exceptions += 1
+        return RuleResult(
+            rule_id=rule.rule_id,
+            severity=RuleSeverity.ERROR,
+            message=f"Rule execution failed: {str(error)}",
+            issue_key=issue.get('key', 'UNKNOWN'),
+            passed=False
+        )
+        
     def add_rule(self, rule: BaseRule):
         """Manually add a rule to the engine"""
         self.rules.append(rule)
+        self._rules_customized = True
+        self._build_dispatch_table()
         
     def remove_rule(self, rule_id: str):
         """Remove a rule by its ID"""
         self.rules = [rule for rule in self.rules if rule.rule_id != rule_id]
+        self._rules_customized = True
+        self._build_dispatch_table()
+    
+    def warm_up(self):
+        """Load every rule's lookup data up front (see BaseRule.warm_up)"""
+        for rule in self.rules:
+            try:
+                rule.warm_up()
+            except Exception as e:
+                print(f"[WARNING] Could not warm up rule {rule.rule_id}: {e}")
         
     def run_rules(self, issue: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> List[RuleResult]:
         """
         Run all applicable rules against an issue.
         
+        The issue type is taken from context['issue_type'], falling back to the
+        issue's own 'issue_type'.
+        
         Args:
             issue: Processed JIRA issue data
             context: Additional context data (components, users, etc.)
@@ -85,29 +243,307 @@ class RuleEngine:
         context = context or {}
         all_results = []
         
-        for rule in self.rules:
+        # Only visit the rules that can fire for this issue type
+        issue_type = context.get('issue_type') or issue.get('issue_type')
+        
+        if self.instrument:
+            return self._run_rules_instrumented(issue, context, issue_type)
+        
+        for rule, check_applicable in self._get_dispatch_entries(issue_type):
             try:
                 # Check if rule applies to this issue
-                if rule.is_applicable(issue):
+                if self._is_rule_applicable(rule, check_applicable, issue):
                     results = rule.check(issue, context)
+                    if self.drop_passed:
+                        results = [result for result in results if not result.passed]
                     all_results.extend(results)
             except Exception as e:
                 # Log error but continue with other rules
-                print(f"[WARNING] Error running rule {rule.rule_id}: {e}")
-                # Create an error result
-                error_result = RuleResult(
-                    rule_id=rule.rule_id,
-                    severity=RuleSeverity.ERROR,
-                    message=f"Rule execution failed: {str(e)}",
-                    issue_key=issue.get('key', 'UNKNOWN'),
-                    passed=False
-                )
-                all_results.append(error_result)
+                all_results.append(self._error_result(rule, issue, e))
                 
         return all_results
     
+    def _run_rules_instrumented(self, issue: Dict[str, Any], context: Dict[str, Any],
+                                issue_type: Optional[str]) -> List[RuleResult]:
+        """run_rules, recording each rule's time and counts"""
+        all_results = []
+        
+        for rule, check_applicable in self._get_dispatch_entries(issue_type):
+            stats = self._get_rule_stats(rule)
+            stats.calls += 1
+            start = time.perf_counter()
+            try:
+                if self._is_rule_applicable(rule, check_applicable, issue):
+                    stats.applicable += 1
+                    results = rule.check(issue, context)
+                    stats.failures += sum(1 for result in results if not result.passed)
+                    if self.drop_passed:
+                        results = [result for result in results if not result.passed]
+                    all_results.extend(results)
+            except Exception as e:
+                all_results.append(self._error_result(rule, issue, e))
+            finally:
+                stats.wall_seconds += time.perf_counter() - start
+        
+        return all_results
+    
+    def run_rules_batch(self, issues: List[Dict[str, Any]],
+                        context: Optional[Dict[str, Any]] = None) -> List[List[RuleResult]]:
+        """
+        Run all applicable rules against many issues at once.
+        
+        Each rule is called once, through BaseRule.check_batch, with every issue
+        it applies to. The results are the same as calling run_rules on each issue.
+        When the engine has worker processes, the issues are split into shards
+        that are checked in parallel.
+        
+        Args:
+            issues: Processed JIRA issues
+            context: Additional context data shared by all the issues
+            
+        Returns:
+            One list of RuleResult objects per issue, in the same order
+        """
+        context = context or {}
+        
+        chunks = self._get_worker_chunks(issues)
+        if chunks:
+            try:
+                executor = self._get_executor()
+                results = []
+                worker_stats = []
+                for chunk_results, chunk_stats in executor.map(_run_worker_batch, chunks, [context] * len(chunks)):
+                    results.extend(chunk_results)
+                    worker_stats.append(chunk_stats)
+            except Exception as e:
+                self._disable_workers(e)
+            else:
+                # Merged only once every chunk succeeded; a failed batch is re-run in-process
+                for chunk_stats in worker_stats:
+                    self.merge_rule_stats(chunk_stats)
+                return results
+        
+        return self._run_rules_batch_in_process(issues, context)
+    
+    def submit_rules_batch(self, issues: List[Dict[str, Any]],
+                           context: Optional[Dict[str, Any]] = None) -> "asyncio.Future[List[List[RuleResult]]]":
+        """
+        Start run_rules_batch from async code without blocking the event loop on workers.
+        
+        With worker processes the shards are checked in the background, so other
+        coroutines (e.g. page downloads) keep running. Without workers the rules
+        run right away and an already completed future is returned.
+        
+        Must be called from a running event loop.
+        
+        Args:
+            issues: Processed JIRA issues
+            context: Additional context data shared by all the issues
+            
+        Returns:
+            Future resolving to one list of RuleResult objects per issue, in the same order
+        """
+        loop = asyncio.get_running_loop()
+        context = context or {}
+        
+        chunks = self._get_worker_chunks(issues)
+        if not chunks:
+            future = loop.create_future()
+            future.set_result(self._run_rules_batch_in_process(issues, context))
+            return future
+        
+        async def run_in_workers() -> List[List[RuleResult]]:
+            try:
+                executor = self._get_executor()
+                chunk_results = await asyncio.gather(*(
+                    loop.run_in_executor(executor, _run_worker_batch, chunk, context)
+                    for chunk in chunks
+                ))
+            except Exception as e:
+                self._disable_workers(e)
+                return self._run_rules_batch_in_process(issues, context)
+            # Merged only once every chunk succeeded; a failed batch is re-run in-process
+            for _, chunk_stats in chunk_results:
+                self.merge_rule_stats(chunk_stats)
+            return [issue_results for results, _ in chunk_results for issue_results in results]
+        
+        return asyncio.ensure_future(run_in_workers())
+    
+    def close(self):
+        """Shut down the worker processes, if any"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+    
+    def _get_worker_chunks(self, issues: List[Dict[str, Any]]) -> Optional[List[List[Dict[str, Any]]]]:
+        """Split issues into worker shards, or None if they should be checked in-process"""
+        if self.workers <= 1 or self._rules_customized or len(issues) <= self.chunk_size:
+            return None
+        return [issues[start:start + self.chunk_size] for start in range(0, len(issues), self.chunk_size)]
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the worker process pool on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_initialize_worker,
+                initargs=(self.config, self.drop_passed, self.instrument)
+            )
+        return self._executor
+    
+    def _disable_workers(self, error: Exception):
+        """Fall back to in-process rule runs after the worker pool failed"""
+        print(f"[WARNING] Rule worker processes failed ({error}); running rules in-process")
+        self.close()
+        self.workers = 0
+    
+    def _run_rules_batch_in_process(self, issues: List[Dict[str, Any]],
+                                    context: Dict[str, Any]) -> List[List[RuleResult]]:
+        """Run all applicable rules against many issues in this process"""
+        results: List[List[RuleResult]] = [[] for _ in issues]
+        
+        # Work out which issues each rule applies to
+        batches: Dict[int, List[int]] = defaultdict(list)
+        failures: Dict[int, Dict[int, RuleResult]] = defaultdict(dict)
+        for index, issue in enumerate(issues):
+            issue_type = context.get('issue_type') or issue.get('issue_type')
+            for rule, check_applicable in self._get_dispatch_entries(issue_type):
+                if self.instrument:
+                    stats = self._get_rule_stats(rule)
+                    stats.calls += 1
+                    start = time.perf_counter()
+                try:
+                    if self._is_rule_applicable(rule, check_applicable, issue):
+                        batches[id(rule)].append(index)
+                except Exception as e:
+                    failures[id(rule)][index] = self._error_result(rule, issue, e)
+                if self.instrument:
+                    stats.wall_seconds += time.perf_counter() - start
+        
+        # Run the rules in their usual order so each issue's results keep the same order
+        for rule in self.rules:
+            indices = batches.get(id(rule), [])
+            if indices:
+                if self.instrument:
+                    start = time.perf_counter()
+                rule_results = self._run_rule_batch(rule, [issues[index] for index in indices], context)
+                if self.instrument:
+                    stats = self._get_rule_stats(rule)
+                    stats.wall_seconds += time.perf_counter() - start
+                    stats.applicable += len(indices)
+                for index, issue_results in zip(indices, rule_results):
+                    if self.drop_passed:
+                        issue_results = [result for result in issue_results if not result.passed]
+                    results[index].extend(issue_results)
+            for index, error_result in failures.get(id(rule), {}).items():
+                results[index].append(error_result)
+        
+        return results
+    
+    def _run_rule_batch(self, rule: BaseRule, issues: List[Dict[str, Any]],
+                        context: Dict[str, Any]) -> List[List[RuleResult]]:
+        """
+        Run one rule's check_batch, falling back to per-issue checks if it fails.
+        
+        Failures are counted here (when instrumented) so that, as in run_rules,
+        the error results of rules that raised are counted as exceptions only.
+        """
+        stats = self._get_rule_stats(rule) if self.instrument else None
+        try:
+            rule_results = rule.check_batch(issues, context)
+            if len(rule_results) == len(issues):
+                if stats is not None:
+                    stats.failures += sum(
+                        1 for issue_results in rule_results for result in issue_results if not result.passed
+                    )
+                return rule_results
+            print(f"[WARNING] Rule {rule.rule_id} returned {len(rule_results)} batch results for "
+                  f"{len(issues)} issues; checking them one at a time")
+        except Exception as e:
+            print(f"[WARNING] Batch check of rule {rule.rule_id} failed ({e}); checking {len(issues)} issues one at a time")
+        if stats is not None:
+            stats.exceptions += 1
+        
+        # Re-run issue by issue so only the failing issues get an error result
+        rule_results = []
+        for issue in issues:
+            try:
+                issue_results = rule.check(issue, context)
+            except Exception as e:
+                rule_results.append([self._error_result(rule, issue, e)])
+                continue
+            if stats is not None:
+                stats.failures += sum(1 for result in issue_results if not result.passed)
+            rule_results.append(issue_results)
+        return rule_results
+    
+    def get_required_fields(self, base_fields: Optional[List[str]] = None) -> Optional[List[str]]:
+        """
+        Get the minimal list of JIRA fields to request for the loaded rules.
+        
+        Args:
+            base_fields: Fields needed by the caller regardless of rules (e.g., for display)
+            
+        Returns:
+            Ordered list of field names, or None if any loaded rule has not declared
+            its fields (the caller should then request the default field list)
+        """
+        fields = list(dict.fromkeys(base_fields or []))
+        
+        for rule in self.rules:
+            if rule.required_fields is None:
+                return None
+            for field in rule.required_fields:
+                if field not in fields:
+                    fields.append(field)
+                    
+        return fields
+    
+    def get_required_raw_fields(self) -> Optional[List[str]]:
+        """
+        Get the raw JIRA fields the loaded rules read from issue['raw_fields'].
+        
+        Returns:
+            Ordered list of raw field names, or None if any loaded rule has not declared
+            its fields (the caller should then keep every raw field)
+        """
+        fields = []
+        
+        for rule in self.rules:
+            if rule.required_fields is None:
+                return None
+            for field in rule.required_raw_fields:
+                if field not in fields:
+                    fields.append(field)
+                    
+        return fields
+    
+    def get_rule_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the per-rule instrumentation counters (empty unless the engine is instrumented).
+        
+        Returns:
+            rule_id -> {'calls', 'applicable', 'failures', 'exceptions', 'wall_seconds'},
+            slowest rule first
+        """
+        ordered = sorted(self.rule_stats.items(), key=lambda item: item[1].wall_seconds, reverse=True)
+        return {rule_id: stats.to_dict() for rule_id, stats in ordered}
+    
+    def take_rule_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the per-rule counters and reset them (used to collect them from worker processes)"""
+        stats = self.get_rule_stats()
+        self.rule_stats = {}
+        return stats
+    
+    def merge_rule_stats(self, rule_stats: Dict[str, Dict[str, Any]]):
+        """Add per-rule counters collected by another engine (e.g., a worker process)"""
+        for rule_id, stats in rule_stats.items():
+            if rule_id not in self.rule_stats:
+                self.rule_stats[rule_id] = RuleStats()
+            self.rule_stats[rule_id].merge(stats)
+    
     def get_rule_summary(self) -> Dict[str, Any]:
-        """Get summary of loaded rules"""
+        """Get summary of loaded rules (with the per-rule stats when the engine is instrumented)"""
         by_category = defaultdict(list)
         by_severity = defaultdict(list)
         
@@ -115,13 +551,16 @@ class RuleEngine:
             by_category[rule.category.value].append(rule.rule_id)
             by_severity[rule.severity.value].append(rule.rule_id)
             
-        return {
+        summary = {
             'total_rules': len(self.rules),
             'enabled_rules': len(self.rules),  # All loaded rules are enabled
             'rules_by_category': dict(by_category),
             'rules_by_severity': dict(by_severity),
             'loaded_rules': [rule.rule_id for rule in self.rules]
         }
+        if self.instrument:
+            summary['rule_stats'] = self.get_rule_stats()
+        return summary
     
     def get_rules_by_category(self, category: RuleCategory) -> List[BaseRule]:
         """Get all rules for a specific category"""
@@ -203,4 +642,32 @@ class RuleReporter:
             'failed': failed,
             'pass_rate': round((passed / total * 100) if total > 0 else 0, 1),
             'failures_by_severity': dict(by_severity)
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def display_rule_stats(rule_stats: Dict[str, Dict[str, Any]], as_json: bool = False) -> None:
+        """
+        Print per-rule instrumentation counters (RuleEngine.get_rule_stats).
+        
+        Args:
+            rule_stats: rule_id -> counters, slowest rule first
+            as_json: Print the counters as JSON instead of a table
+        """
+        if as_json:
+            print(json.dumps(rule_stats, indent=2))
+            return
+        
+        if not rule_stats:
+            print("    No rule statistics recorded")
+            return
+        
+        total_seconds = sum(stats['wall_seconds'] for stats in rule_stats.values())
+        width = max(len('Rule'), max(len(rule_id) for rule_id in rule_stats))
+        print(f"    {'Rule':<{width}} {'Time (s)':>9} {'Share':>6} {'Calls':>8} {'Applied':>8} "
+              f"{'Failures':>9} {'Errors':>7} {'us/call':>8}")
+        for rule_id, stats in rule_stats.items():
+            share = stats['wall_seconds'] / total_seconds * 100 if total_seconds else 0
+            per_call = stats['wall_seconds'] / stats['calls'] * 1e6 if stats['calls'] else 0
+            print(f"    {rule_id:<{width}} {stats['wall_seconds']:>9.3f} {share:>5.1f}% {stats['calls']:>8} "
+                  f"{stats['applicable']:>8} {stats['failures']:>9} {stats['exceptions']:>7} {per_call:>8.1f}")
+        print(f"    {'Total':<{width}} {total_seconds:>9.3f}")
@@ -5,12 +5,15 @@ These rules check for issues related to assignee management and user assignments
 """
 
 from typing import Dict, List, Any
-from rules.base_rule import BaseRule, RuleResult, RuleSeverity, RuleCategory
+from rules.base_rule import BaseRule, RuleResult, RuleSeverity, RuleCategory, IN_PROGRESS_STATUSES
 
 
 class UnassignedEpicRule(BaseRule):
     """Check if EPIC is assigned to someone"""
     
+    required_fields = ('assignee', 'status')
+    preconditions = {'status': IN_PROGRESS_STATUSES}
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.ASSIGNMENT
         
@@ -27,7 +30,7 @@ class UnassignedEpicRule(BaseRule):
         issue_type = context.get('issue_type', 'issue')
         
         # Only check issues that are in progress-like states
-        if not status or status.lower() not in ['in progress', 'in development', 'in review', 'testing']:
+        if not status or status.lower() not in IN_PROGRESS_STATUSES:
             return []
         
         if not assignee or assignee == 'Unassigned':
@@ -43,7 +46,8 @@ class UnassignedEpicRule(BaseRule):
         return [RuleResult(
             rule_id=self.rule_id,
             severity=RuleSeverity.INFO,
-            message=f"Assigned to: {assignee}",
+            message="Assigned to: {}",
+            message_args=(assignee,),
             issue_key=issue_key,
             passed=True
         )]
@@ -52,6 +56,9 @@ class UnassignedEpicRule(BaseRule):
 class InactiveAssigneeRule(BaseRule):
     """Check if assignee is an active user"""
     
+    required_fields = ('assignee',)
+    required_raw_fields = ('assignee',)
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.ASSIGNMENT
         
@@ -88,7 +95,8 @@ class InactiveAssigneeRule(BaseRule):
         return [RuleResult(
             rule_id=self.rule_id,
             severity=RuleSeverity.INFO,
-            message=f"Assignee {assignee} is active",
+            message="Assignee {} is active",
+            message_args=(assignee,),
             issue_key=issue_key,
             passed=True
         )]
\ No newline at end of file
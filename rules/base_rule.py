@@ -5,8 +5,9 @@ This module provides the foundation for implementing modular data quality checks
 for JIRA issues. Each rule inherits from BaseRule and implements specific validation logic.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, FrozenSet
 from enum import Enum
 from datetime import datetime
 
@@ -30,19 +31,61 @@ class RuleCategory(Enum):
     COMPLIANCE = "compliance"
 
 
+# Statuses (casefolded) treated as "in progress" by workflow-related rules
+IN_PROGRESS_STATUSES = frozenset({'in progress', 'in development', 'in review', 'testing'})
+
+
 class RuleResult:
-    """Result of running a rule against an issue"""
+    """
+    Result of running a rule against an issue.
+    
+    Results are slotted and share one timestamp per run (see start_run). The
+    message may be given as a str.format template with message_args, in which
+    case it is only rendered when first read - results that are never displayed
+    (e.g. filtered out passes) never build their message string.
+    """
+    
+    __slots__ = ('rule_id', 'severity', '_message', '_message_args', 'issue_key', 'passed', 'suggestion')
+    
+    # Time the current run started, shared by every result (see start_run)
+    _run_timestamp: Optional[datetime] = None
     
     def __init__(self, rule_id: str, severity: RuleSeverity, 
                  message: str, issue_key: str, passed: bool = False,
-                 suggestion: Optional[str] = None):
-        self.rule_id = rule_id
+                 suggestion: Optional[str] = None, message_args: Optional[Tuple[Any, ...]] = None):
+        # Rule IDs and issue keys repeat across many results, so share one copy of each
+        self.rule_id = sys.intern(rule_id) if type(rule_id) is str else rule_id
         self.severity = severity
-        self.message = message
-        self.issue_key = issue_key
+        self._message = message
+        self._message_args = message_args
+        self.issue_key = sys.intern(issue_key) if type(issue_key) is str else issue_key
         self.passed = passed
         self.suggestion = suggestion  # Optional suggestion for fixing the issue
-        self.timestamp = datetime.now()
+    
+    @property
+    def message(self) -> str:
+        """The result message, rendered from its template on first use"""
+        if self._message_args is not None:
+            self._message = self._message.format(*self._message_args)
+            self._message_args = None
+        return self._message
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Time the run that produced this result started"""
+        if RuleResult._run_timestamp is None:
+            RuleResult._run_timestamp = datetime.now()
+        return RuleResult._run_timestamp
+    
+    @classmethod
+    def start_run(cls, timestamp: Optional[datetime] = None):
+        """
+        Set the timestamp reported by every result of the run that is starting.
+        
+        Args:
+            timestamp: Run start time (default: now)
+        """
+        cls._run_timestamp = timestamp or datetime.now()
     
     def __str__(self):
         status = "[PASS]" if self.passed else self._get_severity_icon()
@@ -65,6 +108,24 @@ class RuleResult:
 class BaseRule(ABC):
     """Abstract base class for all data quality rules"""
     
+    # JIRA fields (as named in the search API 'fields' parameter) that check() reads.
+    # None means the rule has not declared its fields, so every default field is fetched.
+    required_fields: Optional[Tuple[str, ...]] = None
+    
+    # Raw JIRA fields that check() reads from issue['raw_fields']. Only the raw fields
+    # declared by some loaded rule are kept on processed issues (all of them are kept
+    # while any rule leaves required_fields undeclared).
+    required_raw_fields: Tuple[str, ...] = ()
+    
+    # Issue types (case-insensitive) the rule can fire for; None means every issue type.
+    # The rule engine only runs the rule for issues of these types.
+    issue_types: Optional[FrozenSet[str]] = None
+    
+    # Processed issue field -> values (case-insensitive) the field must have for the
+    # rule to fire, e.g. {'status': frozenset({'in progress'})}. Checked by the engine
+    # before check() is called; issues with a missing field are skipped.
+    preconditions: Dict[str, FrozenSet[str]] = {}
+    
     def __init__(self):
         self.rule_id = self.__class__.__name__
         self.category = self.get_category()
@@ -85,6 +146,31 @@ class BaseRule(ABC):
         """
         pass
     
+    def check_batch(self, issues: List[Dict[str, Any]], context: Dict[str, Any]) -> List[List[RuleResult]]:
+        """
+        Check the rule against many issues at once.
+        
+        Override this in rules that can work on a whole column of values in one
+        pass. Overrides must return exactly what check() returns for each issue.
+        
+        Args:
+            issues: Processed JIRA issues the rule applies to
+            context: Additional context shared by all the issues
+            
+        Returns:
+            One list of RuleResult objects per issue, in the same order
+        """
+        return [self.check(issue, context) for issue in issues]
+    
+    def warm_up(self):
+        """
+        Load any lookup data the rule needs before the first check.
+        
+        Called once in each rule worker process so the data is not loaded while
+        checking issues. Override this in rules that read lookup tables.
+        """
+        pass
+    
     @abstractmethod 
     def get_category(self) -> RuleCategory:
         """Return the category this rule belongs to"""
@@ -113,5 +199,21 @@ class BaseRule(ABC):
         """
         return True
     
+    def matches_preconditions(self, issue: Dict[str, Any]) -> bool:
+        """
+        Check the declared preconditions against an issue.
+        
+        Args:
+            issue: Processed JIRA issue data
+            
+        Returns:
+            True if every precondition field has one of its allowed values
+        """
+        for field, allowed_values in self.preconditions.items():
+            value = issue.get(field)
+            if not value or str(value).casefold() not in allowed_values:
+                return False
+        return True
+    
     def __str__(self):
         return f"{self.rule_id} ({self.category.value}, {self.severity.value}): {self.description}"
\ No newline at end of file
@@ -5,13 +5,21 @@ These rules check for issues related to business planning, priority management,
 and project alignment that apply to various issue types.
 """
 
-from typing import Dict, List, Any
-from rules.base_rule import BaseRule, RuleResult, RuleSeverity, RuleCategory
+from typing import Dict, List, Any, Optional
+from rules.base_rule import BaseRule, RuleResult, RuleSeverity, RuleCategory, IN_PROGRESS_STATUSES
+from rules.date_utils import DateThresholdBatchMixin
 
 
-class HighPriorityStaleRule(BaseRule):
+class HighPriorityStaleRule(DateThresholdBatchMixin, BaseRule):
     """Check if high priority issues are stale (not updated recently)"""
     
+    required_fields = ('priority', 'updated')
+    preconditions = {'priority': frozenset({'high', 'highest', 'critical', 'blocker'})}
+    
+    date_field = 'updated'
+    filter_field = 'priority'
+    filter_values = frozenset({'high', 'highest', 'critical', 'blocker'})
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.BUSINESS
         
@@ -21,7 +29,13 @@ class HighPriorityStaleRule(BaseRule):
     def get_description(self) -> str:
         return "Check if high priority issues are stale"
         
-    def check(self, issue: Dict[str, Any], context: Dict[str, Any]) -> List[RuleResult]:
+    def threshold_days(self, context: Dict[str, Any]) -> int:
+        # High priority issues should be updated within 7 days
+        return 7
+    
+    def _evaluate(self, issue: Dict[str, Any], context: Dict[str, Any],
+                  seconds_since_update: Optional[float]) -> List[RuleResult]:
+        """Build the results for an issue, given the seconds since its last update (None if unparseable)"""
         priority = issue.get('priority')
         updated = issue.get('updated')
         issue_key = str(issue.get('key', 'UNKNOWN'))
@@ -40,56 +54,48 @@ class HighPriorityStaleRule(BaseRule):
                 suggestion="Verify issue status and update immediately"
             )]
         
-        from datetime import datetime, timedelta
-        import re
-        
-        try:
-            # Parse the full JIRA datetime format for more accurate calculation
-            clean_date = re.sub(r'\.\d{3}\+\d{4}$|Z$', '', updated)
-            
-            if 'T' in clean_date:
-                # Full datetime format
-                updated_date = datetime.strptime(clean_date, '%Y-%m-%dT%H:%M:%S')
-            else:
-                # Date only format (fallback)
-                updated_date = datetime.strptime(updated[:10], '%Y-%m-%d')
-            
-            # Calculate more precise time difference
-            time_diff = datetime.now() - updated_date
-            days_since_update = int(time_diff.total_seconds() / 86400)
-            
-            # High priority issues should be updated within 7 days
-            if days_since_update > 7:
-                return [RuleResult(
-                    rule_id=self.rule_id,
-                    severity=self.severity,
-                    message=f"High priority issue [{issue_key}] not updated in {days_since_update} days",
-                    issue_key=issue_key,
-                    passed=False,
-                    suggestion="High priority issues should be updated weekly - review and update status"
-                )]
-            
+        if seconds_since_update is None:
             return [RuleResult(
                 rule_id=self.rule_id,
-                severity=RuleSeverity.INFO,
-                message=f"High priority issue updated {days_since_update} days ago (acceptable)",
+                severity=RuleSeverity.WARNING,
+                message=f"Issue [{issue_key}] has invalid update date format: {updated}",
                 issue_key=issue_key,
-                passed=True
+                passed=False
             )]
-            
-        except (ValueError, TypeError):
+        
+        days_since_update = int(seconds_since_update / 86400)
+        
+        if days_since_update > self.threshold_days(context):
             return [RuleResult(
                 rule_id=self.rule_id,
-                severity=RuleSeverity.WARNING,
-                message=f"Issue [{issue_key}] has invalid update date format: {updated}",
+                severity=self.severity,
+                message=f"High priority issue [{issue_key}] not updated in {days_since_update} days",
                 issue_key=issue_key,
-                passed=False
+                passed=False,
+                suggestion="High priority issues should be updated weekly - review and update status"
             )]
+        
+        return self._passed(issue, context, seconds_since_update)
+    
+    def _passed(self, issue: Dict[str, Any], context: Dict[str, Any], seconds_since_update: float) -> List[RuleResult]:
+        """Results of an issue updated within the threshold"""
+        days_since_update = int(seconds_since_update / 86400)
+        issue_key = str(issue.get('key', 'UNKNOWN'))
+        return [RuleResult(
+            rule_id=self.rule_id,
+            severity=RuleSeverity.INFO,
+            message="High priority issue updated {} days ago (acceptable)",
+            message_args=(days_since_update,),
+            issue_key=issue_key,
+            passed=True
+        )]
 
 
 class MissingPriorityRule(BaseRule):
     """Check if issue has a priority set"""
     
+    required_fields = ('priority',)
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.BUSINESS
         
@@ -117,15 +123,32 @@ class MissingPriorityRule(BaseRule):
         return [RuleResult(
             rule_id=self.rule_id,
             severity=RuleSeverity.INFO,
-            message=f"Priority: {priority}",
+            message="Priority: {}",
+            message_args=(priority,),
             issue_key=issue_key,
             passed=True
         )]
 
 
-class InProgressTooLongRule(BaseRule):
+class InProgressTooLongRule(DateThresholdBatchMixin, BaseRule):
     """Check if issue has been in progress for too long based on issue type"""
     
+    required_fields = ('status', 'created')
+    preconditions = {'status': IN_PROGRESS_STATUSES}
+    
+    date_field = 'created'
+    filter_field = 'status'
+    filter_values = IN_PROGRESS_STATUSES
+    
+    # Days in progress allowed per issue type
+    THRESHOLDS = {
+        'Epic': 365,      # 1 year for EPICs
+        'Story': 60,      # 2 months for Stories
+        'Task': 30,       # 1 month for Tasks
+        'Bug': 14,        # 2 weeks for Bugs
+        'Sub-task': 7     # 1 week for Sub-tasks
+    }
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.WORKFLOW
         
@@ -135,79 +158,70 @@ class InProgressTooLongRule(BaseRule):
     def get_description(self) -> str:
         return "Check if issue has been in progress too long for its type"
         
-    def check(self, issue: Dict[str, Any], context: Dict[str, Any]) -> List[RuleResult]:
+    def threshold_days(self, context: Dict[str, Any]) -> int:
+        # Different thresholds for different issue types
+        return self.THRESHOLDS.get(context.get('issue_type', 'Issue'), 30)  # Default 30 days
+    
+    def _evaluate(self, issue: Dict[str, Any], context: Dict[str, Any],
+                  seconds_since_created: Optional[float]) -> List[RuleResult]:
+        """Build the results for an issue, given the seconds since it was created (None if unparseable)"""
         status = issue.get('status')
         created = issue.get('created')
         issue_key = str(issue.get('key', 'UNKNOWN'))
         issue_type = context.get('issue_type', 'Issue')
         
         # Only check issues in progress-like states
-        if not status or status.lower() not in ['in progress', 'in development', 'in review', 'testing']:
+        if not status or status.lower() not in IN_PROGRESS_STATUSES:
             return []
             
         if not created:
             return []
         
-        from datetime import datetime
-        import re
-        
-        try:
-            # Parse the full JIRA datetime format for more accurate calculation
-            clean_date = re.sub(r'\.\d{3}\+\d{4}$|Z$', '', created)
-            
-            if 'T' in clean_date:
-                # Full datetime format
-                created_date = datetime.strptime(clean_date, '%Y-%m-%dT%H:%M:%S')
-            else:
-                # Date only format (fallback)
-                created_date = datetime.strptime(created[:10], '%Y-%m-%d')
-            
-            # Calculate more precise time difference
-            time_diff = datetime.now() - created_date
-            days_in_progress = int(time_diff.total_seconds() / 86400)
-            
-            # Different thresholds for different issue types
-            thresholds = {
-                'Epic': 365,      # 1 year for EPICs
-                'Story': 60,      # 2 months for Stories
-                'Task': 30,       # 1 month for Tasks
-                'Bug': 14,        # 2 weeks for Bugs
-                'Sub-task': 7     # 1 week for Sub-tasks
-            }
-            
-            threshold = thresholds.get(issue_type, 30)  # Default 30 days
-            
-            if days_in_progress > threshold:
-                return [RuleResult(
-                    rule_id=self.rule_id,
-                    severity=self.severity,
-                    message=f"{issue_type} [{issue_key}] in progress for {days_in_progress} days (>{threshold} day threshold)",
-                    issue_key=issue_key,
-                    passed=False,
-                    suggestion=f"Review {issue_type.lower()} scope and progress - consider breaking down or reassigning"
-                )]
-            
+        if seconds_since_created is None:
             return [RuleResult(
                 rule_id=self.rule_id,
-                severity=RuleSeverity.INFO,
-                message=f"In progress for {days_in_progress} days (within {threshold} day threshold)",
+                severity=RuleSeverity.WARNING,
+                message=f"Issue [{issue_key}] has invalid creation date format: {created}",
                 issue_key=issue_key,
-                passed=True
+                passed=False
             )]
-            
-        except (ValueError, TypeError):
+        
+        days_in_progress = int(seconds_since_created / 86400)
+        threshold = self.threshold_days(context)
+        
+        if days_in_progress > threshold:
             return [RuleResult(
                 rule_id=self.rule_id,
-                severity=RuleSeverity.WARNING,
-                message=f"Issue [{issue_key}] has invalid creation date format: {created}",
+                severity=self.severity,
+                message=f"{issue_type} [{issue_key}] in progress for {days_in_progress} days (>{threshold} day threshold)",
                 issue_key=issue_key,
-                passed=False
+                passed=False,
+                suggestion=f"Review {issue_type.lower()} scope and progress - consider breaking down or reassigning"
             )]
+        
+        return self._passed(issue, context, seconds_since_created)
+    
+    def _passed(self, issue: Dict[str, Any], context: Dict[str, Any], seconds_since_created: float) -> List[RuleResult]:
+        """Results of an issue in progress for no longer than the threshold"""
+        days_in_progress = int(seconds_since_created / 86400)
+        threshold = self.threshold_days(context)
+        issue_key = str(issue.get('key', 'UNKNOWN'))
+        return [RuleResult(
+            rule_id=self.rule_id,
+            severity=RuleSeverity.INFO,
+            message="In progress for {} days (within {} day threshold)",
+            message_args=(days_in_progress, threshold),
+            issue_key=issue_key,
+            passed=True
+        )]
 
 
 class SubTaskOrphanRule(BaseRule):
     """Check if sub-tasks have parent issues and stories have child tasks"""
     
+    required_fields = ('issuetype', 'issuelinks', 'components', 'description')
+    issue_types = frozenset({'sub-task', 'story'})
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.WORKFLOW
         
@@ -217,11 +231,6 @@ class SubTaskOrphanRule(BaseRule):
     def get_description(self) -> str:
         return "Check parent-child relationships for sub-tasks and stories"
         
-    def is_applicable(self, issue: Dict[str, Any]) -> bool:
-        """Only apply to Sub-tasks and Stories"""
-        issue_type = issue.get('issue_type', '')
-        return issue_type in ['Sub-task', 'Story']
-        
     def check(self, issue: Dict[str, Any], context: Dict[str, Any]) -> List[RuleResult]:
         issue_type = issue.get('issue_type', '')
         issue_key = str(issue.get('key', 'UNKNOWN'))
@@ -254,13 +263,14 @@ class SubTaskOrphanRule(BaseRule):
             
             # Only flag if it's a large story (has many components or long description)
             components = issue.get('components', [])
-            description = issue.get('description', '')
+            description = issue.get('description') or ''
             
             if (len(components) > 2 or len(description) > 500) and not has_subtasks:
                 return [RuleResult(
                     rule_id=self.rule_id,
                     severity=RuleSeverity.INFO,
-                    message=f"Large {issue_type.upper()} [{issue_key}] might benefit from sub-tasks",
+                    message="Large {} [{}] might benefit from sub-tasks",
+                    message_args=(issue_type.upper(), issue_key),
                     issue_key=issue_key,
                     passed=True,  # This is just a suggestion
                     suggestion=f"Consider breaking this large {issue_type.lower()} into smaller sub-tasks for better tracking"
@@ -269,7 +279,8 @@ class SubTaskOrphanRule(BaseRule):
         return [RuleResult(
             rule_id=self.rule_id,
             severity=RuleSeverity.INFO,
-            message=f"{issue_type} relationships look good",
+            message="{} relationships look good",
+            message_args=(issue_type,),
             issue_key=issue_key,
             passed=True
         )]
@@ -278,6 +289,8 @@ class SubTaskOrphanRule(BaseRule):
 class ToolingTransferRule(BaseRule):
     """Check if issue has 'Tooling' label and suggest transfer to Git"""
     
+    required_fields = ('labels', 'components')
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.BUSINESS
         
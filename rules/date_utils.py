@@ -0,0 +1,219 @@
+"""
+Date helpers shared by the timeline rules.
+
+JIRA timestamps look like ``2024-01-15T10:30:00.000+0000``. Each distinct
+timestamp is parsed once (through a bounded LRU cache) into a timezone-aware
+datetime and an integer Unix epoch, keeping the UTC offset. Issue
+normalization stores both next to the raw value (``created_at`` and
+``created_epoch`` for ``created``), and the rules read those instead of
+parsing again.
+
+``now`` is captured once per run and passed to the rules in
+``context['now']``, so every issue is measured against the same instant.
+
+Rules that compare the age of one date field with a threshold use
+DateThresholdBatchMixin to check a whole page of issues as NumPy columns.
+"""
+
+import math
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - check_batch falls back to per-issue checks
+    np = None
+
+
+# Full JIRA timestamp format, e.g. 2024-01-15T10:30:00.000+0000
+JIRA_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+
+# Date fields parsed when an issue is normalized
+JIRA_DATE_FIELDS = ('created', 'updated')
+
+# Distinct timestamps kept by the parse cache
+PARSE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse one timestamp string (cached), or None if it cannot be parsed"""
+    try:
+        parsed = datetime.strptime(value, JIRA_TIMESTAMP_FORMAT)
+    except ValueError:
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def parse_jira_datetime_aware(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a JIRA (or other ISO 8601) timestamp into a timezone-aware datetime.
+
+    The UTC offset is kept. Timestamps without an offset, and plain
+    'YYYY-MM-DD' dates, are taken to be UTC.
+
+    Args:
+        value: JIRA timestamp, e.g. '2024-01-15T10:30:00.000+0000' or '2024-01-15T10:30:00Z'
+
+    Returns:
+        Aware datetime, or None if the value is missing or cannot be parsed
+    """
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_timestamp(value)
+
+
+def jira_epoch(value: Optional[str]) -> Optional[int]:
+    """
+    Unix epoch (whole seconds) of a JIRA timestamp.
+
+    Args:
+        value: JIRA timestamp
+
+    Returns:
+        Seconds since the epoch, or None if the value is missing or cannot be parsed
+    """
+    parsed = parse_jira_datetime_aware(value)
+    if parsed is None:
+        return None
+    return int(parsed.timestamp())
+
+
+def parse_issue_dates(issue: Dict[str, Any], fields: Sequence[str] = JIRA_DATE_FIELDS) -> Dict[str, Any]:
+    """
+    Parse the date fields of a processed issue.
+
+    Args:
+        issue: Processed issue dictionary with the raw timestamps
+        fields: Date fields to parse
+
+    Returns:
+        Dictionary with '<field>_at' (aware datetime) and '<field>_epoch' (int)
+        for each field, None where a value is missing or cannot be parsed
+    """
+    parsed = {}
+    for field in fields:
+        value = parse_jira_datetime_aware(issue.get(field))
+        parsed[f'{field}_at'] = value
+        parsed[f'{field}_epoch'] = int(value.timestamp()) if value is not None else None
+    return parsed
+
+
+def get_issue_datetime(issue: Dict[str, Any], field: str) -> Optional[datetime]:
+    """Aware datetime of an issue date field, parsed at normalization when available"""
+    parsed_key = f'{field}_at'
+    if parsed_key in issue:
+        return issue[parsed_key]
+    return parse_jira_datetime_aware(issue.get(field))
+
+
+def get_issue_epoch(issue: Dict[str, Any], field: str) -> Optional[int]:
+    """Unix epoch of an issue date field, parsed at normalization when available"""
+    parsed_key = f'{field}_epoch'
+    if parsed_key in issue:
+        return issue[parsed_key]
+    return jira_epoch(issue.get(field))
+
+
+def get_run_now(context: Optional[Dict[str, Any]]) -> datetime:
+    """
+    The time a run started, as passed to the rules in context['now'].
+
+    Args:
+        context: Rule context
+
+    Returns:
+        Aware datetime (the current time if the context has none)
+    """
+    now = (context or {}).get('now')
+    if now is None:
+        return datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        # Naive times are local time
+        return now.astimezone()
+    return now
+
+
+def seconds_since(epoch: Optional[int], now: datetime) -> Optional[float]:
+    """
+    Seconds elapsed between an epoch timestamp and now.
+
+    Args:
+        epoch: Unix epoch, e.g. from get_issue_epoch
+        now: Aware reference time
+
+    Returns:
+        Elapsed seconds, or None if the epoch is missing
+    """
+    if epoch is None:
+        return None
+    return now.timestamp() - epoch
+
+
+class DateThresholdBatchMixin:
+    """
+    Columnar check_batch for rules that flag issues whose date field is too old.
+
+    The page's epochs go into one NumPy array, and the applicability filter and
+    the age threshold are evaluated as masks over the whole column. The rule's
+    _evaluate() then only runs for the issues the masks cannot settle (older
+    than the threshold, or without a parseable date), and _passed() builds the
+    results of the rest, so check() and check_batch() return the same results.
+
+    Rules using the mixin define:
+        date_field: Issue date field whose age is checked ('created' or 'updated')
+        filter_field / filter_values: Field the rule only checks for these values (optional)
+        filter_lowercase: Compare the filter field case-insensitively
+        threshold_days(context): Largest age (whole days) that passes
+        _evaluate(issue, context, seconds): Results given the age in seconds (None if unknown)
+        _passed(issue, context, seconds): Results of an issue within the threshold
+    """
+
+    date_field = 'updated'
+    filter_field: Optional[str] = None
+    filter_values: FrozenSet[str] = frozenset()
+    filter_lowercase = True
+
+    def threshold_days(self, context: Dict[str, Any]) -> int:
+        raise NotImplementedError
+
+    def check(self, issue: Dict[str, Any], context: Dict[str, Any]) -> List[Any]:
+        return self._evaluate(issue, context, seconds_since(get_issue_epoch(issue, self.date_field),
+                                                            get_run_now(context)))
+
+    def _filter_mask(self, issues: List[Dict[str, Any]]):
+        """Boolean column: issues the rule applies to"""
+        if self.filter_field is None:
+            return np.ones(len(issues), dtype=bool)
+        values = np.array([issue.get(self.filter_field) or '' for issue in issues], dtype=str)
+        if self.filter_lowercase:
+            values = np.char.lower(values)
+        return np.isin(values, list(self.filter_values))
+
+    def check_batch(self, issues: List[Dict[str, Any]], context: Dict[str, Any]) -> List[List[Any]]:
+        if np is None or not issues:
+            return super().check_batch(issues, context)
+
+        # Missing or unparseable dates become NaN, which fails every comparison below
+        epochs = np.array([get_issue_epoch(issue, self.date_field) for issue in issues], dtype=float)
+        seconds = get_run_now(context).timestamp() - epochs
+        applies = self._filter_mask(issues)
+        # Whole days, truncated toward zero like int() in _evaluate
+        passed = applies & (np.trunc(seconds / 86400) <= self.threshold_days(context))
+
+        results = []
+        for issue, issue_seconds, issue_applies, issue_passed in zip(issues, seconds.tolist(),
+                                                                     applies.tolist(), passed.tolist()):
+            if issue_passed:
+                results.append(self._passed(issue, context, issue_seconds))
+            elif issue_applies:
+                results.append(self._evaluate(issue, context, None if math.isnan(issue_seconds) else issue_seconds))
+            else:
+                results.append([])
+        return results
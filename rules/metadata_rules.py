@@ -11,6 +11,8 @@ from rules.base_rule import BaseRule, RuleResult, RuleSeverity, RuleCategory
 class MissingComponentsRule(BaseRule):
     """Check if EPIC has components assigned"""
     
+    required_fields = ('components', 'summary')
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.METADATA
         
@@ -54,7 +56,8 @@ class MissingComponentsRule(BaseRule):
         return [RuleResult(
             rule_id=self.rule_id,
             severity=RuleSeverity.INFO,
-            message=f"Has {len(component_names)} components: {', '.join(component_names)}",
+            message="Has {} components: {}",
+            message_args=(len(component_names), ', '.join(component_names)),
             issue_key=issue_key,
             passed=True
         )]
@@ -63,6 +66,8 @@ class MissingComponentsRule(BaseRule):
 class MissingFixVersionRule(BaseRule):
     """Check if EPIC has a fix version set"""
     
+    required_fields = ('fixVersions',)
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.METADATA
         
@@ -91,7 +96,8 @@ class MissingFixVersionRule(BaseRule):
         return [RuleResult(
             rule_id=self.rule_id,
             severity=RuleSeverity.INFO,
-            message=f"FixVersion(s): {', '.join(version_names)}",
+            message="FixVersion(s): {}",
+            message_args=(', '.join(version_names),),
             issue_key=issue_key,
             passed=True
         )]
@@ -100,6 +106,8 @@ class MissingFixVersionRule(BaseRule):
 class LegacyFixVersionRule(BaseRule):
     """Check if EPIC fix version is less than 5.0"""
     
+    required_fields = ('fixVersions',)
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.METADATA
         
@@ -138,7 +146,8 @@ class LegacyFixVersionRule(BaseRule):
                     results.append(RuleResult(
                         rule_id=self.rule_id,
                         severity=RuleSeverity.INFO,
-                        message=f"FixVersion {version_name} is current",
+                        message="FixVersion {} is current",
+                        message_args=(version_name,),
                         issue_key=issue_key,
                         passed=True
                     ))
@@ -147,7 +156,8 @@ class LegacyFixVersionRule(BaseRule):
                 results.append(RuleResult(
                     rule_id=self.rule_id,
                     severity=RuleSeverity.INFO,
-                    message=f"FixVersion {version_name} format could not be validated",
+                    message="FixVersion {} format could not be validated",
+                    message_args=(version_name,),
                     issue_key=issue_key,
                     passed=True
                 ))
@@ -158,6 +168,8 @@ class LegacyFixVersionRule(BaseRule):
 class MissingDescriptionRule(BaseRule):
     """Check if EPIC has a description"""
     
+    required_fields = ('description',)
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.CONTENT
         
@@ -197,7 +209,8 @@ class MissingDescriptionRule(BaseRule):
         return [RuleResult(
             rule_id=self.rule_id,
             severity=RuleSeverity.INFO,
-            message=f"Has description ({len(description.strip())} characters)",
+            message="Has description ({} characters)",
+            message_args=(len(description.strip()),),
             issue_key=issue_key,
             passed=True
         )]
@@ -206,6 +219,8 @@ class MissingDescriptionRule(BaseRule):
 class LabelsInfoRule(BaseRule):
     """Display labels assigned to the issue as INFO"""
     
+    required_fields = ('labels',)
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.METADATA
         
@@ -233,7 +248,8 @@ class LabelsInfoRule(BaseRule):
         return [RuleResult(
             rule_id=self.rule_id,
             severity=RuleSeverity.INFO,
-            message=f"Labels: {labels_text}",
+            message="Labels: {}",
+            message_args=(labels_text,),
             issue_key=issue_key,
             passed=True
         )]
@@ -242,6 +258,8 @@ class LabelsInfoRule(BaseRule):
 class CommentCountInfoRule(BaseRule):
     """Display the number of comments on the issue as INFO"""
     
+    required_fields = ('comment', 'labels')
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.METADATA
         
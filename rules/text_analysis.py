@@ -0,0 +1,153 @@
+"""
+Single-pass text analysis of JIRA issues for the TMF rules.
+
+The summary, description, components and fix versions of an issue are scanned
+once with one combined pattern that picks out TMF API codes (``TMF622``,
+``TMF 622``) and version mentions (``v4``, ``v4.0.1``, ``version 4``). The
+result is stored on the issue, so every rule and the report read the same
+precomputed references instead of rescanning the text.
+
+Codes and versions are listed in the order they first appear.
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Key under which the analysis is memoized on the issue dictionary
+TEXT_ANALYSIS_KEY = '_text_analysis'
+
+# One pass finds TMF codes and version mentions. The alternatives cannot
+# overlap, so each finds exactly what its own findall() used to find.
+_TOKEN_PATTERN = re.compile(
+    r'TMF\s*(?P<tmf>\d{3})'         # TMF622, TMF 622
+    r'|v(?P<v>\d+)(?:\.\d+)*'       # v1, v1.0, v1.2.3 (also V1)
+    r'|version\s*(?P<version>\d+)', # version 1, version 2
+    re.IGNORECASE
+)
+
+
+def _unique(values: Iterable[str]) -> List[str]:
+    """Drop duplicates, keeping the first occurrence of each value"""
+    return list(dict.fromkeys(values))
+
+
+def _scan(text: str) -> Iterator[Tuple[str, str, int, int]]:
+    """
+    Yield every TMF code and version mention in a text.
+
+    Yields:
+        (kind, value, start, end) tuples, where kind is 'tmf' (value 'TMF622')
+        or 'version' (value 'v4')
+    """
+    for match in _TOKEN_PATTERN.finditer(text):
+        tmf_number = match.group('tmf')
+        if tmf_number is not None:
+            yield 'tmf', f"TMF{tmf_number}", match.start(), match.end()
+        else:
+            number = match.group('v') or match.group('version')
+            yield 'version', f"v{number}", match.start(), match.end()
+
+
+def _name_of(item: Any) -> str:
+    """Name of a JIRA component or version (dict with 'name', or a plain value)"""
+    if isinstance(item, dict):
+        return item.get('name', '') or ''
+    return str(item)
+
+
+def find_tmf_codes(text: Optional[str]) -> List[str]:
+    """
+    Find the TMF API codes mentioned in a text.
+
+    Args:
+        text: Text to search (None allowed)
+
+    Returns:
+        Unique codes such as 'TMF622', in order of first appearance
+    """
+    if not text:
+        return []
+    return _unique(value for kind, value, _, _ in _scan(text) if kind == 'tmf')
+
+
+class TextAnalysis:
+    """
+    TMF codes and versions referenced by one issue.
+
+    Attributes:
+        summary_tmf_codes: Codes found in the summary
+        description_tmf_codes: Codes found in the description
+        text_tmf_codes: Codes found in the summary and description together
+        component_tmf_codes: Codes found in the component names
+        all_tmf_codes: Codes from the text followed by those only in components
+        versions: Versions from the fix versions followed by those in the text
+    """
+
+    __slots__ = ('summary_tmf_codes', 'description_tmf_codes', 'text_tmf_codes',
+                 'component_tmf_codes', 'all_tmf_codes', 'versions')
+
+    def __init__(self, summary: Optional[str], description: Optional[str],
+                 components: Optional[Iterable[Any]] = None,
+                 fix_versions: Optional[Iterable[Any]] = None):
+        summary = summary or ''
+        description = description or ''
+        # Summary and description are scanned as one text, as the rules always have
+        summary_end = len(summary)
+        description_start = summary_end + 1
+
+        summary_codes, description_codes, text_codes, text_versions = [], [], [], []
+        for kind, value, start, end in _scan(f"{summary} {description}"):
+            if kind == 'version':
+                text_versions.append(value)
+                continue
+            text_codes.append(value)
+            if end <= summary_end:
+                summary_codes.append(value)
+            elif start >= description_start:
+                description_codes.append(value)
+
+        component_codes = []
+        for component in components or ():
+            component_codes.extend(value for kind, value, _, _ in _scan(_name_of(component)) if kind == 'tmf')
+
+        fix_version_versions = []
+        for version in fix_versions or ():
+            # Only 'v4'-style names count for fix versions, not 'version 4'
+            fix_version_versions.extend(
+                f"v{match.group('v')}" for match in _TOKEN_PATTERN.finditer(_name_of(version))
+                if match.group('v') is not None
+            )
+
+        self.summary_tmf_codes = _unique(summary_codes)
+        self.description_tmf_codes = _unique(description_codes)
+        self.text_tmf_codes = _unique(text_codes)
+        self.component_tmf_codes = _unique(component_codes)
+        self.all_tmf_codes = _unique(text_codes + component_codes)
+        self.versions = _unique(fix_version_versions + text_versions)
+
+    def __repr__(self) -> str:
+        return f"TextAnalysis(tmf_codes={self.all_tmf_codes}, versions={self.versions})"
+
+
+def analyze_issue_text(issue: Dict[str, Any]) -> TextAnalysis:
+    """
+    Analyze an issue's text, reusing the result stored on the issue if there is one.
+
+    Args:
+        issue: Processed issue dictionary ('summary', 'description',
+               'components', 'fixVersions')
+
+    Returns:
+        TextAnalysis for the issue
+    """
+    analysis = issue.get(TEXT_ANALYSIS_KEY)
+    if analysis is None:
+        analysis = TextAnalysis(
+            issue.get('summary'),
+            issue.get('description'),
+            issue.get('components'),
+            issue.get('fixVersions')
+        )
+        issue[TEXT_ANALYSIS_KEY] = analysis
+    return analysis
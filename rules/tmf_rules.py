@@ -3,15 +3,34 @@ TMF API related validation rules for JIRA issues
 """
 
 import re
-import pandas as pd
 from datetime import datetime
 from .base_rule import BaseRule, RuleCategory, RuleSeverity, RuleResult
+from .date_utils import get_issue_datetime
+from .text_analysis import analyze_issue_text
 from typing import Dict, Any, Optional, List
 
 
-class TmfApiVersionRule(BaseRule):
+def _check_issues():
+    """The check_issues module holding the TMF lookup tables (imported on first use: it imports these rules)"""
+    import check_issues
+    return check_issues
+
+
+class TmfLookupMixin:
+    """Loads a rule's TMF lookup table in warm_up (see BaseRule.warm_up)"""
+    
+    # check_issues function that loads the table the rule's check() reads
+    tmf_loader = 'load_tmf_api_index'
+    
+    def warm_up(self):
+        getattr(_check_issues(), self.tmf_loader)()
+
+
+class TmfApiVersionRule(TmfLookupMixin, BaseRule):
     """Check if JIRA issues referencing TMF APIs have outdated version information"""
     
+    required_fields = ('summary', 'description', 'fixVersions')
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.BUSINESS
     
@@ -35,19 +54,18 @@ class TmfApiVersionRule(BaseRule):
         results = []
         
         try:
-            # Import here to avoid circular imports
-            from check_issues import find_tmf_references_in_text, get_tmf_api_info
-            
-            # Search for TMF references in title and description
-            title = issue.get('summary', '') or ''
-            description = issue.get('description', '') or ''
-            search_text = f"{title} {description}"
+            get_tmf_api_info = _check_issues().get_tmf_api_info
             
-            tmf_refs = find_tmf_references_in_text(search_text)
+            # TMF references in title and description
+            analysis = analyze_issue_text(issue)
+            tmf_refs = analysis.text_tmf_codes
             
             if not tmf_refs:
                 return results  # No TMF references found
             
+            # Versions mentioned in the fix versions, title and description
+            issue_versions = analysis.versions
+            
             for tmf_code in tmf_refs:
                 api_info = get_tmf_api_info(tmf_code)
                 
@@ -61,8 +79,6 @@ class TmfApiVersionRule(BaseRule):
                     ))
                     continue
                 
-                # Extract version information from various places
-                issue_versions = self._extract_versions_from_issue(issue, title, description)
                 latest_version = api_info.get('highest_version', 'Unknown')
                 
                 if latest_version == 'Unknown':
@@ -112,38 +128,6 @@ class TmfApiVersionRule(BaseRule):
             ))
             return results
     
-    def _extract_versions_from_issue(self, issue: Dict[str, Any], title: str, description: str) -> list:
-        """Extract version information from issue data"""
-        versions = []
-        
-        # Look for versions in fix versions
-        fix_versions = issue.get('fixVersions', [])
-        if fix_versions:
-            for version in fix_versions:
-                if isinstance(version, dict):
-                    version_name = version.get('name', '')
-                else:
-                    version_name = str(version)
-                
-                # Extract version numbers that look like TMF versions (v1, v2, etc.)
-                version_matches = re.findall(r'v(\d+)', version_name, re.IGNORECASE)
-                versions.extend([f"v{v}" for v in version_matches])
-        
-        # Look for versions in title and description
-        text_to_search = f"{title} {description}"
-        version_patterns = [
-            r'v(\d+)(?:\.\d+)*',  # v1, v1.0, v1.2.3
-            r'version\s*(\d+)',   # version 1, version 2
-            r'V(\d+)',            # V1, V2
-        ]
-        
-        for pattern in version_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
-            versions.extend([f"v{v}" for v in matches])
-        
-        # Remove duplicates and return
-        return list(set(versions))
-    
     def _check_for_outdated_versions(self, issue_versions: list, latest_version: str) -> list:
         """Check which versions are outdated compared to latest"""
         if not issue_versions or latest_version == 'Unknown':
@@ -168,9 +152,11 @@ class TmfApiVersionRule(BaseRule):
         return outdated
 
 
-class TmfApiReferenceRule(BaseRule):
+class TmfApiReferenceRule(TmfLookupMixin, BaseRule):
     """Provide information about TMF APIs referenced in issues"""
     
+    required_fields = ('summary', 'description')
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.METADATA
     
@@ -194,17 +180,15 @@ class TmfApiReferenceRule(BaseRule):
         results = []
         
         try:
-            # Import here to avoid circular imports
-            from check_issues import find_tmf_references_in_text, get_tmf_api_info
+            get_tmf_api_info = _check_issues().get_tmf_api_info
             
-            # Search for TMF references in title (prioritize title over description)
-            title = issue.get('summary', '') or ''
-            tmf_refs = find_tmf_references_in_text(title)
+            # TMF references in title (prioritize title over description)
+            analysis = analyze_issue_text(issue)
+            tmf_refs = analysis.summary_tmf_codes
             
             if not tmf_refs:
-                # If no references in title, check description
-                description = issue.get('description', '') or ''
-                tmf_refs = find_tmf_references_in_text(description)
+                # If no references in title, use those in the description
+                tmf_refs = analysis.description_tmf_codes
             
             if not tmf_refs:
                 return results  # No TMF references found
@@ -252,9 +236,13 @@ class TmfApiReferenceRule(BaseRule):
             return results
 
 
-class TmfGitCommitInfoRule(BaseRule):
+class TmfGitCommitInfoRule(TmfLookupMixin, BaseRule):
     """Provide Git commit information for TMF APIs referenced in issues"""
     
+    required_fields = ('summary', 'description', 'components', 'created')
+    
+    tmf_loader = 'load_tmf_rules_index'
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.METADATA
     
@@ -278,35 +266,16 @@ class TmfGitCommitInfoRule(BaseRule):
         results = []
         
         try:
-            # Import here to avoid circular imports
-            from check_issues import find_tmf_references_in_text, find_tmf_references_in_components, get_tmf_rules_info
-            
-            # Search for TMF references in title, description, and components
-            title = issue.get('summary', '') or ''
-            description = issue.get('description', '') or ''
-            components = issue.get('components', [])
-            
-            # Find TMF references in title and description
-            tmf_refs_text = find_tmf_references_in_text(f"{title} {description}")
+            get_tmf_rules_info = _check_issues().get_tmf_rules_info
             
-            # Find TMF references in components
-            tmf_refs_components = find_tmf_references_in_components(components)
-            
-            # Combine all TMF references
-            all_tmf_refs = list(set(tmf_refs_text + tmf_refs_components))
+            # TMF references in title, description, and components
+            all_tmf_refs = analyze_issue_text(issue).all_tmf_codes
             
             if not all_tmf_refs:
                 return results  # No TMF references found
             
-            # Get issue creation date for comparison
-            issue_created = issue.get('created')
-            issue_created_dt = None
-            if issue_created:
-                try:
-                    # Parse JIRA datetime format
-                    issue_created_dt = pd.to_datetime(issue_created)
-                except:
-                    pass
+            # Get issue creation date for comparison (timezone-aware, like the commit dates)
+            issue_created_dt = get_issue_datetime(issue, 'created')
             
             for tmf_code in all_tmf_refs:
                 rules_info = get_tmf_rules_info(tmf_code)
@@ -314,17 +283,12 @@ class TmfGitCommitInfoRule(BaseRule):
                 if rules_info:
                     # Format the Git information message
                     file_path = rules_info['file_path']
-                    commit_date = rules_info['last_commit_date']
+                    commit_date_dt = rules_info['last_commit_date']
                     commit_author = rules_info['last_author']
                     commit_message = rules_info['last_commit_message']
                     commit_sha = rules_info['commit_sha']
                     
                     # Format the commit date for display
-                    if isinstance(commit_date, str):
-                        commit_date_dt = pd.to_datetime(commit_date)
-                    else:
-                        commit_date_dt = commit_date
-                    
                     commit_date_str = commit_date_dt.strftime('%Y-%m-%d %H:%M:%S')
                     
                     message = (
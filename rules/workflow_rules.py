@@ -21,14 +21,18 @@ These rules check for issues related to statu    def check(self, issue: Dict[str
             )]rkflow management.
 """
 
-from typing import Dict, List, Any
-from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
 from rules.base_rule import BaseRule, RuleResult, RuleSeverity, RuleCategory
+from rules.date_utils import DateThresholdBatchMixin
 
 
-class StaleEpicRule(BaseRule):
+class StaleEpicRule(DateThresholdBatchMixin, BaseRule):
     """Check if EPIC has not been updated in a long time"""
     
+    required_fields = ('updated',)
+    
+    date_field = 'updated'
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.WORKFLOW
         
@@ -38,7 +42,13 @@ class StaleEpicRule(BaseRule):
     def get_description(self) -> str:
         return "Check if EPIC has not been updated recently"
         
-    def check(self, issue: Dict[str, Any], context: Dict[str, Any]) -> List[RuleResult]:
+    def threshold_days(self, context: Dict[str, Any]) -> int:
+        # Get threshold from context or use default
+        return context.get('thresholds', {}).get('stale_days', 180)
+    
+    def _evaluate(self, issue: Dict[str, Any], context: Dict[str, Any],
+                  seconds_since_update: Optional[float]) -> List[RuleResult]:
+        """Build the results for an issue, given the seconds since its last update (None if unparseable)"""
         updated = issue.get('updated')
         issue_key = str(issue.get('key', 'UNKNOWN'))
         issue_type = context.get('issue_type', 'issue')
@@ -53,65 +63,9 @@ class StaleEpicRule(BaseRule):
                 suggestion=f"Verify {issue_type.lower()} status and update if necessary"
             )]
         
-        # Get threshold from context or use default
-        stale_days = context.get('thresholds', {}).get('stale_days', 180)
+        stale_days = self.threshold_days(context)
         
-        try:
-            # Parse the full JIRA datetime format for more accurate calculation
-            import re
-            
-            # Clean the date string to handle JIRA's ISO format
-            clean_date = re.sub(r'\.\d{3}\+\d{4}$|Z$', '', updated)
-            
-            if 'T' in clean_date:
-                # Full datetime format
-                updated_date = datetime.strptime(clean_date, '%Y-%m-%dT%H:%M:%S')
-            else:
-                # Date only format (fallback)
-                updated_date = datetime.strptime(updated[:10], '%Y-%m-%d')
-            
-            # Calculate more precise time difference
-            time_diff = datetime.now() - updated_date
-            days_since_update = int(time_diff.total_seconds() / 86400)  # 86400 seconds = 1 day
-            hours_since_update = time_diff.total_seconds() / 3600
-            
-            if days_since_update > stale_days:
-                return [RuleResult(
-                    rule_id=self.rule_id,
-                    severity=self.severity,
-                    message=f"{issue_type.upper()} [{issue_key}] has not been updated in {days_since_update} days (since {updated[:10]})",
-                    issue_key=issue_key,
-                    passed=False,
-                    suggestion=f"Review and update {issue_type.lower()} status - no activity for over {stale_days} days"
-                )]
-            
-            # More informative message showing both days and hours for recent updates
-            if days_since_update == 0:
-                return [RuleResult(
-                    rule_id=self.rule_id,
-                    severity=RuleSeverity.INFO,
-                    message=f"Updated {hours_since_update:.1f} hours ago (today)",
-                    issue_key=issue_key,
-                    passed=True
-                )]
-            elif days_since_update == 1:
-                return [RuleResult(
-                    rule_id=self.rule_id,
-                    severity=RuleSeverity.INFO,
-                    message=f"Updated {days_since_update} day ago ({hours_since_update:.1f} hours)",
-                    issue_key=issue_key,
-                    passed=True
-                )]
-            else:
-                return [RuleResult(
-                    rule_id=self.rule_id,
-                    severity=RuleSeverity.INFO,
-                    message=f"Updated {days_since_update} days ago",
-                    issue_key=issue_key,
-                    passed=True
-                )]
-            
-        except (ValueError, TypeError) as e:
+        if seconds_since_update is None:
             return [RuleResult(
                 rule_id=self.rule_id,
                 severity=RuleSeverity.WARNING,
@@ -119,11 +73,68 @@ class StaleEpicRule(BaseRule):
                 issue_key=issue_key,
                 passed=False
             )]
+        
+        days_since_update = int(seconds_since_update / 86400)  # 86400 seconds = 1 day
+        
+        if days_since_update > stale_days:
+            return [RuleResult(
+                rule_id=self.rule_id,
+                severity=self.severity,
+                message=f"{issue_type.upper()} [{issue_key}] has not been updated in {days_since_update} days (since {updated[:10]})",
+                issue_key=issue_key,
+                passed=False,
+                suggestion=f"Review and update {issue_type.lower()} status - no activity for over {stale_days} days"
+            )]
+        
+        return self._passed(issue, context, seconds_since_update)
+    
+    def _passed(self, issue: Dict[str, Any], context: Dict[str, Any], seconds_since_update: float) -> List[RuleResult]:
+        """Results of an issue updated within the threshold"""
+        days_since_update = int(seconds_since_update / 86400)
+        hours_since_update = seconds_since_update / 3600
+        issue_key = str(issue.get('key', 'UNKNOWN'))
+        
+        # More informative message showing both days and hours for recent updates
+        if days_since_update == 0:
+            return [RuleResult(
+                rule_id=self.rule_id,
+                severity=RuleSeverity.INFO,
+                message="Updated {:.1f} hours ago (today)",
+                message_args=(hours_since_update,),
+                issue_key=issue_key,
+                passed=True
+            )]
+        elif days_since_update == 1:
+            return [RuleResult(
+                rule_id=self.rule_id,
+                severity=RuleSeverity.INFO,
+                message="Updated {} day ago ({:.1f} hours)",
+                message_args=(days_since_update, hours_since_update),
+                issue_key=issue_key,
+                passed=True
+            )]
+        else:
+            return [RuleResult(
+                rule_id=self.rule_id,
+                severity=RuleSeverity.INFO,
+                message="Updated {} days ago",
+                message_args=(days_since_update,),
+                issue_key=issue_key,
+                passed=True
+            )]
 
 
-class LongRunningEpicRule(BaseRule):
+class LongRunningEpicRule(DateThresholdBatchMixin, BaseRule):
     """Check if EPIC has been in progress for too long"""
     
+    required_fields = ('created', 'status')
+    preconditions = {'status': frozenset({'in progress'})}
+    
+    date_field = 'created'
+    filter_field = 'status'
+    filter_values = frozenset({'In Progress'})
+    filter_lowercase = False
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.WORKFLOW
         
@@ -133,7 +144,13 @@ class LongRunningEpicRule(BaseRule):
     def get_description(self) -> str:
         return "Check if EPIC has been in progress for too long"
         
-    def check(self, issue: Dict[str, Any], context: Dict[str, Any]) -> List[RuleResult]:
+    def threshold_days(self, context: Dict[str, Any]) -> int:
+        # Get threshold from context or use default
+        return context.get('thresholds', {}).get('long_running_days', 365)
+    
+    def _evaluate(self, issue: Dict[str, Any], context: Dict[str, Any],
+                  seconds_since_created: Optional[float]) -> List[RuleResult]:
+        """Build the results for an issue, given the seconds since it was created (None if unparseable)"""
         created = issue.get('created')
         status = issue.get('status')
         issue_key = str(issue.get('key', 'UNKNOWN'))
@@ -152,58 +169,51 @@ class LongRunningEpicRule(BaseRule):
                 passed=False
             )]
         
-        # Get threshold from context or use default
-        long_running_days = context.get('thresholds', {}).get('long_running_days', 365)
+        long_running_days = self.threshold_days(context)
         
-        try:
-            # Parse the full JIRA datetime format for more accurate calculation
-            import re
-            
-            # Clean the date string to handle JIRA's ISO format
-            clean_date = re.sub(r'\.\d{3}\+\d{4}$|Z$', '', created)
-            
-            if 'T' in clean_date:
-                # Full datetime format
-                created_date = datetime.strptime(clean_date, '%Y-%m-%dT%H:%M:%S')
-            else:
-                # Date only format (fallback)
-                created_date = datetime.strptime(created[:10], '%Y-%m-%d')
-            
-            # Calculate more precise time difference
-            time_diff = datetime.now() - created_date
-            days_in_progress = int(time_diff.total_seconds() / 86400)
-            
-            if days_in_progress > long_running_days:
-                return [RuleResult(
-                    rule_id=self.rule_id,
-                    severity=self.severity,
-                    message=f"{issue_type.upper()} [{issue_key}] has been 'In Progress' for {days_in_progress} days (created {created[:10]})",
-                    issue_key=issue_key,
-                    passed=False,
-                    suggestion=f"Review {issue_type.lower()} scope - in progress for over {long_running_days} days. Consider breaking into smaller items."
-                )]
-            
+        if seconds_since_created is None:
             return [RuleResult(
                 rule_id=self.rule_id,
-                severity=RuleSeverity.INFO,
-                message=f"In progress for {days_in_progress} days (reasonable timeframe)",
+                severity=RuleSeverity.WARNING,
+                message=f"{issue_type.upper()} [{issue_key}] has invalid creation date format: {created}",
                 issue_key=issue_key,
-                passed=True
+                passed=False
             )]
-            
-        except (ValueError, TypeError) as e:
+        
+        days_in_progress = int(seconds_since_created / 86400)
+        
+        if days_in_progress > long_running_days:
             return [RuleResult(
                 rule_id=self.rule_id,
-                severity=RuleSeverity.WARNING,
-                message=f"{issue_type.upper()} [{issue_key}] has invalid creation date format: {created}",
+                severity=self.severity,
+                message=f"{issue_type.upper()} [{issue_key}] has been 'In Progress' for {days_in_progress} days (created {created[:10]})",
                 issue_key=issue_key,
-                passed=False
+                passed=False,
+                suggestion=f"Review {issue_type.lower()} scope - in progress for over {long_running_days} days. Consider breaking into smaller items."
             )]
+        
+        return self._passed(issue, context, seconds_since_created)
+    
+    def _passed(self, issue: Dict[str, Any], context: Dict[str, Any], seconds_since_created: float) -> List[RuleResult]:
+        """Results of an issue in progress for no longer than the threshold"""
+        days_in_progress = int(seconds_since_created / 86400)
+        issue_key = str(issue.get('key', 'UNKNOWN'))
+        return [RuleResult(
+            rule_id=self.rule_id,
+            severity=RuleSeverity.INFO,
+            message="In progress for {} days (reasonable timeframe)",
+            message_args=(days_in_progress,),
+            issue_key=issue_key,
+            passed=True
+        )]
 
 
 class NoLinkedIssuesRule(BaseRule):
     """Check if EPIC has linked issues"""
     
+    required_fields = ('issuelinks',)
+    issue_types = frozenset({'epic'})
+    
     def get_category(self) -> RuleCategory:
         return RuleCategory.CONTENT
         
@@ -235,7 +245,8 @@ class NoLinkedIssuesRule(BaseRule):
         return [RuleResult(
             rule_id=self.rule_id,
             severity=RuleSeverity.INFO,
-            message=f"Has {len(issues)} linked issues",
+            message="Has {} linked issues",
+            message_args=(len(issues),),
             issue_key=issue_key,
             passed=True
         )]
\ No newline at end of file
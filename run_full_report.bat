@@ -13,25 +13,20 @@ REM Activate virtual environment
 echo 📦 Activating virtual environment...
 call .venv\Scripts\activate.bat
 
-REM Run the quality check and save to report.txt
+REM Run the quality check, recording the report events in report.jsonl
 echo 🔍 Running JIRA quality check...
-py check_issues.py > report.txt 2>&1
+py check_issues.py --events report.jsonl > check_issues.log 2>&1
 
-REM Check if the report was generated successfully
-if exist "report.txt" (
+REM Check if the report events were generated successfully
+if exist "report.jsonl" (
     echo ✅ Quality check completed successfully!
-    echo 📄 Report saved to: report.txt
+    echo 📄 Report events saved to: report.jsonl - console output in check_issues.log
     
-    REM Convert to markdown formats
-    echo 🔄 Converting to markdown formats...
+    REM Render the text and markdown reports from the events in one pass
+    echo 🔄 Rendering reports...
+    py report_events.py report.jsonl
     
-    REM Basic markdown conversion
-    py convert_to_markdown.py
-    
-    REM Enhanced markdown conversion
-    py create_enhanced_report.py
-    
-    echo ✅ Conversion completed!
+    echo ✅ Rendering completed!
     echo 📝 Available reports:
     echo    - report.txt (Plain text)
     echo    - report.md (Basic markdown)
@@ -39,7 +34,7 @@ if exist "report.txt" (
     
 ) else (
     echo ❌ Error: Quality check failed. No report generated.
-    echo Check the output above for error details.
+    echo Check check_issues.log for error details.
     exit /b 1
 )
 
@@ -13,29 +13,24 @@ export HTTPS_PROXY="http://proxy-nby.gslb.internal.vodafone.co.uk:8080"
 echo "📦 Activating virtual environment..."
 source .venv/Scripts/activate
 
-# Run the quality check and save to report.txt
+# Run the quality check, recording the report events in report.jsonl
 echo "🔍 Running JIRA quality check..."
-py check_issues.py > report.txt 2>&1
+py check_issues.py --events report.jsonl > check_issues.log 2>&1
 
-# Check if the report was generated successfully
-if [ -f "report.txt" ]; then
+# Check if the report events were generated successfully
+if [ -f "report.jsonl" ]; then
     echo "✅ Quality check completed successfully!"
-    echo "📄 Report saved to: report.txt"
+    echo "📄 Report events saved to: report.jsonl (console output in check_issues.log)"
+    
+    # Render the text and markdown reports from the events in one pass
+    echo "🔄 Rendering reports..."
+    py report_events.py report.jsonl
     
     # Get file size
     size=$(wc -c < report.txt)
     echo "📊 Report size: $size bytes"
     
-    # Convert to markdown formats
-    echo "🔄 Converting to markdown formats..."
-    
-    # Basic markdown conversion
-    py convert_to_markdown.py
-    
-    # Enhanced markdown conversion
-    py create_enhanced_report.py
-    
-    echo "✅ Conversion completed!"
+    echo "✅ Rendering completed!"
     echo "📝 Available reports:"
     echo "   - report.txt (Plain text)"
     echo "   - report.md (Basic markdown)"
@@ -54,7 +49,7 @@ if [ -f "report.txt" ]; then
     
 else
     echo "❌ Error: Quality check failed. No report generated."
-    echo "Check the output above for error details."
+    echo "Check check_issues.log for error details."
     exit 1
 fi
 
@@ -0,0 +1,14 @@
+"""
+Shared test setup.
+
+The project is a set of top-level modules run from the repository root, so
+the root is put on sys.path for the tests to import them.
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
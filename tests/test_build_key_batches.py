@@ -0,0 +1,43 @@
+"""Tests for jira_api.build_key_batches"""
+
+from jira_api import build_key_batches
+
+
+def batch_keys(query):
+    assert query.startswith('key in (') and query.endswith(')')
+    return query[len('key in ('):-1].split(', ')
+
+
+def test_every_key_once_in_order():
+    keys = [f"AP-{number}" for number in range(1, 451)]
+    batches = build_key_batches(keys, max_length=2000)
+    assert [key for query in batches for key in batch_keys(query)] == keys
+
+
+def test_queries_stay_within_max_length():
+    keys = [f"PROJECT-{number}" for number in range(1000, 1400)]
+    batches = build_key_batches(keys, max_length=300, batch_size=1000)
+    assert len(batches) > 1
+    assert all(len(query) <= 300 for query in batches)
+
+
+def test_query_filling_max_length_exactly_is_not_split():
+    query = 'key in (AP-1, AP-2)'
+    assert build_key_batches(['AP-1', 'AP-2'], max_length=len(query)) == [query]
+    assert build_key_batches(['AP-1', 'AP-2'], max_length=len(query) - 1) == ['key in (AP-1)', 'key in (AP-2)']
+
+
+def test_batch_size_limits_keys_per_query():
+    keys = [f"AP-{number}" for number in range(250)]
+    batches = build_key_batches(keys, max_length=100000, batch_size=100)
+    assert [len(batch_keys(query)) for query in batches] == [100, 100, 50]
+
+
+def test_first_key_longer_than_max_length_gets_its_own_query():
+    # No empty 'key in ()' query before it, and no ', ' in front of it
+    assert build_key_batches(['AP-1'], max_length=5) == ['key in (AP-1)']
+    assert build_key_batches(['AP-1', 'AP-2'], max_length=5) == ['key in (AP-1)', 'key in (AP-2)']
+
+
+def test_no_keys_no_queries():
+    assert build_key_batches([]) == []
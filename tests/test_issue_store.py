@@ -0,0 +1,110 @@
+"""Tests for issue_store.IssueStore"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from exceptions import JiraApiError
+from issue_store import IssueStore
+
+
+def raw_issue(key, status='Open', issue_type='Story', days_ago=1, summary='Summary'):
+    updated = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return {'key': key, 'fields': {
+        'summary': summary,
+        'status': {'name': status},
+        'issuetype': {'name': issue_type},
+        'updated': updated.strftime('%Y-%m-%dT%H:%M:%S.000+0000'),
+    }}
+
+
+class FakeClient:
+    """Serves fixed search results and records the JQL of every sync"""
+
+    def __init__(self, issues=(), error=None):
+        self.issues = list(issues)
+        self.error = error
+        self.queries = []
+
+    async def iter_search_pages(self, jql, page_size=100):
+        self.queries.append(jql)
+        if self.error is not None:
+            raise self.error
+        for start in range(0, len(self.issues), page_size):
+            yield {'issues': self.issues[start:start + page_size], 'total': len(self.issues), 'startAt': start}
+
+
+@pytest.fixture
+def store():
+    store = IssueStore(':memory:')
+    yield store
+    store.close()
+
+
+def sync(store, client, full=False):
+    return asyncio.run(store.sync(client, 'AP', full=full, page_size=2))
+
+
+def keys(store, issue_type='Story'):
+    return [issue['key'] for issue in store.get_active_issues('AP', issue_type)]
+
+
+def test_first_sync_fetches_the_active_issues(store):
+    client = FakeClient([raw_issue('AP-1'), raw_issue('AP-2'), raw_issue('AP-3')])
+    assert sync(store, client) == 3
+    assert 'status not in ("Closed", "Resolved", "Done")' in client.queries[0]
+    assert store.count('AP') == 3
+    assert store.get_last_sync('AP') is not None
+
+
+def test_later_syncs_only_fetch_updated_issues(store):
+    sync(store, FakeClient([raw_issue('AP-1'), raw_issue('AP-2')]))
+
+    client = FakeClient([raw_issue('AP-2', summary='Changed', days_ago=0), raw_issue('AP-4', days_ago=0)])
+    assert sync(store, client) == 2
+    # A relative 'updated >= "-Nm"' search, covering the time since the last sync plus the overlap
+    assert 'updated >= "-' in client.queries[0] and 'm"' in client.queries[0]
+    assert 'status not in' not in client.queries[0]
+
+    # Changed issues are replaced, new ones added and untouched ones kept
+    assert keys(store) == ['AP-1', 'AP-2', 'AP-4']
+    assert store.get_issues(['AP-2'])['AP-2']['fields']['summary'] == 'Changed'
+
+
+def test_incremental_sync_stores_issues_closed_in_jira(store):
+    sync(store, FakeClient([raw_issue('AP-1'), raw_issue('AP-2')]))
+    sync(store, FakeClient([raw_issue('AP-1', status='Done', days_ago=0)]))
+    assert store.count('AP') == 2
+    assert keys(store) == ['AP-2']
+
+
+def test_full_sync_drops_issues_no_longer_in_jira(store):
+    sync(store, FakeClient([raw_issue('AP-1'), raw_issue('AP-2'), raw_issue('AP-3')]))
+    store.upsert_issues('XY', [raw_issue('XY-1')])
+
+    assert sync(store, FakeClient([raw_issue('AP-2')]), full=True) == 1
+    assert keys(store) == ['AP-2']
+    # Other projects are left alone
+    assert store.count('XY') == 1
+
+
+def test_failed_sync_keeps_the_last_sync_time(store):
+    sync(store, FakeClient([raw_issue('AP-1')]))
+    last_sync = store.get_last_sync('AP')
+
+    with pytest.raises(JiraApiError):
+        sync(store, FakeClient(error=JiraApiError("search failed")))
+    assert store.get_last_sync('AP') == last_sync
+
+
+def test_active_issues_match_the_check_jql(store):
+    store.upsert_issues('AP', [
+        raw_issue('AP-1'),
+        raw_issue('AP-2', status='Closed'),
+        raw_issue('AP-3', days_ago=400),
+        raw_issue('AP-4', status='In Progress', days_ago=400),
+        raw_issue('AP-5', issue_type='Bug'),
+    ])
+    assert keys(store) == ['AP-1', 'AP-4']
+    assert keys(store, 'Bug') == ['AP-5']
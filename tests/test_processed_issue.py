@@ -0,0 +1,39 @@
+"""Tests for processed_issue.ProcessedIssue"""
+
+import json
+import os
+import pickle
+
+import pytest
+
+from conftest import REPO_ROOT
+from processed_issue import ProcessedIssue
+from rules.text_analysis import TEXT_ANALYSIS_KEY
+
+
+@pytest.fixture
+def issue():
+    with open(os.path.join(REPO_ROOT, 'data', 'sample-epic.json'), 'r', encoding='utf-8') as f:
+        raw_issue = json.load(f)
+    return ProcessedIssue.from_raw(raw_issue, 'https://jira.example.com', raw_fields=['customfield_10002'])
+
+
+def test_pickle_round_trip(issue):
+    restored = pickle.loads(pickle.dumps(issue))
+    assert isinstance(restored, ProcessedIssue)
+    assert restored.to_dict() == issue.to_dict()
+    assert TEXT_ANALYSIS_KEY not in restored
+
+
+def test_pickle_keeps_memoized_values(issue):
+    issue[TEXT_ANALYSIS_KEY] = {'words': 12}
+    restored = pickle.loads(pickle.dumps(issue))
+    assert restored[TEXT_ANALYSIS_KEY] == {'words': 12}
+
+
+def test_restored_issue_is_read_only(issue):
+    restored = pickle.loads(pickle.dumps(issue))
+    with pytest.raises(AttributeError):
+        restored.summary = 'changed'
+    with pytest.raises(TypeError):
+        restored['summary'] = 'changed'
@@ -0,0 +1,89 @@
+"""Tests for rate_limiter.AdaptiveRateLimiter"""
+
+import asyncio
+
+from rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+
+def test_not_engaged_until_the_server_pushes_back():
+    limiter = AdaptiveRateLimiter(max_rate=20.0, burst=1.0)
+
+    async def burst():
+        return [await limiter.acquire() for _ in range(50)]
+
+    # Far more requests than the bucket holds, none of them paced
+    assert asyncio.run(burst()) == [0.0] * 50
+    limiter.record_response(200, latency=0.05)
+    assert not limiter.engaged
+    assert limiter.rate == 20.0
+    assert limiter.metrics()['requests'] == 50
+    assert limiter.metrics()['engagements'] == 0
+
+
+def test_throttle_responses_in_one_pause_back_off_once():
+    limiter = AdaptiveRateLimiter(max_rate=20.0, decrease_factor=0.5)
+    for _ in range(5):
+        # Responses to requests that were already in flight
+        limiter.record_response(429, latency=0.1, retry_after=30)
+    limiter.record_response(503, latency=0.1, retry_after=30)
+
+    assert limiter.engaged
+    assert limiter.rate == 10.0
+    assert limiter.pauses == 1
+    assert limiter.throttle_responses == 6
+    assert 29 < limiter.paused_for <= 30
+
+
+def test_pause_without_retry_after_uses_default_and_is_capped():
+    limiter = AdaptiveRateLimiter(default_pause=5.0, max_pause=10.0)
+    limiter.record_response(429, latency=0.1)
+    assert 4 < limiter.paused_for <= 5
+
+    limiter = AdaptiveRateLimiter(default_pause=5.0, max_pause=10.0)
+    limiter.record_response(429, latency=0.1, retry_after=3600)
+    assert 9 < limiter.paused_for <= 10
+
+
+def test_rate_stays_within_bounds():
+    limiter = AdaptiveRateLimiter(min_rate=0.5, max_rate=20.0)
+    # A zero Retry-After ends each pause at once, so every 429 starts a new episode
+    for _ in range(20):
+        limiter.record_response(429, latency=0.1, retry_after=0)
+    assert limiter.pauses == 20
+    assert limiter.rate == 0.5
+    assert limiter.lowest_rate == 0.5
+
+    for _ in range(10000):
+        limiter.record_response(200, latency=0.05)
+        assert 0.5 <= limiter.rate <= 20.0
+        if not limiter.engaged:
+            break
+    # Back at the maximum rate the limiter stops pacing
+    assert not limiter.engaged
+    assert limiter.rate == 20.0
+
+
+def test_slow_responses_engage_the_limiter():
+    limiter = AdaptiveRateLimiter(max_rate=20.0, target_latency=1.0)
+    limiter.record_response(200, latency=5.0)
+    limiter.record_response(200, latency=5.0)
+    assert limiter.engaged
+    # At most one slowdown per second
+    assert limiter.rate == 18.0
+    assert limiter.pauses == 0
+
+
+def test_disabled_limiter_ignores_responses():
+    limiter = AdaptiveRateLimiter(enabled=False)
+    limiter.record_response(429, latency=0.1, retry_after=30)
+    assert not limiter.engaged
+    assert limiter.paused_for == 0
+    assert asyncio.run(limiter.acquire()) == 0.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('7') == 7.0
+    assert parse_retry_after('-3') == 0.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:10 GMT', now=1445412480.0) == 10.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
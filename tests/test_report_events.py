@@ -0,0 +1,129 @@
+"""Tests for rendering the report event stream"""
+
+import io
+import sys
+
+import pytest
+
+import report_events
+from create_enhanced_report import EnhancedMarkdownEventRenderer
+from markdown_reporter import MarkdownEventRenderer
+from report_events import ReportEventWriter, TextRenderer, read_events, render_events, result_event_data
+from rules.base_rule import RuleResult, RuleSeverity
+
+
+def write_section(writer, issue_type, keys):
+    writer.emit('section_start', issue_type=issue_type, jql=f'project = AP AND issuetype = {issue_type}',
+                source='jira')
+    writer.emit('section_found', issue_type=issue_type, total=len(keys))
+    for position, key in enumerate(keys, 1):
+        writer.emit('issue', issue_type=issue_type, position=position, total=len(keys), key=key,
+                    summary=f'{issue_type} {key}', status='Open', assignee='Jane Doe',
+                    assignee_email='jane@example.com', url=f'https://jira.example.com/browse/{key}',
+                    labels=['api'], tmf_apis=[])
+        writer.emit('result', **result_event_data(RuleResult(
+            rule_id='MissingDescriptionRule', severity=RuleSeverity.WARNING, message='Description is empty',
+            issue_key=key, passed=False, suggestion='Add a description')))
+        writer.emit('result', **result_event_data(RuleResult(
+            rule_id='MissingAssigneeRule', severity=RuleSeverity.ERROR, message='Assignee check failed',
+            issue_key=key, passed=False)))
+    writer.emit('section_end', issue_type=issue_type, checked=len(keys), violations=2 * len(keys),
+                violations_by_severity={'CRITICAL': 0, 'ERROR': len(keys), 'WARNING': len(keys), 'INFO': 0},
+                error=None)
+
+
+def event_stream():
+    stream = io.StringIO()
+    writer = ReportEventWriter(stream)
+    writer.emit('run_start', project='AP', generated='2026-01-01 09:00:00')
+    writer.emit('rules', enabled_rules=2, total_rules=3, rules_by_category={'completeness': ['A', 'B']})
+    writer.emit('auth', user='Jane Doe', email='jane@example.com')
+    # A section checked concurrently is buffered, then appended in order
+    section = ReportEventWriter.buffered()
+    write_section(section, 'Story', ['AP-1', 'AP-2'])
+    writer.extend(section)
+    write_section(writer, 'Bug', [])
+    writer.emit('labels', labels={'api': [{'key': 'AP-1', 'summary': 'Story AP-1', 'type': 'Story',
+                                           'url': 'https://jira.example.com/browse/AP-1'}]})
+    writer.emit('run_end', completed=True)
+    writer.close()
+    stream.seek(0)
+    return stream
+
+
+def render(renderer_class):
+    out = io.StringIO()
+    render_events(read_events(event_stream()), [renderer_class(out)])
+    return out.getvalue()
+
+
+def assert_in_order(text, *parts):
+    position = 0
+    for part in parts:
+        found = text.find(part, position)
+        assert found >= 0, f'{part!r} missing or out of order'
+        position = found + len(part)
+
+
+def test_read_events_round_trip():
+    events = list(read_events(event_stream()))
+    assert [event['event'] for event in events][:5] == ['run_start', 'rules', 'auth', 'section_start',
+                                                        'section_found']
+    assert events[-1] == {'event': 'run_end', 'completed': True}
+
+
+def test_text_report():
+    text = render(TextRenderer)
+    assert_in_order(text,
+                    'JIRA Issue Data Quality Report - AP project',
+                    '[AUTH] Authenticated with JIRA',
+                    '[CHECK] CHECKING STORY ISSUES',
+                    '[QUERY] JQL Query: project = AP AND issuetype = Story',
+                    '[RESULTS] Found 2 Story issues to check\n',
+                    ' 1. Story: AP-1',
+                    '[ERROR] Assignee check failed',
+                    '[WARNING] Description is empty',
+                    '[SUGGESTION] Add a description',
+                    ' 2. Story: AP-2',
+                    '[SUMMARY] Story Summary:',
+                    'Total violations: 4',
+                    '[CHECK] CHECKING BUG ISSUES',
+                    '[OK] No Bug issues found matching the criteria',
+                    "Label: 'api' (used 1 times)",
+                    '[SUCCESS]')
+    assert text.count('Found 2') == 1
+
+
+@pytest.mark.parametrize('renderer_class', [MarkdownEventRenderer, EnhancedMarkdownEventRenderer])
+def test_markdown_reports(renderer_class):
+    text = render(renderer_class)
+    assert_in_order(text, 'AP-1', 'Description is empty', 'AP-2', 'api')
+
+
+def test_markdown_report_suggestions():
+    assert 'Add a description' in render(MarkdownEventRenderer)
+
+
+def test_main_keeps_reports_when_events_file_is_missing(tmp_path, monkeypatch):
+    report = tmp_path / 'report.txt'
+    report.write_text('previous report', encoding='utf-8')
+    monkeypatch.setattr(sys, 'argv', ['report_events.py', str(tmp_path / 'missing.jsonl'),
+                                      '--text', str(report), '--markdown', str(tmp_path / 'report.md'),
+                                      '--enhanced', str(tmp_path / 'report_enhanced.md')])
+    with pytest.raises(SystemExit):
+        report_events.main()
+    assert report.read_text(encoding='utf-8') == 'previous report'
+    assert not (tmp_path / 'report.md').exists()
+
+
+def test_main_renders_every_report(tmp_path, monkeypatch):
+    events = tmp_path / 'report.jsonl'
+    events.write_text(event_stream().getvalue(), encoding='utf-8')
+    paths = {name: tmp_path / name for name in ('report.txt', 'report.md', 'report_enhanced.md')}
+    monkeypatch.setattr(sys, 'argv', ['report_events.py', str(events), '--text', str(paths['report.txt']),
+                                      '--markdown', str(paths['report.md']),
+                                      '--enhanced', str(paths['report_enhanced.md'])])
+    report_events.main()
+    assert paths['report.txt'].read_text(encoding='utf-8') == render(TextRenderer)
+    assert 'AP-2' in paths['report.md'].read_text(encoding='utf-8')
+    assert 'AP-2' in paths['report_enhanced.md'].read_text(encoding='utf-8')
@@ -0,0 +1,62 @@
+"""Tests for request_metrics"""
+
+import gzip
+
+import pytest
+
+from http_transport import TransportResponse, decode_content
+from request_metrics import RequestMetrics, normalize_endpoint
+
+
+@pytest.mark.parametrize('endpoint, expected', [
+    ('/search', '/search'),
+    ('/search?jql=project%3DAP&startAt=100', '/search'),
+    ('/issue/AP-123', '/issue/{issueKey}'),
+    ('/issue/AP-123/comment', '/issue/{issueKey}/comment'),
+    ('/issue/MY_PROJ2-7/transitions', '/issue/{issueKey}/transitions'),
+    ('/project/AP/components', '/project/{projectKey}/components'),
+    ('/project/AP', '/project/{projectKey}'),
+    ('/issue/10042/comment/99', '/issue/{id}/comment/{id}'),
+    ('/myself', '/myself'),
+])
+def test_normalize_endpoint(endpoint, expected):
+    assert normalize_endpoint(endpoint) == expected
+
+
+def test_endpoints_share_one_series():
+    metrics = RequestMetrics()
+    for key in ('AP-1', 'AP-2', 'XY-3'):
+        metrics.record_response(f"/issue/{key}", TransportResponse(200, {}, b'{}', wire_bytes=2), 0.1)
+    assert list(metrics.endpoints) == ['/issue/{issueKey}']
+    assert metrics.endpoints['/issue/{issueKey}'].latency.count == 3
+
+
+def test_wire_and_decoded_bytes():
+    body = b'{"issues": []}' * 100
+    wire = gzip.compress(body)
+    assert decode_content(wire, 'gzip') == body
+
+    metrics = RequestMetrics()
+    metrics.record_response('/search', TransportResponse(200, {'Content-Encoding': 'gzip'}, body,
+                                                         wire_bytes=len(wire)), 0.2)
+    totals = metrics.totals()
+    assert totals['compressed_bytes'] == len(wire)
+    assert totals['decompressed_bytes'] == len(body)
+    assert totals['unmeasured_responses'] == 0
+
+
+def test_unknown_wire_size_is_reported_as_unknown():
+    metrics = RequestMetrics()
+    metrics.record_response('/search', TransportResponse(200, {}, b'{}', wire_bytes=2), 0.1)
+    metrics.record_response('/myself', TransportResponse(200, {'Content-Encoding': 'gzip'}, b'{}'), 0.1)
+
+    totals = metrics.totals()
+    assert totals['compressed_bytes'] is None
+    assert totals['unmeasured_responses'] == 1
+    assert metrics.endpoints['/search'].to_dict()['compressed_bytes'] == 2
+    assert metrics.endpoints['/myself'].to_dict()['compressed_bytes'] is None
+
+    exposition = metrics.to_prometheus()
+    assert 'jira_client_response_bytes_total{endpoint="/search",encoding="compressed"} 2' in exposition
+    assert 'endpoint="/myself",encoding="compressed"' not in exposition
+    assert 'jira_client_unmeasured_responses_total{endpoint="/myself"} 1' in exposition
@@ -0,0 +1,122 @@
+"""Tests for RuleEngine.run_rules_batch and the rules' check_batch"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import check_issues
+import rules.date_utils as date_utils
+from jira_stub import JiraStub
+from processed_issue import ProcessedIssue
+from rule_config import DEFAULT_CONFIG
+from rule_engine import RuleEngine
+from rules.business_rules import HighPriorityStaleRule, InProgressTooLongRule
+from rules.workflow_rules import LongRunningEpicRule, StaleEpicRule
+
+NOW = datetime.now(timezone.utc)
+PRIORITIES = ['Highest', 'High', 'critical', 'Medium', 'Low', None]
+DATE_RULES = [HighPriorityStaleRule, InProgressTooLongRule, StaleEpicRule, LongRunningEpicRule]
+
+
+def result_tuples(results):
+    return [(result.rule_id, result.severity, result.message, result.issue_key, result.passed, result.suggestion)
+            for result in results]
+
+
+def context_for(issue_type):
+    return {'components': [], 'thresholds': DEFAULT_CONFIG.get('thresholds', {}),
+            'issue_type': issue_type, 'now': NOW}
+
+
+def build_issues(count=60, seed=7):
+    """Stub issues of every type, with priorities and missing dates mixed in"""
+    engine = RuleEngine(config=DEFAULT_CONFIG, workers=0)
+    fields = engine.get_required_fields(check_issues.ISSUE_DISPLAY_FIELDS)
+    raw_fields = engine.get_required_raw_fields()
+    rng = random.Random(seed)
+    issues = []
+    for raw_issue in JiraStub(issues=count, seed=seed).iter_issues(fields):
+        priority = rng.choice(PRIORITIES)
+        raw_issue['fields']['priority'] = {'name': priority} if priority else None
+        if rng.random() < 0.1:
+            raw_issue['fields']['updated'] = None
+        issues.append(ProcessedIssue.from_raw(raw_issue, 'http://127.0.0.1/jira', raw_fields))
+    return issues
+
+
+def by_type(issues):
+    groups = {}
+    for issue in issues:
+        groups.setdefault(issue['issue_type'], []).append(issue)
+    return groups
+
+
+@pytest.fixture(scope='module')
+def issues():
+    return build_issues()
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_run_rules_batch_matches_run_rules(issues, workers):
+    config = {**DEFAULT_CONFIG, 'execution': {**DEFAULT_CONFIG.get('execution', {}), 'rule_chunk_size': 1}}
+    serial = RuleEngine(config=config, workers=0)
+    batched = RuleEngine(config=config, workers=workers)
+    try:
+        for issue_type, group in by_type(issues).items():
+            context = context_for(issue_type)
+            expected = [result_tuples(serial.run_rules(issue, context)) for issue in group]
+            actual = [result_tuples(results) for results in batched.run_rules_batch(group, context)]
+            assert actual == expected, issue_type
+        assert batched.workers == workers
+    finally:
+        batched.close()
+
+
+def date_rule_issues():
+    """Issues on either side of the date rules' thresholds, plus unparseable dates"""
+    issues = []
+    for days in [0, 6.9, 7, 7.5, 8, 13.99, 14, 15, 30, 31, 90, 91, 400, -1, None, 'bad']:
+        if days is None:
+            stamp = None
+        elif days == 'bad':
+            stamp = 'not a date'
+        else:
+            stamp = (NOW - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+        for status in ['In Progress', 'in progress', 'Open']:
+            for priority in ['High', 'blocker', 'Low', None]:
+                issues.append({'key': f'AP-{len(issues) + 1}', 'issue_type': 'Epic', 'status': status,
+                               'priority': priority, 'updated': stamp, 'created': stamp})
+    return issues
+
+
+@pytest.mark.parametrize('rule_class', DATE_RULES)
+@pytest.mark.parametrize('columnar', [True, False])
+def test_date_rule_check_batch_matches_check(rule_class, columnar, monkeypatch):
+    if not columnar:
+        monkeypatch.setattr(date_utils, 'np', None)
+    rule = rule_class()
+    issues = date_rule_issues()
+    context = context_for('Epic')
+    expected = [result_tuples(rule.check(issue, context)) for issue in issues]
+    assert [result_tuples(results) for results in rule.check_batch(issues, context)] == expected
+    outcomes = {result[4] for results in expected for result in results}
+    assert outcomes == {True, False}
+
+
+def test_failing_check_batch_falls_back_to_check(issues, capsys):
+    engine = RuleEngine(config=DEFAULT_CONFIG, workers=0, instrument=True)
+    rule = next(rule for rule in engine.rules if isinstance(rule, InProgressTooLongRule))
+
+    def broken_check_batch(batch, context):
+        raise RuntimeError('columns went missing')
+
+    rule.check_batch = broken_check_batch
+    group = by_type(issues)['Story']
+    context = context_for('Story')
+    expected = [result_tuples(engine.run_rules(issue, context)) for issue in group]
+    engine.take_rule_stats()
+
+    assert [result_tuples(results) for results in engine.run_rules_batch(group, context)] == expected
+    assert f'[WARNING] Batch check of rule {rule.rule_id} failed (columns went missing)' in capsys.readouterr().out
+    assert engine.get_rule_stats()[rule.rule_id]['exceptions'] == 1
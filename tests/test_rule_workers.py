@@ -0,0 +1,82 @@
+"""Tests for the RuleEngine worker pool falling back to in-process runs"""
+
+import asyncio
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+
+import pytest
+
+from rule_config import DEFAULT_CONFIG
+from rule_engine import RuleEngine
+
+CONFIG = {**DEFAULT_CONFIG, 'execution': {**DEFAULT_CONFIG.get('execution', {}), 'rule_chunk_size': 2}}
+CONTEXT = {'components': [], 'thresholds': DEFAULT_CONFIG.get('thresholds', {}), 'issue_type': 'Story',
+           'now': datetime.now(timezone.utc)}
+
+
+class BrokenExecutor(Executor):
+    """Stands in for a process pool whose workers died"""
+
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, *args, **kwargs):
+        raise BrokenProcessPool('a worker process terminated abruptly')
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shut_down = True
+
+
+def issues():
+    return [{'key': f'AP-{number}', 'issue_type': 'Story', 'summary': f'Story {number}', 'description': None,
+             'status': 'In Progress', 'priority': 'High', 'assignee': None, 'labels': [],
+             'updated': '2024-01-15T10:30:00.000+0000', 'created': '2023-06-01T10:30:00.000+0000'}
+            for number in range(1, 8)]
+
+
+def result_tuples(batch_results):
+    return [[(result.rule_id, result.message, result.issue_key, result.passed) for result in results]
+            for results in batch_results]
+
+
+@pytest.fixture
+def expected():
+    return result_tuples(RuleEngine(config=CONFIG, workers=0).run_rules_batch(issues(), CONTEXT))
+
+
+@pytest.fixture
+def broken_engine(monkeypatch):
+    engine = RuleEngine(config=CONFIG, workers=2, instrument=True)
+    executor = BrokenExecutor()
+    monkeypatch.setattr(engine, '_executor', executor)
+    yield engine, executor
+    engine.close()
+
+
+def test_run_rules_batch_falls_back_when_workers_fail(broken_engine, expected, capsys):
+    engine, executor = broken_engine
+    assert result_tuples(engine.run_rules_batch(issues(), CONTEXT)) == expected
+    assert '[WARNING] Rule worker processes failed' in capsys.readouterr().out
+    assert engine.workers == 0
+    assert executor.shut_down
+    # Only the in-process run is counted
+    assert all(stats['calls'] == len(issues()) for stats in engine.get_rule_stats().values())
+
+
+def test_submit_rules_batch_falls_back_when_workers_fail(broken_engine, expected, capsys):
+    engine, executor = broken_engine
+
+    async def submit():
+        return await engine.submit_rules_batch(issues(), CONTEXT)
+
+    assert result_tuples(asyncio.run(submit())) == expected
+    assert '[WARNING] Rule worker processes failed' in capsys.readouterr().out
+    assert engine.workers == 0
+    assert executor.shut_down
+
+
+def test_customized_rules_run_in_process():
+    engine = RuleEngine(config=CONFIG, workers=2)
+    engine.remove_rule(engine.rules[0].rule_id)
+    assert engine._get_worker_chunks(issues()) is None
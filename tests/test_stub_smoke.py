@@ -0,0 +1,41 @@
+"""End-to-end smoke test: check_issues.py against the local JIRA stub"""
+
+import asyncio
+
+import pytest
+
+import check_issues
+from conftest import REPO_ROOT
+from jira_session import configure_session_manager
+from jira_stub import JiraStub, create_stub_server, serve_in_background, stub_base_url, write_stub_cookies
+
+
+@pytest.fixture
+def stub_server(tmp_path, monkeypatch):
+    # The stub and the checker read data/ relative to the working directory
+    monkeypatch.chdir(REPO_ROOT)
+    cookie_file = str(tmp_path / 'jira_stub_cookies.json')
+    write_stub_cookies(cookie_file)
+    configure_session_manager(cookie_file=cookie_file, validation_cache_file='')
+
+    server = create_stub_server(JiraStub(issues=50), port=0)
+    serve_in_background(server)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_check_issues_against_stub(stub_server, tmp_path, capsys):
+    events_path = tmp_path / 'report.jsonl'
+    metrics_path = tmp_path / 'jira_metrics.json'
+
+    asyncio.run(check_issues.main(base_url=stub_base_url(stub_server), events_path=str(events_path),
+                                  metrics_path=str(metrics_path)))
+
+    output = capsys.readouterr().out
+    assert '[AUTH] Authenticated as: JIRA Stub User' in output
+    assert '[RESULTS] Found' in output
+    assert '[SUCCESS] Multi-issue type data quality check completed successfully!' in output
+    assert 'never throttled' in output
+    assert events_path.stat().st_size > 0
+    assert metrics_path.stat().st_size > 0